@@ -4,16 +4,27 @@ from __future__ import annotations
 import voluptuous as vol
 
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.event import async_track_time_change
 
-from .const import DOMAIN
-from .coordinator import GonzalesConfigEntry, GonzalesCoordinator
+from .const import CONF_PUSH_UPDATES, DEFAULT_PUSH_UPDATES, DOMAIN
+from .coordinator import GonzalesConfigEntry, GonzalesCoordinator, snapshot_store
+from .degradation import degradation_store
+from .history import history_store
+from .profile import profile_store
 
 PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.BINARY_SENSOR, Platform.BUTTON]
 
 SERVICE_RUN_SPEEDTEST = "run_speedtest"
 SERVICE_SET_INTERVAL = "set_interval"
+SERVICE_IMPORT_HISTORY = "import_history"
+SERVICE_GET_PROFILE = "get_profile"
 ATTR_ENTRY_ID = "entry_id"
 ATTR_INTERVAL = "interval"
 
@@ -24,9 +35,33 @@ async def async_setup_entry(
 ) -> bool:
     """Set up Gonzales from a config entry."""
     coordinator = GonzalesCoordinator(hass, entry)
-    await coordinator.async_config_entry_first_refresh()
+    # With a saved snapshot the entities start from it. Otherwise only
+    # status and latest measurement gate setup; the remaining sections
+    # are fetched in the background once the platforms are loaded.
+    try:
+        await coordinator.async_restore_learned()
+        if not await coordinator.async_restore_snapshot():
+            await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        await coordinator.async_close()
+        raise
     entry.runtime_data = coordinator
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    coordinator.async_platforms_ready()
+    # Fill long-term statistics with tests the recorder has not seen yet,
+    # the rolling statistics with the last week and the hour-of-week
+    # profile with the tests since its newest one, in a single pass
+    entry.async_create_background_task(
+        hass, coordinator.async_load_history(), f"{DOMAIN} history import"
+    )
+    # Every minute, including local midnight: results leave the rolling
+    # windows and today's statistics restart even when no test arrives
+    entry.async_on_unload(
+        async_track_time_change(hass, coordinator.async_expire_rolling, second=0)
+    )
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+    if entry.options.get(CONF_PUSH_UPDATES, DEFAULT_PUSH_UPDATES):
+        coordinator.async_start_push()
 
     # Register services (only once, on first entry)
     if not hass.services.has_service(DOMAIN, SERVICE_RUN_SPEEDTEST):
@@ -93,20 +128,92 @@ async def async_setup_entry(
             }),
         )
 
+    if not hass.services.has_service(DOMAIN, SERVICE_IMPORT_HISTORY):
+        async def handle_import_history(call: ServiceCall) -> None:
+            """Handle the import_history service call."""
+            entry_id = call.data.get(ATTR_ENTRY_ID)
+
+            for config_entry in hass.config_entries.async_entries(DOMAIN):
+                if entry_id and config_entry.entry_id != entry_id:
+                    continue
+                coord: GonzalesCoordinator = config_entry.runtime_data
+                await coord.history.async_run()
+
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_IMPORT_HISTORY,
+            handle_import_history,
+            schema=vol.Schema({
+                vol.Optional(ATTR_ENTRY_ID): cv.string,
+            }),
+        )
+
+    if not hass.services.has_service(DOMAIN, SERVICE_GET_PROFILE):
+        async def handle_get_profile(call: ServiceCall) -> ServiceResponse:
+            """Handle the get_profile service call."""
+            entry_id = call.data.get(ATTR_ENTRY_ID)
+            profiles = []
+
+            for config_entry in hass.config_entries.async_entries(DOMAIN):
+                if entry_id and config_entry.entry_id != entry_id:
+                    continue
+                coord: GonzalesCoordinator = config_entry.runtime_data
+                profiles.append({
+                    "entry_id": config_entry.entry_id,
+                    "title": config_entry.title,
+                    "buckets": coord.profile.as_list(),
+                })
+            return {"profiles": profiles}
+
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_GET_PROFILE,
+            handle_get_profile,
+            schema=vol.Schema({
+                vol.Optional(ATTR_ENTRY_ID): cv.string,
+            }),
+            supports_response=SupportsResponse.ONLY,
+        )
+
     return True
 
 
+async def async_reload_entry(
+    hass: HomeAssistant,
+    entry: GonzalesConfigEntry,
+) -> None:
+    """Reload a config entry when its options change."""
+    if entry.options == entry.runtime_data.entry_options:
+        return
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(
     hass: HomeAssistant,
     entry: GonzalesConfigEntry,
 ) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok:
+        await entry.runtime_data.async_close()
 
     # Unregister services if this is the last entry for the domain
     remaining = hass.config_entries.async_entries(DOMAIN)
     if not [e for e in remaining if e.entry_id != entry.entry_id]:
         hass.services.async_remove(DOMAIN, SERVICE_RUN_SPEEDTEST)
         hass.services.async_remove(DOMAIN, SERVICE_SET_INTERVAL)
+        hass.services.async_remove(DOMAIN, SERVICE_IMPORT_HISTORY)
+        hass.services.async_remove(DOMAIN, SERVICE_GET_PROFILE)
 
     return unload_ok
+
+
+async def async_remove_entry(
+    hass: HomeAssistant,
+    entry: GonzalesConfigEntry,
+) -> None:
+    """Remove the saved snapshot, import checkpoint and learned state."""
+    await snapshot_store(hass, entry.entry_id).async_remove()
+    await history_store(hass, entry.entry_id).async_remove()
+    await degradation_store(hass, entry.entry_id).async_remove()
+    await profile_store(hass, entry.entry_id).async_remove()
@@ -8,14 +8,11 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
     BinarySensorEntityDescription,
 )
-from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
 from .coordinator import GonzalesConfigEntry, GonzalesCoordinator
+from .entity import GonzalesEntity
 
 
 BINARY_SENSOR_DESCRIPTION = BinarySensorEntityDescription(
@@ -25,6 +22,12 @@ BINARY_SENSOR_DESCRIPTION = BinarySensorEntityDescription(
     entity_category=None,  # Main sensor, not diagnostic
 )
 
+DEGRADATION_DESCRIPTION = BinarySensorEntityDescription(
+    key="degradation_detected",
+    translation_key="degradation_detected",
+    device_class=BinarySensorDeviceClass.PROBLEM,
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -33,10 +36,12 @@ async def async_setup_entry(
 ) -> None:
     """Set up Gonzales binary sensors from a config entry."""
     coordinator = entry.runtime_data
-    async_add_entities([GonzalesOutageSensor(coordinator)])
+    async_add_entities(
+        [GonzalesOutageSensor(coordinator), GonzalesDegradationSensor(coordinator)]
+    )
 
 
-class GonzalesOutageSensor(CoordinatorEntity[GonzalesCoordinator], BinarySensorEntity):
+class GonzalesOutageSensor(GonzalesEntity, BinarySensorEntity):
     """Binary sensor for internet outage detection.
 
     ON = Outage active (problem detected)
@@ -44,46 +49,71 @@ class GonzalesOutageSensor(CoordinatorEntity[GonzalesCoordinator], BinarySensorE
     """
 
     entity_description = BINARY_SENSOR_DESCRIPTION
-    _attr_has_entity_name = True
+    _unrecorded_attributes = GonzalesEntity._unrecorded_attributes | frozenset(
+        {"last_failure_message"}
+    )
+    _sections = ("status",)
 
     def __init__(self, coordinator: GonzalesCoordinator) -> None:
         """Initialize the binary sensor."""
         super().__init__(coordinator)
         self._attr_unique_id = f"{coordinator.config_entry.entry_id}_internet_outage"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, coordinator.config_entry.entry_id)},
-            name="Gonzales",
-            manufacturer="Gonzales",
-            model="Internet Speed Monitor",
-            entry_type=DeviceEntryType.SERVICE,
-        )
 
     @property
     def is_on(self) -> bool | None:
         """Return True if outage is active (problem detected)."""
-        if self.coordinator.data is None:
-            return None
-        status = self.coordinator.data.get("status")
-        if status is None:
-            return None
-        outage = status.get("outage")
-        if outage is None:
-            return False
-        return outage.get("outage_active", False)
+        return self.coordinator.snapshot.status.outage_active
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
+    def _section_attributes(self) -> dict[str, Any] | None:
         """Return additional state attributes for the outage sensor."""
-        if self.coordinator.data is None:
+        status = self.coordinator.snapshot.status
+        if not status.has_outage:
             return None
-        status = self.coordinator.data.get("status")
-        if status is None:
-            return None
-        outage = status.get("outage")
-        if outage is None:
+        return {
+            "consecutive_failures": status.outage_consecutive_failures,
+            "outage_started_at": status.outage_started_at,
+            "last_failure_message": status.outage_last_failure_message,
+        }
+
+
+class GonzalesDegradationSensor(GonzalesEntity, BinarySensorEntity):
+    """Binary sensor for a sustained rise of latency, jitter or packet loss.
+
+    ON = A metric shifted above its learned baseline
+    OFF = All metrics at their baseline
+    Unknown until enough tests have formed the baselines.
+    """
+
+    entity_description = DEGRADATION_DESCRIPTION
+    _unrecorded_attributes = GonzalesEntity._unrecorded_attributes | frozenset(
+        {"shift", "baseline"}
+    )
+    _sections = ("measurement",)
+
+    def __init__(self, coordinator: GonzalesCoordinator) -> None:
+        """Initialize the binary sensor."""
+        super().__init__(coordinator)
+        self._attr_unique_id = (
+            f"{coordinator.config_entry.entry_id}_degradation_detected"
+        )
+
+    @property
+    def is_on(self) -> bool | None:
+        """Return True if a metric degraded."""
+        return self.coordinator.snapshot.degradation.detected
+
+    @property
+    def _section_attributes(self) -> dict[str, Any] | None:
+        """Return the degraded metric, its shift and the onset time."""
+        degradation = self.coordinator.snapshot.degradation
+        if not degradation.detected:
             return None
         return {
-            "consecutive_failures": outage.get("consecutive_failures", 0),
-            "outage_started_at": outage.get("outage_started_at"),
-            "last_failure_message": outage.get("last_failure_message", ""),
+            "metric": degradation.metric,
+            "shift": degradation.shift,
+            "baseline": degradation.baseline,
+            "onset": (
+                degradation.onset.isoformat() if degradation.onset else None
+            ),
         }
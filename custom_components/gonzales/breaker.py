@@ -0,0 +1,84 @@
+"""Circuit breaker for requests to the Gonzales backend."""
+from __future__ import annotations
+
+import random
+from typing import Any
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+# Consecutive failed cycles before the breaker opens
+FAILURE_THRESHOLD = 3
+
+# Open period (seconds), doubled after every failed probe
+BACKOFF_MIN = 30
+BACKOFF_MAX = 1800
+
+
+class CircuitBreaker:
+    """Track backend failures and decide when to stop requesting.
+
+    Closed: every cycle runs. After FAILURE_THRESHOLD failed cycles the
+    breaker opens and cycles fail fast without a request. Once the open
+    period has passed it is half-open: a single probe decides whether it
+    closes again or reopens with a longer, jittered period.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the breaker."""
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self.trips = 0
+        self.backoff = 0.0
+        self.retry_at: float | None = None
+        self._next_backoff = BACKOFF_MIN
+
+    def begin(self, now: float, tolerance: float = 0) -> str:
+        """Return the state a cycle starting now runs in."""
+        if (
+            self.state == STATE_OPEN
+            and self.retry_at is not None
+            and now >= self.retry_at - tolerance
+        ):
+            self.state = STATE_HALF_OPEN
+        return self.state
+
+    def record_success(self) -> bool:
+        """Close the breaker. Return whether its state changed."""
+        changed = self.state != STATE_CLOSED
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self.backoff = 0.0
+        self.retry_at = None
+        self._next_backoff = BACKOFF_MIN
+        return changed
+
+    def record_failure(self, now: float) -> bool:
+        """Count a failed cycle. Return whether the breaker (re)opened."""
+        self.failures += 1
+        if self.state == STATE_CLOSED and self.failures < FAILURE_THRESHOLD:
+            return False
+        self.state = STATE_OPEN
+        self.trips += 1
+        self.backoff = self._next_backoff * random.uniform(0.8, 1.2)
+        self.retry_at = now + self.backoff
+        self._next_backoff = min(self._next_backoff * 2, BACKOFF_MAX)
+        return True
+
+    def retry_in(self, now: float) -> float | None:
+        """Return the seconds until the next probe while open."""
+        if self.state != STATE_OPEN or self.retry_at is None:
+            return None
+        return max(self.retry_at - now, 0.0)
+
+    def as_dict(self, now: float) -> dict[str, Any]:
+        """Return the breaker state for diagnostics."""
+        retry_in = self.retry_in(now)
+        return {
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            "trips": self.trips,
+            "backoff_seconds": round(self.backoff, 1),
+            "retry_in_seconds": round(retry_in, 1) if retry_in is not None else None,
+        }
@@ -3,12 +3,10 @@ from __future__ import annotations
 
 from homeassistant.components.button import ButtonEntity
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .coordinator import GonzalesConfigEntry, GonzalesCoordinator
-from .const import DOMAIN
+from .entity import GonzalesEntity
 
 
 async def async_setup_entry(
@@ -21,10 +19,9 @@ async def async_setup_entry(
     async_add_entities([GonzalesSpeedTestButton(coordinator, entry)])
 
 
-class GonzalesSpeedTestButton(CoordinatorEntity[GonzalesCoordinator], ButtonEntity):
+class GonzalesSpeedTestButton(GonzalesEntity, ButtonEntity):
     """Button to trigger a speed test."""
 
-    _attr_has_entity_name = True
     _attr_icon = "mdi:speedometer"
     translation_key = "run_speed_test"
 
@@ -36,13 +33,6 @@ class GonzalesSpeedTestButton(CoordinatorEntity[GonzalesCoordinator], ButtonEnti
         """Initialize the button."""
         super().__init__(coordinator)
         self._attr_unique_id = f"{entry.entry_id}_run_speedtest"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name="Gonzales",
-            manufacturer="Gonzales",
-            model="Internet Speed Monitor",
-            entry_type=DeviceEntryType.SERVICE,
-        )
 
     async def async_press(self) -> None:
         """Handle the button press."""
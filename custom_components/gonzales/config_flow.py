@@ -8,16 +8,36 @@ from typing import Any
 import aiohttp
 import voluptuous as vol
 
-from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
+from homeassistant.config_entries import (
+    ConfigEntry,
+    ConfigFlow,
+    ConfigFlowResult,
+    OptionsFlow,
+)
 
 try:
     from homeassistant.helpers.service_info.hassio import HassioServiceInfo
 except ImportError:
     from homeassistant.components.hassio import HassioServiceInfo
 from homeassistant.const import CONF_HOST, CONF_PORT, CONF_SCAN_INTERVAL
+from homeassistant.core import callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .const import CONF_API_KEY, DEFAULT_HOST, DEFAULT_PORT, DEFAULT_SCAN_INTERVAL, DOMAIN
+from .const import (
+    CONF_API_KEY,
+    CONF_MEASUREMENT_INTERVAL,
+    CONF_PUSH_UPDATES,
+    CONF_ROOT_CAUSE_INTERVAL,
+    CONF_SMART_SCHEDULER_INTERVAL,
+    CONF_STATISTICS_INTERVAL,
+    CONF_STATUS_INTERVAL,
+    DEFAULT_HOST,
+    DEFAULT_PORT,
+    DEFAULT_PUSH_UPDATES,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+)
+from .coordinator import endpoint_intervals
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -44,6 +64,12 @@ class GonzalesConfigFlow(ConfigFlow, domain=DOMAIN):
     _discovered_port: int = DEFAULT_PORT
     _discovered_api_key: str = ""
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> GonzalesOptionsFlow:
+        """Get the options flow for this handler."""
+        return GonzalesOptionsFlow()
+
     async def async_step_hassio(
         self, discovery_info: HassioServiceInfo
     ) -> ConfigFlowResult:
@@ -323,3 +349,50 @@ class GonzalesConfigFlow(ConfigFlow, domain=DOMAIN):
                 return False
         except (aiohttp.ClientError, TimeoutError):
             return False
+
+
+class GonzalesOptionsFlow(OptionsFlow):
+    """Handle Gonzales options (per-endpoint refresh cadences)."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage the refresh intervals."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        intervals = endpoint_intervals(self.config_entry)
+        light = vol.All(vol.Coerce(int), vol.Range(min=10, max=3600))
+        heavy = vol.All(vol.Coerce(int), vol.Range(min=60, max=86400))
+        schema = vol.Schema(
+            {
+                vol.Required(
+                    CONF_STATUS_INTERVAL,
+                    default=intervals[CONF_STATUS_INTERVAL],
+                ): light,
+                vol.Required(
+                    CONF_MEASUREMENT_INTERVAL,
+                    default=intervals[CONF_MEASUREMENT_INTERVAL],
+                ): light,
+                vol.Required(
+                    CONF_STATISTICS_INTERVAL,
+                    default=intervals[CONF_STATISTICS_INTERVAL],
+                ): heavy,
+                vol.Required(
+                    CONF_SMART_SCHEDULER_INTERVAL,
+                    default=intervals[CONF_SMART_SCHEDULER_INTERVAL],
+                ): heavy,
+                vol.Required(
+                    CONF_ROOT_CAUSE_INTERVAL,
+                    default=intervals[CONF_ROOT_CAUSE_INTERVAL],
+                ): heavy,
+                vol.Required(
+                    CONF_PUSH_UPDATES,
+                    default=self.config_entry.options.get(
+                        CONF_PUSH_UPDATES, DEFAULT_PUSH_UPDATES
+                    ),
+                ): bool,
+            }
+        )
+
+        return self.async_show_form(step_id="init", data_schema=schema)
@@ -3,11 +3,29 @@
 DOMAIN = "gonzales"
 
 CONF_API_KEY = "api_key"
+# Backend version and supported optional endpoints, cached in entry data
+CONF_CAPABILITIES = "capabilities"
+
+# Per-endpoint refresh cadences (options flow, seconds)
+CONF_STATUS_INTERVAL = "status_interval"
+CONF_MEASUREMENT_INTERVAL = "measurement_interval"
+CONF_STATISTICS_INTERVAL = "statistics_interval"
+CONF_SMART_SCHEDULER_INTERVAL = "smart_scheduler_interval"
+CONF_ROOT_CAUSE_INTERVAL = "root_cause_interval"
+CONF_PUSH_UPDATES = "push_updates"
 
 DEFAULT_HOST = "local-gonzales"
 DEFAULT_PORT = 8099
 DEFAULT_SCAN_INTERVAL = 60
 
+DEFAULT_STATUS_INTERVAL = 30
+# Analytical endpoints are refetched on every new measurement; these are
+# only safety TTLs for changes the measurement key cannot see.
+DEFAULT_STATISTICS_INTERVAL = 3600
+DEFAULT_SMART_SCHEDULER_INTERVAL = 3600
+DEFAULT_ROOT_CAUSE_INTERVAL = 3600
+DEFAULT_PUSH_UPDATES = False
+
 ATTR_DOWNLOAD_SPEED = "download_mbps"
 ATTR_UPLOAD_SPEED = "upload_mbps"
 ATTR_PING_LATENCY = "ping_latency_ms"
@@ -1,28 +1,395 @@
 """DataUpdateCoordinator for Gonzales."""
 from __future__ import annotations
 
-from datetime import timedelta
+import asyncio
+from collections import deque
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, replace
+from datetime import datetime, timedelta
+import json
 import logging
+import time
 from typing import Any, TypeAlias
 
 import aiohttp
+from aiohttp import hdrs
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_PORT, CONF_SCAN_INTERVAL
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
 )
+from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
 
-from .const import CONF_API_KEY, DEFAULT_SCAN_INTERVAL, DOMAIN
+from .breaker import (
+    FAILURE_THRESHOLD,
+    STATE_HALF_OPEN,
+    STATE_OPEN,
+    CircuitBreaker,
+)
+from .const import (
+    CONF_API_KEY,
+    CONF_CAPABILITIES,
+    CONF_MEASUREMENT_INTERVAL,
+    CONF_ROOT_CAUSE_INTERVAL,
+    CONF_SMART_SCHEDULER_INTERVAL,
+    CONF_STATISTICS_INTERVAL,
+    CONF_STATUS_INTERVAL,
+    DEFAULT_ROOT_CAUSE_INTERVAL,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_SMART_SCHEDULER_INTERVAL,
+    DEFAULT_STATISTICS_INTERVAL,
+    DEFAULT_STATUS_INTERVAL,
+    DOMAIN,
+)
+from .degradation import DegradationDetector
+from .history import GonzalesHistoryImport, HistoryReader, measurement_time
+from .model import GonzalesSnapshot
+from .profile import HourOfWeekProfile
+from .projection import COUNT, FieldSpec, project
+from .push import GonzalesEventStream
+from .rolling import WINDOWS, RollingStats
+from .session import GonzalesSession
 
 _LOGGER = logging.getLogger(__name__)
 
+# Sections needed regardless of entities: they drive measurement detection,
+# speed test tracking and the capability probe
+ALWAYS_NEEDED = frozenset({"measurement", "status"})
+
+# Flags in changed_sections for what is kept locally: the rolling statistics
+# also change as results expire, the profile as the history is loaded, so
+# the measurement entities need not be written then
+ROLLING_SECTION = "rolling"
+PROFILE_SECTION = "profile"
+
+# Each cycle may use this fraction of the tick, within bounds (seconds);
+# low-priority requests are not started with less than MIN_REQUEST_BUDGET left
+CYCLE_BUDGET_FRACTION = 0.8
+MIN_CYCLE_BUDGET = 10
+MAX_CYCLE_BUDGET = 60
+MIN_REQUEST_BUDGET = 1
+CYCLE_HISTORY = 100
+
+# Last good snapshot, restored at startup while the first refresh runs
+STORAGE_VERSION = 1
+SNAPSHOT_SAVE_DELAY = 60
+SNAPSHOT_MAX_AGE = timedelta(days=1)
+
+# A section may serve its last good value for this many refresh intervals
+# at least, however short its own max_staleness
+STALE_INTERVALS = 2
+
+# Endpoint error recorded when the backend does not provide an endpoint
+ERROR_NOT_FOUND = "HTTP 404"
+
+# Scheduler ticks are aligned to whole seconds, so an endpoint that becomes
+# due slightly after the tick would otherwise wait for a whole extra tick.
+DUE_TOLERANCE = 1.0
+
 GonzalesConfigEntry: TypeAlias = ConfigEntry
 
 
+@dataclass(frozen=True, kw_only=True)
+class GonzalesEndpoint:
+    """Describe a Gonzales API endpoint polled by the coordinator."""
+
+    key: str
+    path: str
+    timeout: float
+    interval_option: str
+    default_interval: int
+    # Seconds the last good value is still shown after fetches start
+    # failing; never less than STALE_INTERVALS refresh intervals
+    max_staleness: int
+    # Negotiate gzip/deflate explicitly for the large analytical payloads
+    compress: bool = False
+    # Not every backend version provides the endpoint (capability probe)
+    optional: bool = False
+    # Cancelled first when the cycle budget runs out
+    low_priority: bool = False
+    # Derived payloads only change when a new measurement is recorded; they
+    # are refetched when the measurement key changes, and otherwise only
+    # once their interval (a safety TTL) has elapsed.
+    derived: bool = False
+    extract: Callable[[Any], Any] | None = None
+    # Fields kept from the (extracted) payload
+    fields: FieldSpec | None = None
+
+    def parse(self, value: Any) -> Any:
+        """Reduce a response body to the section value."""
+        if value is None:
+            return None
+        if self.extract is not None:
+            value = self.extract(value)
+        return project(value, self.fields)
+
+
+@dataclass(slots=True)
+class CachedResponse:
+    """Last payload of an endpoint together with its HTTP validators."""
+
+    value: Any
+    etag: str | None
+    last_modified: str | None
+
+
+@dataclass(slots=True)
+class CacheStats:
+    """Conditional request counters for an endpoint."""
+
+    requests: int = 0
+    not_modified: int = 0
+
+
+@dataclass(slots=True)
+class SnapshotStats:
+    """Counters of the aggregated snapshot endpoint."""
+
+    requests: int = 0
+    failures: int = 0
+    # Sections the snapshot left out, fetched from their own endpoint
+    sections_missing: int = 0
+    last_error: str | None = None
+
+
+def _extract_isp_score(stats: dict[str, Any]) -> dict[str, Any] | None:
+    """Extract the ISP score from the enhanced statistics."""
+    return stats.get("isp_score") or None
+
+
+# Seconds a recomputed backend start time may drift before it is taken as
+# a restart: uptime and request latency never line up exactly
+STARTED_AT_TOLERANCE = 60
+
+
+def _with_started_at(
+    status: dict[str, Any], previous: dict[str, Any] | None, now: datetime
+) -> dict[str, Any]:
+    """Replace the ticking uptime of a status with the backend start time.
+
+    A previous start time within STARTED_AT_TOLERANCE is kept, so the
+    section no longer changes on every poll, only when the backend restarted.
+    """
+    if (uptime := status.get("uptime_seconds")) is None:
+        return status
+    status = {key: value for key, value in status.items() if key != "uptime_seconds"}
+    started_at = now - timedelta(seconds=uptime)
+    known = None
+    if previous and previous.get("started_at"):
+        known = dt_util.parse_datetime(previous["started_at"])
+    if (
+        known is not None
+        and abs((started_at - known).total_seconds()) <= STARTED_AT_TOLERANCE
+    ):
+        status["started_at"] = previous["started_at"]
+    else:
+        status["started_at"] = started_at.isoformat(timespec="seconds")
+    return status
+
+
+# Fields read by the sensors, the outage binary sensor, the coordinator
+# itself (measurement key, version, features) and the diagnostics. Lists
+# the entities only count are reduced to their length.
+MEASUREMENT_FIELDS: FieldSpec = {
+    "id": None,
+    "timestamp": None,
+    "download_mbps": None,
+    "upload_mbps": None,
+    "ping_latency_ms": None,
+    "ping_jitter_ms": None,
+    "packet_loss_pct": None,
+    "server_name": None,
+    "isp": None,
+}
+STATUS_FIELDS: FieldSpec = {
+    "version": None,
+    "features": None,
+    "uptime_seconds": None,
+    "started_at": None,
+    "total_measurements": None,
+    "last_test_time": None,
+    "db_size_bytes": None,
+    "scheduler": {"running": None, "test_in_progress": None},
+    "outage": {
+        "outage_active": None,
+        "consecutive_failures": None,
+        "outage_started_at": None,
+        "last_failure_message": None,
+    },
+}
+ISP_SCORE_FIELDS: FieldSpec = {
+    "composite": None,
+    "grade": None,
+    "breakdown": {
+        "speed_score": None,
+        "reliability_score": None,
+        "latency_score": None,
+        "consistency_score": None,
+    },
+}
+SMART_SCHEDULER_FIELDS: FieldSpec = {
+    "enabled": None,
+    "phase": None,
+    "stability_score": None,
+    "current_interval_minutes": None,
+    "data_budget_remaining_pct": None,
+    "base_interval_minutes": None,
+    "last_decision_reason": None,
+}
+ROOT_CAUSE_FIELDS: FieldSpec = {
+    "network_health_score": None,
+    "primary_cause": {
+        "category": None,
+        "severity": None,
+        "confidence": None,
+        "description": None,
+        "occurrence_count": None,
+    },
+    "secondary_causes": COUNT,
+    "recommendations": COUNT,
+    "layer_scores": {
+        "dns_score": None,
+        "local_network_score": None,
+        "isp_backbone_score": None,
+        "isp_lastmile_score": None,
+    },
+}
+
+ENDPOINTS: tuple[GonzalesEndpoint, ...] = (
+    GonzalesEndpoint(
+        key="measurement",
+        path="/measurements/latest",
+        timeout=15,
+        interval_option=CONF_MEASUREMENT_INTERVAL,
+        default_interval=DEFAULT_SCAN_INTERVAL,
+        max_staleness=7200,
+        fields=MEASUREMENT_FIELDS,
+    ),
+    GonzalesEndpoint(
+        key="status",
+        path="/status",
+        timeout=10,
+        interval_option=CONF_STATUS_INTERVAL,
+        default_interval=DEFAULT_STATUS_INTERVAL,
+        max_staleness=900,
+        fields=STATUS_FIELDS,
+    ),
+    GonzalesEndpoint(
+        key="isp_score",
+        path="/statistics/enhanced",
+        timeout=20,
+        interval_option=CONF_STATISTICS_INTERVAL,
+        default_interval=DEFAULT_STATISTICS_INTERVAL,
+        max_staleness=86400,
+        derived=True,
+        compress=True,
+        optional=True,
+        low_priority=True,
+        extract=_extract_isp_score,
+        fields=ISP_SCORE_FIELDS,
+    ),
+    # Smart Scheduler and Root-Cause analysis (v3.7.0+)
+    GonzalesEndpoint(
+        key="smart_scheduler",
+        path="/smart-scheduler/status",
+        timeout=10,
+        interval_option=CONF_SMART_SCHEDULER_INTERVAL,
+        default_interval=DEFAULT_SMART_SCHEDULER_INTERVAL,
+        max_staleness=7200,
+        derived=True,
+        optional=True,
+        fields=SMART_SCHEDULER_FIELDS,
+    ),
+    GonzalesEndpoint(
+        key="root_cause",
+        path="/root-cause/analysis?days=7",
+        timeout=30,
+        interval_option=CONF_ROOT_CAUSE_INTERVAL,
+        default_interval=DEFAULT_ROOT_CAUSE_INTERVAL,
+        max_staleness=86400,
+        derived=True,
+        compress=True,
+        optional=True,
+        low_priority=True,
+        fields=ROOT_CAUSE_FIELDS,
+    ),
+)
+
+
+ENDPOINTS_BY_KEY = {endpoint.key: endpoint for endpoint in ENDPOINTS}
+
+# Aggregated endpoint serving several sections in one response, used when
+# /status lists the feature (see _async_fetch_snapshot for the contract)
+SNAPSHOT_PATH = "/snapshot"
+SNAPSHOT_FEATURE = "snapshot"
+
+# Sections the event stream delivers, and the safety poll interval used for
+# them while it is connected (seconds)
+PUSH_SECTIONS = frozenset({"measurement", "status"})
+PUSH_POLL_INTERVAL = 900
+
+# Adaptive polling of /status while a speed test runs (seconds): the tick,
+# how long to wait for a triggered test to show up, and an upper bound
+FAST_POLL_INTERVAL = 3
+FAST_POLL_START_GRACE = 30
+FAST_POLL_MAX_DURATION = 300
+
+
+def _fingerprint(value: Any) -> int:
+    """Return a structural hash of a JSON payload."""
+    return hash(json.dumps(value, sort_keys=True, separators=(",", ":")))
+
+
+def test_in_progress(data: dict[str, Any]) -> bool:
+    """Return True if the backend reports a running speed test."""
+    scheduler = (data.get("status") or {}).get("scheduler") or {}
+    return bool(scheduler.get("test_in_progress"))
+
+
+def measurement_key(data: dict[str, Any]) -> tuple[Any, ...]:
+    """Return the identity of the latest measurement in a snapshot.
+
+    Combines the measurement id with the status counters so a new speed
+    test is noticed by whichever of the two light endpoints sees it first.
+    """
+    measurement = data.get("measurement") or {}
+    status = data.get("status") or {}
+    return (
+        measurement.get("id"),
+        status.get("last_test_time"),
+        status.get("total_measurements"),
+    )
+
+
+def snapshot_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Return the store holding the last snapshot of a config entry."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.snapshot")
+
+
+def endpoint_intervals(config_entry: ConfigEntry) -> dict[str, int]:
+    """Return the configured refresh interval (seconds) per endpoint option.
+
+    The measurement cadence defaults to the scan interval chosen during
+    setup, so existing entries keep their polling behaviour.
+    """
+    defaults = {
+        endpoint.interval_option: endpoint.default_interval
+        for endpoint in ENDPOINTS
+    }
+    defaults[CONF_MEASUREMENT_INTERVAL] = config_entry.data.get(
+        CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
+    )
+    return {
+        option: int(config_entry.options.get(option, default))
+        for option, default in defaults.items()
+    }
+
+
 class GonzalesCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Coordinator to fetch data from the Gonzales API."""
 
@@ -41,108 +408,1033 @@ class GonzalesCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._headers: dict[str, str] = {}
         if api_key:
             self._headers["X-API-Key"] = api_key
-        scan_interval = config_entry.data.get(
-            CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
+        # Own connection pool, closed when the entry unloads
+        self.client = GonzalesSession(hass, self._host)
+        self.history = GonzalesHistoryImport(
+            hass, config_entry.entry_id, self.client, self._base_url, self._headers
+        )
+        self.endpoint_errors: dict[str, str | None] = {
+            endpoint.key: None for endpoint in ENDPOINTS
+        }
+        # Options the coordinator was built with; data-only entry updates
+        # (cached capabilities) must not trigger a reload
+        self.entry_options = dict(config_entry.options)
+        intervals = endpoint_intervals(config_entry)
+        self.intervals: dict[str, int] = {
+            endpoint.key: intervals[endpoint.interval_option]
+            for endpoint in ENDPOINTS
+        }
+        # Monotonic time at which each endpoint is due again; missing = now
+        self._next_due: dict[str, float] = {}
+        self._measurement_key: tuple[Any, ...] | None = None
+        self._response_cache: dict[str, CachedResponse] = {}
+        self._cache_stats: dict[str, CacheStats] = {}
+        self._fingerprints: dict[str, int] = {}
+        # Sections whose content changed in the last published snapshot
+        self.changed_sections: frozenset[str] = frozenset()
+        # Typed view of the published data, rebuilt for changed sections
+        self.snapshot = GonzalesSnapshot()
+        # Recent results of the measurement stream, for rolling statistics
+        self.rolling = RollingStats()
+        # Change-point detection on latency, jitter and packet loss
+        self.degradation = DegradationDetector(hass, config_entry.entry_id)
+        # Expected results per hour of the week
+        self.profile = HourOfWeekProfile(hass, config_entry.entry_id)
+        self._push: GonzalesEventStream | None = None
+        self._fast_poll_started: float | None = None
+        self._fast_poll_seen_running = False
+        # Capabilities are probed once per backend version and cached in the
+        # config entry; None while a probe is running.
+        self.capabilities: dict[str, Any] | None = config_entry.data.get(
+            CONF_CAPABILITIES
         )
+        self._probe_results: dict[str, bool] = {}
+        self._platforms_ready = False
+        self._cycle_deadline = 0.0
+        self._cycle_exhausted = False
+        self._cycle_durations: deque[float] = deque(maxlen=CYCLE_HISTORY)
+        self.cycle_overruns = 0
+        # Sections whose last fetch was dropped because the budget ran out
+        self.stale_sections: set[str] = set()
+        self.breaker = CircuitBreaker()
+        self._store = snapshot_store(hass, config_entry.entry_id)
+        self._save_pending = False
+        # Save time of the restored snapshot, until the first live refresh
+        self.restored_at: datetime | None = None
+        # Wall-clock time of each section's last good fetch
+        self.fetched_at: dict[str, datetime] = {}
+        self._notified_stale: frozenset[str] = frozenset()
+        self._snapshot_stats = SnapshotStats()
+        # Backend version that answered the snapshot endpoint with 404
+        self._snapshot_rejected: str | None = None
 
+        # The coordinator ticks at the fastest cadence; each tick only
+        # requests the endpoints that are due.
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
             config_entry=config_entry,
-            update_interval=timedelta(seconds=scan_interval),
+            update_interval=timedelta(seconds=min(self.intervals.values())),
+            always_update=False,
         )
 
     async def _async_update_data(self) -> dict[str, Any]:
+        """Fetch data from the Gonzales API, serving stale sections meanwhile.
+
+        Each section keeps its last good value when a fetch fails; entities
+        read its freshness from the coordinator and stay available until
+        the section is older than its staleness limit. The base coordinator
+        only notifies listeners on the first failed cycle, so every failed
+        cycle notifies them here, with no section changed.
+        """
+        try:
+            data = await self._async_guarded_update()
+        except UpdateFailed:
+            self.changed_sections = frozenset()
+            self._notified_stale = self._stale_sections()
+            self.async_update_listeners()
+            raise
+        if data is not self.data or self.restored_at is not None:
+            self._async_schedule_save()
+        self.restored_at = None
+        stale = self._stale_sections()
+        if stale != self._notified_stale:
+            # Freshness changed even if the data did not
+            self._notified_stale = stale
+            if data is self.data:
+                self.async_update_listeners()
+        return data
+
+    async def _async_guarded_update(self) -> dict[str, Any]:
+        """Run an update cycle behind the circuit breaker.
+
+        While the circuit breaker is open, cycles fail without a request.
+        Half-open, a single /status probe has to succeed before the full
+        fetch set runs again.
+        """
+        started = time.monotonic()
+        state = self.breaker.begin(started, DUE_TOLERANCE)
+        if state == STATE_OPEN:
+            raise UpdateFailed(
+                "Gonzales API unreachable, next attempt in "
+                f"{self.breaker.retry_in(started):.0f} s"
+            )
+        self._cycle_deadline = started + self._cycle_budget()
+        self._cycle_exhausted = False
+        try:
+            if state == STATE_HALF_OPEN:
+                await self._async_probe()
+            data = await self._async_fetch_cycle(started)
+        except UpdateFailed:
+            if self.breaker.record_failure(started):
+                self._async_breaker_opened()
+            raise
+        finally:
+            self._record_cycle(time.monotonic() - started)
+        if self.breaker.record_success():
+            _LOGGER.info("Gonzales API reachable again, resuming updates")
+            self.update_interval = self._tick_interval()
+        return data
+
+    async def _async_probe(self) -> None:
+        """Probe a half-open breaker with a single /status request."""
+        _, error = await self._async_fetch_endpoint(
+            self.client.session, ENDPOINTS_BY_KEY["status"]
+        )
+        if error is not None:
+            raise UpdateFailed(f"Gonzales API still unreachable: {error}")
+
+    @callback
+    def _async_breaker_opened(self) -> None:
+        """Slow the tick down to the open period and report the change."""
+        # Warn when the breaker trips; failed probes only log at debug
+        log = (
+            _LOGGER.warning
+            if self.breaker.failures == FAILURE_THRESHOLD
+            else _LOGGER.debug
+        )
+        log(
+            "Gonzales API unreachable after %s attempts, retrying in %.0f s",
+            self.breaker.failures,
+            self.breaker.backoff,
+        )
+        self.update_interval = self._tick_interval()
+
+    async def _async_fetch_cycle(self, now: float) -> dict[str, Any]:
         """Fetch data from the Gonzales API.
 
-        Polls three endpoints:
-        - /measurements/latest for current speed test data
-        - /status for system health and scheduler info
-        - /statistics/enhanced for ISP score
-        """
-        session = async_get_clientsession(self.hass)
-        data: dict[str, Any] = {
-            "measurement": None,
-            "status": None,
-            "isp_score": None,
-            "smart_scheduler": None,
-            "root_cause": None,
+        Only endpoints whose refresh interval has elapsed are requested,
+        concurrently. Each one fills its own section of the snapshot and
+        records its own error; sections that were not due, or whose fetch
+        failed, keep their last value.
+
+        The light endpoints are fetched first. When they reveal a new
+        measurement, the derived endpoints (ISP score, smart scheduler,
+        root cause) are invalidated and fetched in a second round.
+
+        While a speed test runs, cycles only poll /status on a short tick
+        until the test finishes.
+
+        Low-priority fetches still pending when the cycle budget runs out
+        are cancelled; their sections keep the last value and are marked
+        stale until a later cycle fetches them.
+
+        Sections pushed while the cycle runs win over the polled values.
+        """
+        base = self.data
+        data: dict[str, Any] = dict(base) if base else {
+            endpoint.key: None for endpoint in ENDPOINTS
+        }
+        session = self.client.session
+        fetched: set[str] = set()
+        if self._fast_poll_started is not None:
+            if not await self._async_fast_poll_finished(
+                session, data, now, self._fast_poll_started
+            ):
+                self._merge_pushed(data, base)
+                return self._fingerprint_sections(data)
+            fetched.add("status")
+
+        due = [
+            endpoint
+            for endpoint in ENDPOINTS
+            if not endpoint.derived and self._is_due(endpoint, now)
+        ]
+        await self._async_fetch_into(session, due, data, now)
+
+        if (
+            self._fast_poll_started is None
+            and not self.push_connected
+            and self.endpoint_errors["status"] is None
+            and test_in_progress(data)
+        ):
+            self._start_fast_poll(seen_running=True)
+
+        light = [endpoint.key for endpoint in due]
+        if light and all(self.endpoint_errors[key] for key in light):
+            raise UpdateFailed(
+                "No data received from Gonzales API: "
+                + ", ".join(f"{key}: {self.endpoint_errors[key]}" for key in light)
+            )
+        fetched.update(light)
+        if data["status"] is None and data["measurement"] is None:
+            raise UpdateFailed("No data received from Gonzales API")
+        self._async_check_version(data)
+
+        key = measurement_key(data)
+        if key != self._measurement_key and self._measurement_key is not None:
+            _LOGGER.debug("New Gonzales measurement detected: %s", key)
+            for endpoint in ENDPOINTS:
+                if endpoint.derived or endpoint.key not in fetched:
+                    self._next_due.pop(endpoint.key, None)
+
+        due = [
+            endpoint
+            for endpoint in ENDPOINTS
+            if endpoint.key not in fetched and self._is_due(endpoint, now)
+        ]
+        await self._async_fetch_into(session, due, data, now)
+        self._merge_pushed(data, base)
+        self._measurement_key = measurement_key(data)
+        self._async_record_probe(data)
+
+        return self._fingerprint_sections(data)
+
+    def _merge_pushed(
+        self, data: dict[str, Any], base: dict[str, Any] | None
+    ) -> None:
+        """Take over the sections pushed since the cycle copied base."""
+        if self.data is base or not self.data:
+            return
+        for key, value in self.data.items():
+            if base is None or value is not base.get(key):
+                data[key] = value
+                self.endpoint_errors[key] = None
+                self.stale_sections.discard(key)
+
+    async def async_restore_snapshot(self) -> bool:
+        """Load the last saved snapshot as the current data.
+
+        Returns False when there is none or it is too old to show.
+        """
+        stored = await self._store.async_load()
+        if not stored:
+            return False
+        saved_at = dt_util.parse_datetime(stored.get("saved_at") or "")
+        data = stored.get("data")
+        if (
+            saved_at is None
+            or not isinstance(data, dict)
+            or dt_util.utcnow() - saved_at > SNAPSHOT_MAX_AGE
+        ):
+            return False
+        data = {
+            endpoint.key: project(data.get(endpoint.key), endpoint.fields)
+            for endpoint in ENDPOINTS
+        }
+        fetched_at = stored.get("fetched_at") or {}
+        for key, value in data.items():
+            if value is not None:
+                self.fetched_at[key] = (
+                    dt_util.parse_datetime(fetched_at.get(key) or "") or saved_at
+                )
+        self.data = self._fingerprint_sections(data)
+        self._measurement_key = measurement_key(data)
+        self.restored_at = saved_at
+        _LOGGER.debug("Restored Gonzales snapshot saved at %s", saved_at)
+        return True
+
+    def section_age(self, key: str) -> float | None:
+        """Return the seconds since a section was last fetched."""
+        if (fetched_at := self.fetched_at.get(key)) is None:
+            return None
+        return (dt_util.utcnow() - fetched_at).total_seconds()
+
+    def max_staleness(self, key: str) -> int:
+        """Return how long a section's last good value may be shown."""
+        return max(
+            ENDPOINTS_BY_KEY[key].max_staleness,
+            STALE_INTERVALS * self._interval(key),
+        )
+
+    def section_stale(self, key: str) -> bool:
+        """Return True if a section shows restored data or its fetch failed."""
+        return self.restored_at is not None or (
+            key in self.fetched_at and self.endpoint_errors.get(key) is not None
+        )
+
+    def section_available(self, key: str) -> bool:
+        """Return True if a section's value is still fresh enough to show.
+
+        Sections never fetched follow the coordinator's last update.
+        """
+        if (age := self.section_age(key)) is None:
+            return self.last_update_success
+        return age <= self.max_staleness(key)
+
+    def _stale_sections(self) -> frozenset[str]:
+        """Return the sections currently served stale."""
+        return frozenset(key for key in ENDPOINTS_BY_KEY if self.section_stale(key))
+
+    def freshness_attributes(self, sections: tuple[str, ...]) -> dict[str, Any] | None:
+        """Return the stale marker and data age for stale sections."""
+        stale = [key for key in sections if self.section_stale(key)]
+        if not stale:
+            return None
+        ages = [age for key in stale if (age := self.section_age(key)) is not None]
+        return {
+            "stale": True,
+            "data_age_seconds": round(max(ages)) if ages else None,
+        }
+
+    def section_diagnostics(self) -> dict[str, Any]:
+        """Return section freshness for diagnostics."""
+        return {
+            key: {
+                "fetched_at": (
+                    self.fetched_at[key].isoformat()
+                    if key in self.fetched_at
+                    else None
+                ),
+                "stale": self.section_stale(key),
+                "available": self.section_available(key),
+                "max_staleness_seconds": self.max_staleness(key),
+            }
+            for key in ENDPOINTS_BY_KEY
+        }
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Save the snapshot once updates settle."""
+        self._save_pending = True
+        self._store.async_delay_save(self._snapshot_to_store, SNAPSHOT_SAVE_DELAY)
+
+    @callback
+    def _snapshot_to_store(self) -> dict[str, Any]:
+        """Return the snapshot to save."""
+        self._save_pending = False
+        return {
+            "saved_at": dt_util.utcnow().isoformat(),
+            "fetched_at": {
+                key: fetched_at.isoformat()
+                for key, fetched_at in self.fetched_at.items()
+            },
+            "data": self.data,
+        }
+
+    def _fingerprint_sections(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Record which sections changed since the last published snapshot.
+
+        Returns the previous snapshot object when nothing changed, so the
+        base coordinator (always_update=False) skips the listener fan-out.
+        """
+        changed: set[str] = set()
+        previous = self.data or {}
+        for key, value in data.items():
+            if key in self._fingerprints and value is previous.get(key):
+                continue
+            fingerprint = _fingerprint(value)
+            if self._fingerprints.get(key) != fingerprint:
+                self._fingerprints[key] = fingerprint
+                changed.add(key)
+        if not changed and self.data is not None:
+            self.changed_sections = frozenset()
+            return self.data
+        snapshot = self.snapshot.updated(data, changed)
+        if "measurement" in changed and self._add_measurement(data["measurement"]):
+            snapshot = replace(
+                snapshot,
+                rolling=self.rolling.summary,
+                degradation=self.degradation.state,
+            )
+            changed |= {ROLLING_SECTION, PROFILE_SECTION}
+        self.changed_sections = frozenset(changed)
+        self.snapshot = snapshot
+        return data
+
+    def _add_measurement(self, measurement: dict[str, Any] | None) -> bool:
+        """Add a new measurement to the rolling statistics, detector and profile."""
+        if not measurement or (measured := measurement_time(measurement)) is None:
+            return False
+        if not self.rolling.add(measurement, measured):
+            return False
+        self.degradation.update(measurement, measured)
+        self.profile.add(measurement, measured)
+        return True
+
+    @callback
+    def async_expire_rolling(self, now: datetime) -> None:
+        """Publish the rolling statistics once results leave a window."""
+        if not self.rolling.expire(now):
+            return
+        self.snapshot = replace(self.snapshot, rolling=self.rolling.summary)
+        self.changed_sections = frozenset({ROLLING_SECTION})
+        self.async_update_listeners()
+
+    async def async_restore_learned(self) -> None:
+        """Load the detector state and profile saved before the last restart."""
+        await self.degradation.async_load()
+        await self.profile.async_load()
+        self.snapshot = replace(self.snapshot, degradation=self.degradation.state)
+
+    async def async_load_history(self) -> None:
+        """Import the history and seed the rolling statistics and profile.
+
+        One pass over the history serves the long-term statistics import,
+        the rolling statistics, which take the last week, and the
+        hour-of-week profile, which takes everything after its newest
+        result: the whole history on the first run. Results seen live
+        meanwhile are merged in afterwards. Without a history endpoint the
+        statistics and profile build up from new tests only.
+        """
+        seeded = RollingStats()
+        window_start = dt_util.utcnow() - timedelta(seconds=max(WINDOWS.values()))
+        newest = self.profile.newest
+        try:
+            await self.history.async_run(
+                (
+                    HistoryReader(since=window_start, add=seeded.add),
+                    HistoryReader(
+                        since=(
+                            dt_util.utc_from_timestamp(newest)
+                            if newest is not None
+                            else None
+                        ),
+                        add=self.profile.load,
+                    ),
+                )
+            )
+        finally:
+            self.profile.finish_loading()
+        if seeded.size:
+            seeded.merge(self.rolling)
+            self.rolling = seeded
+            self.snapshot = replace(self.snapshot, rolling=seeded.summary)
+        self.changed_sections = frozenset({ROLLING_SECTION, PROFILE_SECTION})
+        self.async_update_listeners()
+
+    async def _async_fast_poll_finished(
+        self,
+        session: aiohttp.ClientSession,
+        data: dict[str, Any],
+        now: float,
+        started: float,
+    ) -> bool:
+        """Poll only /status while a speed test runs.
+
+        Returns True once the test has finished (or never started, or ran
+        past the upper bound); the regular cycle then fetches the new
+        measurement right away. A failed /status fetch also ends the fast
+        poll, as the last status cannot tell; the regular cycle then fails
+        the update if the backend is unreachable.
+        """
+        await self._async_fetch_into(
+            session, [ENDPOINTS_BY_KEY["status"]], data, now
+        )
+        elapsed = now - started
+        error = self.endpoint_errors["status"]
+        if error is None and elapsed < FAST_POLL_MAX_DURATION:
+            if test_in_progress(data):
+                self._fast_poll_seen_running = True
+                return False
+            if not self._fast_poll_seen_running and elapsed < FAST_POLL_START_GRACE:
+                return False
+        if error is not None:
+            _LOGGER.debug("Gonzales status failed during a speed test: %s", error)
+        else:
+            _LOGGER.debug("Gonzales speed test finished after %.0fs", elapsed)
+        self._fast_poll_started = None
+        self._next_due.pop("measurement", None)
+        self.update_interval = self._tick_interval()
+        return True
+
+    def _start_fast_poll(self, seen_running: bool) -> None:
+        """Switch to fast /status polling until the running test finishes."""
+        self._fast_poll_started = time.monotonic()
+        self._fast_poll_seen_running = seen_running
+        self.update_interval = self._tick_interval()
+
+    def _is_due(self, endpoint: GonzalesEndpoint, now: float) -> bool:
+        """Return True if an endpoint's refresh interval has elapsed."""
+        if not self.supports(endpoint.key):
+            return False
+        if not self._is_needed(endpoint):
+            return False
+        return self._next_due.get(endpoint.key, 0) <= now + DUE_TOLERANCE
+
+    def _is_needed(self, endpoint: GonzalesEndpoint) -> bool:
+        """Return True if anything still depends on an endpoint's section.
+
+        Entities register their sections as listener context. Disabled
+        entities are never added to Home Assistant, so they register no
+        listener and their sections are skipped. Until the platforms are
+        set up only the always needed sections are fetched, so they alone
+        gate entry setup; an open capability probe needs every optional
+        endpoint once.
+        """
+        if endpoint.key in ALWAYS_NEEDED:
+            return True
+        if not self._platforms_ready:
+            return False
+        if (
+            self.capabilities is None
+            and endpoint.optional
+            and endpoint.key not in self._probe_results
+        ):
+            return True
+        return endpoint.key in self.needed_sections
+
+    @property
+    def needed_sections(self) -> set[str]:
+        """Return the sections enabled entities depend on."""
+        needed = set(ALWAYS_NEEDED)
+        for sections in self.async_contexts():
+            needed.update(sections)
+        return needed
+
+    @callback
+    def async_platforms_ready(self) -> None:
+        """Fetch the deferred sections now that entities depend on them."""
+        self._platforms_ready = True
+        now = time.monotonic()
+        if any(self._is_due(endpoint, now) for endpoint in ENDPOINTS):
+            self.config_entry.async_create_background_task(
+                self.hass, self.async_request_refresh(), f"{DOMAIN} deferred refresh"
+            )
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> Callable[[], None]:
+        """Listen for data updates; fetch newly needed sections soon."""
+        newly_needed = (
+            self._platforms_ready
+            and context is not None
+            and not set(context) <= self.needed_sections
+        )
+        remove_listener = super().async_add_listener(update_callback, context)
+        if newly_needed:
+            self.hass.async_create_task(self.async_request_refresh())
+        return remove_listener
+
+    def supports(self, key: str) -> bool:
+        """Return True if the backend provides (or may provide) a section."""
+        if self.capabilities is None or not ENDPOINTS_BY_KEY[key].optional:
+            return True
+        return key in self.capabilities["endpoints"]
+
+    @callback
+    def _async_check_version(self, data: dict[str, Any]) -> None:
+        """Start a capability probe when the backend version changed."""
+        if self.capabilities is None or data["status"] is None:
+            return
+        version = data["status"].get("version")
+        if version == self.capabilities.get("version"):
+            return
+        _LOGGER.debug(
+            "Gonzales backend version changed from %s to %s, probing capabilities",
+            self.capabilities.get("version"),
+            version,
+        )
+        self.capabilities = None
+        self._probe_results = {}
+        for endpoint in ENDPOINTS:
+            if endpoint.optional:
+                self._next_due.pop(endpoint.key, None)
+
+    @callback
+    def _async_record_probe(self, data: dict[str, Any]) -> None:
+        """Record probe results and cache capabilities once conclusive.
+
+        An optional endpoint is supported if it answered, and unsupported if
+        it answered 404; transport errors leave it to the next cycle.
+        """
+        if self.capabilities is not None or data["status"] is None:
+            return
+        for endpoint in ENDPOINTS:
+            if not endpoint.optional or endpoint.key in self._probe_results:
+                continue
+            error = self.endpoint_errors[endpoint.key]
+            if error is None and self._next_due.get(endpoint.key):
+                self._probe_results[endpoint.key] = True
+            elif error == ERROR_NOT_FOUND:
+                self._probe_results[endpoint.key] = False
+        if len(self._probe_results) < sum(e.optional for e in ENDPOINTS):
+            return
+
+        entry = self.config_entry
+        previous = entry.data.get(CONF_CAPABILITIES)
+        self.capabilities = {
+            "version": data["status"].get("version"),
+            "endpoints": sorted(
+                key for key, supported in self._probe_results.items() if supported
+            ),
         }
+        _LOGGER.debug("Gonzales capabilities: %s", self.capabilities)
+        self.hass.config_entries.async_update_entry(
+            entry, data={**entry.data, CONF_CAPABILITIES: self.capabilities}
+        )
+        # Entities were created from the previous capabilities, or for every
+        # optional endpoint when none were known yet: set them up again
+        created = (
+            previous["endpoints"]
+            if previous is not None
+            else sorted(endpoint.key for endpoint in ENDPOINTS if endpoint.optional)
+        )
+        if self._platforms_ready and created != self.capabilities["endpoints"]:
+            self.hass.config_entries.async_schedule_reload(entry.entry_id)
+
+    async def _async_fetch_into(
+        self,
+        session: aiohttp.ClientSession,
+        endpoints: list[GonzalesEndpoint],
+        data: dict[str, Any],
+        now: float,
+    ) -> None:
+        """Fetch endpoints concurrently and merge the results into data.
+
+        Several endpoints are requested from the snapshot endpoint at once
+        when the backend offers it; whatever it does not return falls back
+        to the per-endpoint requests. Low-priority endpoints only get the
+        time left in the cycle budget; high-priority ones are bounded by
+        their own timeouts.
+        """
+        if self._cycle_deadline - time.monotonic() < MIN_REQUEST_BUDGET:
+            for endpoint in endpoints:
+                if endpoint.low_priority:
+                    self._mark_stale(endpoint, "skipped")
+            endpoints = [e for e in endpoints if not e.low_priority]
+        if len(endpoints) > 1 and self._snapshot_supported(data):
+            endpoints = await self._async_fetch_snapshot(
+                session, endpoints, data, now
+            )
+            if not endpoints:
+                return
+        remaining = self._cycle_deadline - time.monotonic()
+        high: dict[asyncio.Task[tuple[Any, str | None]], GonzalesEndpoint] = {}
+        low: dict[asyncio.Task[tuple[Any, str | None]], GonzalesEndpoint] = {}
+        for endpoint in endpoints:
+            if not endpoint.low_priority:
+                tasks = high
+            elif remaining >= MIN_REQUEST_BUDGET:
+                tasks = low
+            else:
+                self._mark_stale(endpoint, "skipped")
+                continue
+            tasks[
+                asyncio.create_task(self._async_fetch_endpoint(session, endpoint))
+            ] = endpoint
+
+        if low:
+            _, pending = await asyncio.wait(low, timeout=remaining)
+            for task in pending:
+                task.cancel()
+                self._mark_stale(low.pop(task), "cancelled")
+            if pending:
+                await asyncio.wait(pending)
+        if high:
+            await asyncio.wait(high)
 
+        for task, endpoint in (high | low).items():
+            value, error = task.result()
+            if error is not None:
+                self.endpoint_errors[endpoint.key] = error
+                self._next_due[endpoint.key] = now + self._interval(endpoint.key)
+                _LOGGER.debug(
+                    "Fetching %s from Gonzales failed: %s", endpoint.path, error
+                )
+                continue
+            self._store_section(endpoint, value, data, now)
+
+    def _store_section(
+        self,
+        endpoint: GonzalesEndpoint,
+        value: Any,
+        data: dict[str, Any],
+        now: float,
+    ) -> None:
+        """Merge a successfully fetched section into data."""
+        fetched_at = dt_util.utcnow()
+        if endpoint.key == "status" and value:
+            value = _with_started_at(value, data.get("status"), fetched_at)
+        self.endpoint_errors[endpoint.key] = None
+        self._next_due[endpoint.key] = now + self._interval(endpoint.key)
+        data[endpoint.key] = value
+        self.fetched_at[endpoint.key] = fetched_at
+        self.stale_sections.discard(endpoint.key)
+
+    def _snapshot_supported(self, data: dict[str, Any]) -> bool:
+        """Return True if the backend advertises the snapshot endpoint."""
+        status = data.get("status")
+        if not status or SNAPSHOT_FEATURE not in (status.get("features") or ()):
+            return False
+        return status.get("version") != self._snapshot_rejected
+
+    async def _async_fetch_snapshot(
+        self,
+        session: aiohttp.ClientSession,
+        endpoints: list[GonzalesEndpoint],
+        data: dict[str, Any],
+        now: float,
+    ) -> list[GonzalesEndpoint]:
+        """Fetch several sections with a single snapshot request.
+
+        Contract: ``GET /snapshot?sections=<key>,<key>`` answers with a JSON
+        object keyed by section key. Each value is the body the section's
+        own endpoint returns (``null`` where that endpoint returns null);
+        sections the backend cannot provide are left out. A 404 means the
+        backend version has no snapshot endpoint after all.
+
+        Returns the endpoints still to be fetched individually: the ones
+        the snapshot left out, or all of them if the request failed.
+        """
+        stats = self._snapshot_stats
+        # Bounded like the individual requests it replaces; the caller has
+        # dropped the low-priority ones if less than MIN_REQUEST_BUDGET is left
+        timeout = max(
+            max((e.timeout for e in endpoints if not e.low_priority), default=0),
+            min(
+                max(e.timeout for e in endpoints),
+                self._cycle_deadline - time.monotonic(),
+            ),
+            MIN_REQUEST_BUDGET,
+        )
+        error: str | None = None
         try:
-            # Fetch latest measurement
             async with session.get(
-                f"{self._base_url}/measurements/latest",
-                headers=self._headers,
-                timeout=aiohttp.ClientTimeout(total=15),
+                f"{self._base_url}{SNAPSHOT_PATH}",
+                params={"sections": ",".join(e.key for e in endpoints)},
+                headers={**self._headers, hdrs.ACCEPT_ENCODING: "gzip, deflate"},
+                timeout=aiohttp.ClientTimeout(total=timeout),
             ) as resp:
-                if resp.status == 200:
-                    result = await resp.json()
-                    if result is not None:
-                        data["measurement"] = result
+                if resp.status == 404:
+                    self._snapshot_rejected = data["status"].get("version")
+                    error = ERROR_NOT_FOUND
+                elif resp.status != 200:
+                    error = f"HTTP {resp.status}"
+                else:
+                    payload = await resp.json(loads=json_loads)
+                    if not isinstance(payload, dict):
+                        error = "Invalid response: not an object"
+        except aiohttp.ClientError as err:
+            error = f"Error communicating with Gonzales API: {err}"
+        except TimeoutError:
+            error = f"Timeout after {timeout:.0f}s"
+        except ValueError as err:
+            error = f"Invalid response: {err}"
 
-            # Fetch system status
-            async with session.get(
-                f"{self._base_url}/status",
-                headers=self._headers,
-                timeout=aiohttp.ClientTimeout(total=10),
-            ) as resp:
-                if resp.status == 200:
-                    data["status"] = await resp.json()
+        if error is not None:
+            stats.failures += 1
+            stats.last_error = error
+            _LOGGER.debug("Fetching Gonzales snapshot failed: %s", error)
+            return endpoints
+
+        stats.requests += 1
+        missing: list[GonzalesEndpoint] = []
+        for endpoint in endpoints:
+            if endpoint.key not in payload:
+                missing.append(endpoint)
+                continue
+            value = endpoint.parse(payload[endpoint.key])
+            self._store_section(endpoint, value, data, now)
+        stats.sections_missing += len(missing)
+        return missing
+
+    def snapshot_diagnostics(self) -> dict[str, Any]:
+        """Return snapshot endpoint usage for diagnostics."""
+        return {
+            "supported": bool(self.data) and self._snapshot_supported(self.data),
+            **asdict(self._snapshot_stats),
+        }
+
+    def _mark_stale(self, endpoint: GonzalesEndpoint, reason: str) -> None:
+        """Record a fetch dropped because the cycle budget ran out.
+
+        The endpoint stays due, so the next cycle tries again.
+        """
+        self._cycle_exhausted = True
+        self.stale_sections.add(endpoint.key)
+        self.endpoint_errors[endpoint.key] = (
+            f"{reason.capitalize()}: cycle budget exhausted"
+        )
+        _LOGGER.debug(
+            "Fetching %s from Gonzales %s: cycle budget exhausted",
+            endpoint.path,
+            reason,
+        )
+
+    def _cycle_budget(self) -> float:
+        """Return the time budget (seconds) of an update cycle."""
+        tick = self.update_interval.total_seconds() if self.update_interval else 0
+        budget = max(tick * CYCLE_BUDGET_FRACTION, MIN_CYCLE_BUDGET)
+        return min(budget, MAX_CYCLE_BUDGET)
+
+    def _record_cycle(self, duration: float) -> None:
+        """Record the duration of a cycle and whether it overran."""
+        self._cycle_durations.append(duration)
+        if self._cycle_exhausted or duration > self._cycle_budget():
+            self.cycle_overruns += 1
+
+    def cycle_stats(self) -> dict[str, Any]:
+        """Return cycle timing statistics for diagnostics."""
+        durations = self._cycle_durations
+        return {
+            "budget_seconds": round(self._cycle_budget(), 1),
+            "cycles": len(durations),
+            "last_seconds": round(durations[-1], 3) if durations else None,
+            "mean_seconds": (
+                round(sum(durations) / len(durations), 3) if durations else None
+            ),
+            "max_seconds": round(max(durations), 3) if durations else None,
+            "overruns": self.cycle_overruns,
+            "stale_sections": sorted(self.stale_sections),
+        }
+
+    def _interval(self, key: str) -> int:
+        """Return the effective refresh interval of a section."""
+        interval = self.intervals[key]
+        if self.push_connected and key in PUSH_SECTIONS:
+            # Events deliver these; polling is only a safety net
+            return max(interval, PUSH_POLL_INTERVAL)
+        return interval
+
+    def _tick_interval(self) -> timedelta:
+        """Return the scheduler tick for the current transport mode."""
+        if self.breaker.state == STATE_OPEN:
+            return timedelta(seconds=self.breaker.backoff)
+        if self._fast_poll_started is not None:
+            return timedelta(seconds=FAST_POLL_INTERVAL)
+        return timedelta(
+            seconds=min(self._interval(endpoint.key) for endpoint in ENDPOINTS)
+        )
+
+    @property
+    def push_connected(self) -> bool:
+        """Return True while the event stream is connected."""
+        return self._push is not None and self._push.connected
+
+    @callback
+    def async_start_push(self) -> None:
+        """Subscribe to the backend event stream in the background."""
+        self._push = GonzalesEventStream(
+            self.client.session,
+            f"{self._base_url}/events",
+            self._headers,
+            self._async_handle_push_event,
+            self._async_push_connection_changed,
+        )
+        self.config_entry.async_create_background_task(
+            self.hass, self._push.async_run(), f"{DOMAIN}_event_stream"
+        )
+
+    @callback
+    def _async_handle_push_event(self, event: str, payload: Any) -> None:
+        """Merge a pushed section into the snapshot."""
+        if event not in ENDPOINTS_BY_KEY:
+            _LOGGER.debug("Ignoring Gonzales event %s", event)
+            return
+        data = dict(self.data) if self.data else {
+            endpoint.key: None for endpoint in ENDPOINTS
+        }
+        value = project(payload, ENDPOINTS_BY_KEY[event].fields)
+        fetched_at = dt_util.utcnow()
+        if event == "status" and value:
+            value = _with_started_at(value, data.get("status"), fetched_at)
+        data[event] = value
+        self.fetched_at[event] = fetched_at
+        self.endpoint_errors[event] = None
+        self._next_due[event] = time.monotonic() + self._interval(event)
+        if (
+            self._measurement_key is not None
+            and measurement_key(data) != self._measurement_key
+        ):
+            # New measurement: let a regular cycle pick up the other light
+            # section and invalidate the derived ones.
+            for key in ENDPOINTS_BY_KEY:
+                if key != event:
+                    self._next_due.pop(key, None)
+            self.hass.async_create_task(self.async_request_refresh())
 
-            # Fetch ISP score from enhanced statistics
+        published = self._fingerprint_sections(data)
+        if published is not self.data:
+            self.async_set_updated_data(published)
+            self._async_schedule_save()
+
+    @callback
+    def _async_push_connection_changed(self, connected: bool) -> None:
+        """Switch between push and polling cadence."""
+        _LOGGER.debug(
+            "Gonzales event stream %s", "connected" if connected else "disconnected"
+        )
+        self.update_interval = self._tick_interval()
+        if not connected:
+            # Catch up on anything missed while the stream was down
+            for key in PUSH_SECTIONS:
+                self._next_due.pop(key, None)
+            self.hass.async_create_task(self.async_request_refresh())
+
+    def push_diagnostics(self) -> dict[str, Any] | None:
+        """Return event stream state for diagnostics."""
+        if self._push is None:
+            return None
+        return {
+            "supported": self._push.supported,
+            "connected": self._push.connected,
+            "reconnects": self._push.reconnects,
+            "events_received": self._push.events_received,
+            "last_error": self._push.last_error,
+        }
+
+    async def async_close(self) -> None:
+        """Write pending saves now and close the backend session.
+
+        A delayed save left pending would otherwise write the store again
+        after the entry is removed.
+        """
+        if self._save_pending:
+            await self._store.async_save(self._snapshot_to_store())
+        await self.degradation.async_flush()
+        await self.profile.async_flush()
+        await self.client.async_close()
+
+    def breaker_diagnostics(self) -> dict[str, Any]:
+        """Return circuit breaker state for diagnostics."""
+        return self.breaker.as_dict(time.monotonic())
+
+    async def async_refresh_sections(self, *keys: str) -> None:
+        """Mark sections as due and request a refresh."""
+        for key in keys:
+            self._next_due.pop(key, None)
+        await self.async_request_refresh()
+
+    async def _async_fetch_endpoint(
+        self,
+        session: aiohttp.ClientSession,
+        endpoint: GonzalesEndpoint,
+    ) -> tuple[Any, str | None]:
+        """Fetch a single endpoint.
+
+        Returns the (extracted) payload and an error description. Errors
+        are reported instead of raised so concurrent fetches stay isolated.
+
+        Responses carrying an ETag or Last-Modified validator are cached;
+        later requests are made conditional and a 304 reuses the cached
+        payload without decoding anything.
+        """
+        cached = self._response_cache.get(endpoint.key)
+        headers = dict(self._headers)
+        if endpoint.compress:
+            headers[hdrs.ACCEPT_ENCODING] = "gzip, deflate"
+        if cached is not None:
+            if cached.etag:
+                headers[hdrs.IF_NONE_MATCH] = cached.etag
+            if cached.last_modified:
+                headers[hdrs.IF_MODIFIED_SINCE] = cached.last_modified
+
+        stats = self._cache_stats.setdefault(endpoint.key, CacheStats())
+        try:
             async with session.get(
-                f"{self._base_url}/statistics/enhanced",
-                headers=self._headers,
-                timeout=aiohttp.ClientTimeout(total=20),
+                f"{self._base_url}{endpoint.path}",
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=endpoint.timeout),
             ) as resp:
-                if resp.status == 200:
-                    stats = await resp.json()
-                    if stats and stats.get("isp_score"):
-                        data["isp_score"] = stats["isp_score"]
-
-            # Fetch Smart Scheduler status (v3.7.0+)
-            try:
-                async with session.get(
-                    f"{self._base_url}/smart-scheduler/status",
-                    headers=self._headers,
-                    timeout=aiohttp.ClientTimeout(total=10),
-                ) as resp:
-                    if resp.status == 200:
-                        data["smart_scheduler"] = await resp.json()
-            except aiohttp.ClientError:
-                pass  # Smart scheduler may not be available on older versions
-
-            # Fetch Root-Cause analysis (v3.7.0+)
-            try:
-                async with session.get(
-                    f"{self._base_url}/root-cause/analysis?days=7",
-                    headers=self._headers,
-                    timeout=aiohttp.ClientTimeout(total=30),
-                ) as resp:
-                    if resp.status == 200:
-                        data["root_cause"] = await resp.json()
-            except aiohttp.ClientError:
-                pass  # Root cause may not be available on older versions
-
+                if resp.status == 304 and cached is not None:
+                    stats.requests += 1
+                    stats.not_modified += 1
+                    return cached.value, None
+                if resp.status == 404:
+                    return None, ERROR_NOT_FOUND
+                if resp.status != 200:
+                    return None, f"HTTP {resp.status}"
+                result = await resp.json(loads=json_loads)
+                etag = resp.headers.get(hdrs.ETAG)
+                last_modified = resp.headers.get(hdrs.LAST_MODIFIED)
         except aiohttp.ClientError as err:
-            raise UpdateFailed(
-                f"Error communicating with Gonzales API: {err}"
-            ) from err
-        except TimeoutError as err:
-            raise UpdateFailed(
-                f"Timeout communicating with Gonzales API: {err}"
-            ) from err
+            return None, f"Error communicating with Gonzales API: {err}"
+        except TimeoutError:
+            return None, f"Timeout after {endpoint.timeout:.0f}s"
+        except ValueError as err:
+            return None, f"Invalid response: {err}"
 
-        if data["status"] is None and data["measurement"] is None:
-            raise UpdateFailed("No data received from Gonzales API")
+        result = endpoint.parse(result)
+        if endpoint.key == "status" and result:
+            # Cache the converted status: a 304 must reuse the start time,
+            # not recompute it from an uptime that has gone stale
+            result = _with_started_at(
+                result, (self.data or {}).get("status"), dt_util.utcnow()
+            )
+        stats.requests += 1
+        if etag or last_modified:
+            self._response_cache[endpoint.key] = CachedResponse(
+                value=result, etag=etag, last_modified=last_modified
+            )
+        else:
+            # Backend does not support validators for this endpoint
+            self._response_cache.pop(endpoint.key, None)
+        return result, None
 
-        return data
+    def response_cache_stats(self) -> dict[str, Any]:
+        """Return conditional request statistics for diagnostics."""
+        requests = sum(stats.requests for stats in self._cache_stats.values())
+        not_modified = sum(
+            stats.not_modified for stats in self._cache_stats.values()
+        )
+        return {
+            "hit_ratio": round(not_modified / requests, 3) if requests else None,
+            "endpoints": {
+                key: {
+                    "requests": stats.requests,
+                    "not_modified": stats.not_modified,
+                    "has_validator": key in self._response_cache,
+                }
+                for key, stats in self._cache_stats.items()
+            },
+        }
 
     async def async_trigger_speedtest(self) -> dict[str, Any] | None:
         """Trigger a speed test via the Gonzales API."""
-        session = async_get_clientsession(self.hass)
+        session = self.client.session
         try:
             async with session.post(
                 f"{self._base_url}/speedtest/trigger",
@@ -152,14 +1444,16 @@ class GonzalesCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 if resp.status in (200, 202):  # 202 = Accepted (async)
                     result = await resp.json()
                     _LOGGER.info("Speed test triggered: %s", result.get("status", "started"))
-                    # Don't refresh immediately - test runs in background
-                    # The regular polling will pick up results
+                    # Test runs in background: follow it with light /status
+                    # polls and fetch the result as soon as it finishes
+                    self._async_follow_speedtest()
                     return result
                 elif resp.status == 429:
                     _LOGGER.warning("Speed test rate limited, try again later")
                     return None
                 elif resp.status == 503:
                     _LOGGER.warning("Speed test already in progress")
+                    self._async_follow_speedtest()
                     return None
                 else:
                     _LOGGER.error("Failed to trigger speed test: %s", resp.status)
@@ -168,6 +1462,14 @@ class GonzalesCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             _LOGGER.error("Error triggering speed test: %s", err)
             return None
 
+    @callback
+    def _async_follow_speedtest(self) -> None:
+        """Poll /status quickly until a triggered test finishes."""
+        if self.push_connected or self._fast_poll_started is not None:
+            return  # Events or an ongoing fast poll will pick up the result
+        self._start_fast_poll(seen_running=False)
+        self.hass.async_create_task(self.async_request_refresh())
+
     async def async_set_interval(self, interval_minutes: int) -> bool:
         """Set the test interval via the Gonzales API.
 
@@ -177,7 +1479,7 @@ class GonzalesCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         Returns:
             True if successful, False otherwise.
         """
-        session = async_get_clientsession(self.hass)
+        session = self.client.session
         try:
             async with session.put(
                 f"{self._base_url}/config",
@@ -189,8 +1491,8 @@ class GonzalesCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     _LOGGER.info(
                         "Set Gonzales test interval to %d minutes", interval_minutes
                     )
-                    # Refresh data to get new config
-                    await self.async_request_refresh()
+                    # Refresh status to get new config
+                    await self.async_refresh_sections("status")
                     return True
                 else:
                     _LOGGER.error(
@@ -0,0 +1,290 @@
+"""Online detection of sudden latency, jitter and packet loss increases."""
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, fields
+from datetime import datetime
+import math
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 60
+
+# Measurement fields watched, by metric name, with the smallest standard
+# deviation assumed: a very steady line must not turn noise into alarms
+METRICS: dict[str, tuple[str, float]] = {
+    "ping": ("ping_latency_ms", 1.0),
+    "jitter": ("ping_jitter_ms", 0.5),
+    "packet_loss": ("packet_loss_pct", 0.5),
+}
+
+# Results that form the baseline before the detector arms
+WARMUP = 10
+
+# Weight of a new result in the baseline mean and variance
+BASELINE_ALPHA = 0.05
+
+# CUSUM allowance and alarm threshold, in baseline standard deviations:
+# a shift of three deviations raises an alarm after about five results
+ALLOWANCE = 1.0
+THRESHOLD = 8.0
+
+# Largest score one result can add, so isolated spikes do not alarm
+SCORE_LIMIT = 3.0
+
+# A raised alarm clears once the results closer to the baseline than to
+# the shifted level outnumber the others by this much
+RECOVERY = 3.0
+
+# After this many results in alarm the new level becomes the baseline
+RELEARN_AFTER = 72
+
+
+@dataclass(slots=True)
+class MetricDetector:
+    """Upward CUSUM of one metric against its moving baseline."""
+
+    count: int = 0
+    mean: float = 0.0
+    variance: float = 0.0
+    cusum: float = 0.0
+    recovery: float = 0.0
+    # Results since the CUSUM left zero: held back from the baseline until
+    # it returns to zero without an alarm
+    onset: float | None = None
+    excursion_count: int = 0
+    excursion_total: float = 0.0
+    held_total: float = 0.0
+    held_squares: float = 0.0
+    alarm: bool = False
+    alarm_count: int = 0
+
+    @property
+    def deviation(self) -> float:
+        """Return the baseline standard deviation."""
+        return math.sqrt(self.variance)
+
+    @property
+    def shift(self) -> float | None:
+        """Return the mean rise over the baseline since the onset."""
+        if not self.excursion_count:
+            return None
+        return self.excursion_total / self.excursion_count - self.mean
+
+    def update(self, value: float, timestamp: float, floor: float) -> bool:
+        """Add a result. Return True if the alarm state changed."""
+        if self.count < WARMUP:
+            self._hold(value, value)
+            self._fold()
+            return False
+        deviation = max(self.deviation, floor)
+        distance = (value - self.mean) / deviation
+        # A single outlier adds at most SCORE_LIMIT to the sum
+        score = min(distance, SCORE_LIMIT)
+        if self.alarm:
+            self.excursion_count += 1
+            self.excursion_total += value
+            self.alarm_count += 1
+            # Halfway between the baseline and the excursion level: results
+            # below it count towards recovery, results above it against.
+            # Unclipped, so a shift of more than 2 * SCORE_LIMIT deviations
+            # is not taken for a recovery
+            midpoint = max(self.shift / deviation, 2 * ALLOWANCE) / 2
+            self.recovery = max(0.0, self.recovery + 1 - distance / midpoint)
+            if self.recovery > RECOVERY:
+                self._reset()
+                return True
+            if self.alarm_count >= RELEARN_AFTER:
+                # The shift persisted: take the new level as the baseline
+                self.mean += self.shift
+                self._reset()
+                return True
+            return False
+
+        self.cusum = max(0.0, self.cusum + score - ALLOWANCE)
+        # Outliers are learned at the clipped value so they barely move it
+        self._hold(value, min(value, self.mean + SCORE_LIMIT * deviation))
+        if not self.cusum:
+            self._fold()
+            return False
+        if self.onset is None:
+            self.onset = timestamp
+        if self.cusum > THRESHOLD:
+            self.alarm = True
+            self.alarm_count = 0
+            self.recovery = 0.0
+            return True
+        return False
+
+    def _hold(self, value: float, learned: float) -> None:
+        """Add a result to the excursion."""
+        self.excursion_count += 1
+        self.excursion_total += value
+        self.held_total += learned
+        self.held_squares += learned * learned
+
+    def _fold(self) -> None:
+        """Fold the held results into the baseline and end the excursion."""
+        held = self.excursion_count
+        level = self.held_total / held
+        spread = max(0.0, self.held_squares / held - level * level)
+        if not self.count:
+            self.mean = level
+            self.variance = spread
+        else:
+            # Equal weights while warming up, then exponential forgetting
+            alpha = max(BASELINE_ALPHA, 1 / (self.count + 1))
+            weight = 1 - (1 - alpha) ** held
+            delta = level - self.mean
+            self.mean += weight * delta
+            self.variance = (1 - weight) * (
+                self.variance + weight * delta * delta
+            ) + weight * spread
+        self.count += held
+        self._reset()
+
+    def _reset(self) -> None:
+        """Clear the alarm and the excursion."""
+        self.alarm = False
+        self.alarm_count = 0
+        self.cusum = 0.0
+        self.recovery = 0.0
+        self.onset = None
+        self.excursion_count = 0
+        self.excursion_total = 0.0
+        self.held_total = 0.0
+        self.held_squares = 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class DegradationState:
+    """Published detector result."""
+
+    detected: bool | None = None
+    metric: str | None = None
+    shift: float | None = None
+    baseline: float | None = None
+    onset: datetime | None = None
+
+
+def degradation_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Return the store holding the detector state of a config entry."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.degradation")
+
+
+class DegradationDetector:
+    """Watch each new measurement for a sustained rise of a metric.
+
+    Every metric runs an upward CUSUM of its standardized values against
+    an exponentially weighted baseline, which costs constant time and
+    memory per result. Results of an excursion are only learned once it
+    ends without an alarm, so a shift does not pull the baseline up while
+    evidence builds. The state is saved, so a restart keeps the baseline.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the detector."""
+        self._store = degradation_store(hass, entry_id)
+        self._detectors = {metric: MetricDetector() for metric in METRICS}
+        self._last: float | None = None
+        self._save_pending = False
+        self.state = DegradationState()
+
+    async def async_load(self) -> None:
+        """Restore the saved detector state."""
+        if not (stored := await self._store.async_load()):
+            return
+        names = {field.name for field in fields(MetricDetector)}
+        for metric, saved in stored.get("metrics", {}).items():
+            if metric in self._detectors:
+                self._detectors[metric] = MetricDetector(
+                    **{key: value for key, value in saved.items() if key in names}
+                )
+        self._last = stored.get("last")
+        self.state = self._current_state()
+
+    def update(self, measurement: dict[str, Any], measured: datetime) -> bool:
+        """Add a new measurement. Return True if the published state changed."""
+        timestamp = measured.timestamp()
+        if self._last is not None and timestamp <= self._last:
+            return False
+        self._last = timestamp
+        for metric, (field, floor) in METRICS.items():
+            value = measurement.get(field)
+            if isinstance(value, (int, float)):
+                self._detectors[metric].update(float(value), timestamp, floor)
+        self._save_pending = True
+        self._store.async_delay_save(self._data_to_store, SAVE_DELAY)
+        state = self._current_state()
+        if state == self.state:
+            return False
+        self.state = state
+        return True
+
+    def _current_state(self) -> DegradationState:
+        """Return the state of the metric with the largest alarmed shift."""
+        armed = [
+            metric
+            for metric, detector in self._detectors.items()
+            if detector.count >= WARMUP
+        ]
+        if not armed:
+            return DegradationState()
+        alarmed = [
+            (metric, detector)
+            for metric, detector in self._detectors.items()
+            if detector.alarm
+        ]
+        if not alarmed:
+            return DegradationState(detected=False)
+        metric, detector = max(
+            alarmed,
+            key=lambda item: (item[1].shift or 0) / max(
+                item[1].deviation, METRICS[item[0]][1]
+            ),
+        )
+        return DegradationState(
+            detected=True,
+            metric=metric,
+            shift=round(detector.shift, 2) if detector.shift is not None else None,
+            baseline=round(detector.mean, 2),
+            onset=(
+                dt_util.utc_from_timestamp(detector.onset)
+                if detector.onset is not None
+                else None
+            ),
+        )
+
+    async def async_flush(self) -> None:
+        """Write a pending delayed save now."""
+        if self._save_pending:
+            await self._store.async_save(self._data_to_store())
+
+    def _data_to_store(self) -> dict[str, Any]:
+        """Return the detector state to save."""
+        self._save_pending = False
+        return {
+            "last": self._last,
+            "metrics": {
+                metric: asdict(detector)
+                for metric, detector in self._detectors.items()
+            },
+        }
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Return the per-metric detector state for diagnostics."""
+        return {
+            metric: {
+                "results": detector.count,
+                "baseline": round(detector.mean, 3),
+                "deviation": round(detector.deviation, 3),
+                "cusum": round(detector.cusum, 3),
+                "alarm": detector.alarm,
+            }
+            for metric, detector in self._detectors.items()
+        }
@@ -46,6 +46,21 @@ async def async_get_config_entry_diagnostics(
             if coordinator.last_exception
             else None,
             "update_interval": str(coordinator.update_interval),
+            "capabilities": coordinator.capabilities,
+            "endpoint_intervals": coordinator.intervals,
+            "needed_sections": sorted(coordinator.needed_sections),
+            "endpoint_errors": coordinator.endpoint_errors,
+            "sections": coordinator.section_diagnostics(),
+            "response_cache": coordinator.response_cache_stats(),
+            "connections": coordinator.client.diagnostics(),
+            "snapshot": coordinator.snapshot_diagnostics(),
+            "cycles": coordinator.cycle_stats(),
+            "circuit_breaker": coordinator.breaker_diagnostics(),
+            "push": coordinator.push_diagnostics(),
+            "history_import": coordinator.history.diagnostics(),
+            "rolling": coordinator.rolling.diagnostics(),
+            "degradation": coordinator.degradation.diagnostics(),
+            "profile": coordinator.profile.diagnostics(),
         },
         "data": redacted_data,
     }
@@ -0,0 +1,98 @@
+"""Base entity for Gonzales."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN
+from .coordinator import GonzalesCoordinator
+from .model import GonzalesSnapshot
+
+
+class GonzalesEntity(CoordinatorEntity[GonzalesCoordinator]):
+    """Base class for Gonzales entities.
+
+    Entities declare the coordinator sections they read in ``_sections``
+    and only write state when one of them changed, or when availability or
+    the stale marker flipped. Availability follows the freshness of those
+    sections rather than the last coordinator update. Section attributes
+    are built once per coordinator snapshot and reused for every read.
+    The sections are also the listener context, which tells the coordinator
+    what enabled entities still need.
+    """
+
+    _attr_has_entity_name = True
+    # Counts up while stale data is shown
+    _unrecorded_attributes = frozenset({"data_age_seconds"})
+    _sections: tuple[str, ...] = ()
+
+    def __init__(
+        self,
+        coordinator: GonzalesCoordinator,
+        sections: tuple[str, ...] | None = None,
+    ) -> None:
+        """Initialize the entity."""
+        if sections is not None:
+            self._sections = sections
+        super().__init__(coordinator, context=self._sections)
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, coordinator.config_entry.entry_id)},
+            name="Gonzales",
+            manufacturer="Gonzales",
+            model="Internet Speed Monitor",
+            entry_type=DeviceEntryType.SERVICE,
+        )
+        self._written_freshness: tuple[bool, bool] | None = None
+        self._attributes_snapshot: GonzalesSnapshot | None = None
+        self._attributes: dict[str, Any] | None = None
+
+    @property
+    def available(self) -> bool:
+        """Return True while every source section is fresh enough to show."""
+        if not self._sections:
+            return super().available
+        return all(
+            self.coordinator.section_available(section) for section in self._sections
+        )
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the section attributes, marked while stale data is shown."""
+        snapshot = self.coordinator.snapshot
+        if snapshot is not self._attributes_snapshot:
+            self._attributes_snapshot = snapshot
+            self._attributes = self._section_attributes
+        attributes = self._attributes
+        if not self._sections or (
+            (freshness := self.coordinator.freshness_attributes(self._sections))
+            is None
+        ):
+            return attributes
+        return {**(attributes or {}), **freshness}
+
+    @property
+    def _section_attributes(self) -> dict[str, Any] | None:
+        """Return additional state attributes read from the sections."""
+        return None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only if a source section or its freshness changed."""
+        freshness = (
+            self.available,
+            any(self.coordinator.section_stale(section) for section in self._sections),
+        )
+        changed = self._sections_changed()
+        if freshness == self._written_freshness and not changed:
+            return
+        self._written_freshness = freshness
+        self.async_write_ha_state()
+
+    def _sections_changed(self) -> bool:
+        """Return True if the last update changed a source section."""
+        return any(
+            section in self.coordinator.changed_sections for section in self._sections
+        )
@@ -0,0 +1,373 @@
+"""Import the backend's measurement history into long-term statistics."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Callable, Sequence
+from contextlib import aclosing
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import logging
+from typing import Any
+
+import aiohttp
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import (
+    async_import_statistics,
+    statistics_during_period,
+)
+from homeassistant.const import PERCENTAGE, Platform, UnitOfDataRate, UnitOfTime
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
+
+from .const import DOMAIN
+from .session import GonzalesSession
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+# Paged measurement list, oldest first: GET /measurements?start_date=<iso>
+# &sort_order=asc&page=<n>&page_size=<n> answers {"items": [...], "pages": n}
+HISTORY_PATH = "/measurements"
+HISTORY_PAGE_SIZE = 500
+HISTORY_TIMEOUT = 30
+
+# Hours of statistics collected before they are imported and the
+# checkpoint is saved; bounds memory however long the history is
+IMPORT_CHUNK_HOURS = 168
+
+HOUR = timedelta(hours=1)
+
+
+@dataclass(frozen=True, kw_only=True)
+class HistoryStatistic:
+    """A sensor whose long-term statistics are filled from the history."""
+
+    key: str
+    field: str
+    unit: str
+
+
+HISTORY_STATISTICS: tuple[HistoryStatistic, ...] = (
+    HistoryStatistic(
+        key="download_speed",
+        field="download_mbps",
+        unit=UnitOfDataRate.MEGABITS_PER_SECOND,
+    ),
+    HistoryStatistic(
+        key="upload_speed",
+        field="upload_mbps",
+        unit=UnitOfDataRate.MEGABITS_PER_SECOND,
+    ),
+    HistoryStatistic(
+        key="ping_latency",
+        field="ping_latency_ms",
+        unit=UnitOfTime.MILLISECONDS,
+    ),
+    HistoryStatistic(
+        key="ping_jitter",
+        field="ping_jitter_ms",
+        unit=UnitOfTime.MILLISECONDS,
+    ),
+    HistoryStatistic(
+        key="packet_loss",
+        field="packet_loss_pct",
+        unit=PERCENTAGE,
+    ),
+)
+
+
+class HourAggregate:
+    """Minimum, mean and maximum of one field within an hour."""
+
+    __slots__ = ("count", "total", "minimum", "maximum")
+
+    def __init__(self, value: float) -> None:
+        """Start the aggregate with a first value."""
+        self.count = 1
+        self.total = value
+        self.minimum = value
+        self.maximum = value
+
+    def add(self, value: float) -> None:
+        """Add a value."""
+        self.count += 1
+        self.total += value
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+
+
+@dataclass(frozen=True, slots=True)
+class HistoryReader:
+    """Consumer of the measurements an import run pages through."""
+
+    # Oldest measurement wanted; None for the whole history
+    since: datetime | None
+    add: Callable[[dict[str, Any], datetime], Any]
+
+
+def history_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Return the store holding the import checkpoint of a config entry."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.history")
+
+
+def measurement_time(item: dict[str, Any]) -> datetime | None:
+    """Return the UTC time of a history item, None if it has none."""
+    if not (timestamp := item.get("timestamp")):
+        return None
+    if (parsed := dt_util.parse_datetime(timestamp)) is None:
+        return None
+    if parsed.tzinfo is None:
+        # The backend stores UTC
+        return parsed.replace(tzinfo=dt_util.UTC)
+    return dt_util.as_utc(parsed)
+
+
+class GonzalesHistoryImport:
+    """Page through the measurement history and import hourly statistics.
+
+    Measurements are read oldest first, one page at a time, and folded
+    into hourly aggregates. Every IMPORT_CHUNK_HOURS completed hours are
+    imported and the checkpoint, the start of the next hour to import, is
+    saved; a later or interrupted run continues from there. The current
+    hour is left to the next run, as more tests may still land in it.
+    Hours the recorder already compiled from a sensor, such as every hour
+    since the sensor was set up, are never overwritten.
+
+    Readers passed to a run get the measurements of the same pass, so
+    seeding other statistics from the history costs no extra requests.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        client: GonzalesSession,
+        base_url: str,
+        headers: dict[str, str],
+    ) -> None:
+        """Initialize the importer."""
+        self._hass = hass
+        self._entry_id = entry_id
+        self._client = client
+        self._base_url = base_url
+        self._headers = headers
+        self._store = history_store(hass, entry_id)
+        self._lock = asyncio.Lock()
+        self.imported_hours = 0
+        self.last_run: datetime | None = None
+        self.last_error: str | None = None
+
+    async def async_run(self, readers: Sequence[HistoryReader] = ()) -> int:
+        """Import the hours completed since the checkpoint.
+
+        The pass starts early enough for the readers too, which get every
+        measurement from their since on. Returns the number of hours
+        imported. Runs one at a time; a call while an import is running
+        waits for it and then catches up.
+        """
+        async with self._lock:
+            statistic_ids: dict[HistoryStatistic, str] = {}
+            if "recorder" in self._hass.config.components:
+                await get_instance(self._hass).async_db_ready
+                statistic_ids = self._statistic_ids()
+            if not statistic_ids and not readers:
+                return 0
+            try:
+                imported = await self._async_import(statistic_ids, readers)
+            except (aiohttp.ClientError, TimeoutError, ValueError) as err:
+                self.last_error = str(err) or type(err).__name__
+                _LOGGER.warning(
+                    "Importing the Gonzales measurement history failed: %s",
+                    self.last_error,
+                )
+                return 0
+            self.last_error = None
+            self.last_run = dt_util.utcnow()
+            if imported:
+                _LOGGER.info(
+                    "Imported %d hours of Gonzales measurement history", imported
+                )
+            return imported
+
+    def _statistic_ids(self) -> dict[HistoryStatistic, str]:
+        """Return the entity id of each registered history sensor."""
+        registry = er.async_get(self._hass)
+        statistic_ids: dict[HistoryStatistic, str] = {}
+        for statistic in HISTORY_STATISTICS:
+            if entity_id := registry.async_get_entity_id(
+                Platform.SENSOR, DOMAIN, f"{self._entry_id}_{statistic.key}"
+            ):
+                statistic_ids[statistic] = entity_id
+        return statistic_ids
+
+    async def _async_import(
+        self,
+        statistic_ids: dict[HistoryStatistic, str],
+        readers: Sequence[HistoryReader],
+    ) -> int:
+        """Aggregate and import the history after the checkpoint."""
+        checkpoint = await self._store.async_load() or {}
+        cursor = (
+            dt_util.parse_datetime(checkpoint["cursor"])
+            if checkpoint.get("cursor")
+            else None
+        )
+        starts = [reader.since for reader in readers]
+        if statistic_ids:
+            starts.append(cursor)
+        since = None if None in starts else min(starts)
+        current_hour = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+        chunk: list[tuple[datetime, dict[str, HourAggregate]]] = []
+        hour: datetime | None = None
+        aggregates: dict[str, HourAggregate] = {}
+        imported = 0
+
+        async with aclosing(self.async_iter_measurements(since)) as items:
+            async for item in items:
+                if (measured := measurement_time(item)) is None:
+                    continue
+                for reader in readers:
+                    if reader.since is None or measured >= reader.since:
+                        reader.add(item, measured)
+                if not statistic_ids:
+                    continue
+                start = measured.replace(minute=0, second=0, microsecond=0)
+                if cursor is not None and start < cursor:
+                    continue
+                if start >= current_hour:
+                    if not readers:
+                        break
+                    continue
+                if start != hour:
+                    if hour is not None and aggregates:
+                        chunk.append((hour, aggregates))
+                    hour, aggregates = start, {}
+                    if len(chunk) >= IMPORT_CHUNK_HOURS:
+                        imported += await self._async_import_chunk(
+                            chunk, statistic_ids
+                        )
+                        chunk = []
+                for statistic in statistic_ids:
+                    value = item.get(statistic.field)
+                    if not isinstance(value, (int, float)):
+                        continue
+                    if (aggregate := aggregates.get(statistic.field)) is None:
+                        aggregates[statistic.field] = HourAggregate(value)
+                    else:
+                        aggregate.add(value)
+
+        if hour is not None and aggregates:
+            chunk.append((hour, aggregates))
+        if chunk:
+            imported += await self._async_import_chunk(chunk, statistic_ids)
+        return imported
+
+    async def _async_import_chunk(
+        self,
+        chunk: list[tuple[datetime, dict[str, HourAggregate]]],
+        statistic_ids: dict[HistoryStatistic, str],
+    ) -> int:
+        """Import completed hours and move the checkpoint past them.
+
+        Returns the number of hours imported for at least one sensor.
+        """
+        recorded = await self._async_recorded_hours(
+            chunk[0][0], chunk[-1][0] + HOUR, set(statistic_ids.values())
+        )
+        imported: set[datetime] = set()
+        for statistic, entity_id in statistic_ids.items():
+            known = recorded.get(entity_id, set())
+            statistics = [
+                StatisticData(
+                    start=start,
+                    mean=aggregate.total / aggregate.count,
+                    min=aggregate.minimum,
+                    max=aggregate.maximum,
+                )
+                for start, aggregates in chunk
+                if (aggregate := aggregates.get(statistic.field)) is not None
+                and start.timestamp() not in known
+            ]
+            if not statistics:
+                continue
+            imported.update(data["start"] for data in statistics)
+            async_import_statistics(
+                self._hass,
+                StatisticMetaData(
+                    has_mean=True,
+                    has_sum=False,
+                    name=None,
+                    source="recorder",
+                    statistic_id=entity_id,
+                    unit_of_measurement=statistic.unit,
+                ),
+                statistics,
+            )
+        await self._store.async_save(
+            {"cursor": (chunk[-1][0] + HOUR).isoformat()}
+        )
+        self.imported_hours += len(imported)
+        return len(imported)
+
+    async def _async_recorded_hours(
+        self, start: datetime, end: datetime, statistic_ids: set[str]
+    ) -> dict[str, set[float]]:
+        """Return the hours with statistics between start and end, by id."""
+        rows = await get_instance(self._hass).async_add_executor_job(
+            statistics_during_period,
+            self._hass,
+            start,
+            end,
+            statistic_ids,
+            "hour",
+            None,
+            {"mean"},
+        )
+        return {
+            statistic_id: {row["start"] for row in statistic_rows}
+            for statistic_id, statistic_rows in rows.items()
+        }
+
+    async def async_iter_measurements(
+        self, since: datetime | None
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield the measurements from since on, oldest first."""
+        params: dict[str, Any] = {
+            "sort_order": "asc",
+            "page_size": HISTORY_PAGE_SIZE,
+        }
+        if since is not None:
+            params["start_date"] = since.isoformat()
+        page = 1
+        while True:
+            async with self._client.session.get(
+                f"{self._base_url}{HISTORY_PATH}",
+                headers=self._headers,
+                params={**params, "page": page},
+                timeout=aiohttp.ClientTimeout(total=HISTORY_TIMEOUT),
+            ) as resp:
+                if resp.status == 404:
+                    _LOGGER.debug("Gonzales backend has no measurement history")
+                    return
+                resp.raise_for_status()
+                result = await resp.json(loads=json_loads)
+            items = result.get("items") or []
+            for item in items:
+                yield item
+            if not items or page >= (result.get("pages") or page):
+                return
+            page += 1
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Return the import state for diagnostics."""
+        return {
+            "imported_hours": self.imported_hours,
+            "last_run": self.last_run.isoformat() if self.last_run else None,
+            "last_error": self.last_error,
+        }
@@ -0,0 +1,236 @@
+"""Typed snapshot of the Gonzales coordinator data."""
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from datetime import datetime
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+from .degradation import DegradationState
+from .rolling import RollingSummary
+
+
+@dataclass(frozen=True, slots=True)
+class Measurement:
+    """Latest speed test result."""
+
+    id: int | None = None
+    timestamp: str | None = None
+    download_mbps: float | None = None
+    upload_mbps: float | None = None
+    ping_latency_ms: float | None = None
+    ping_jitter_ms: float | None = None
+    packet_loss_pct: float | None = None
+    server_name: str | None = None
+    isp: str | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Measurement:
+        """Build from the measurement section."""
+        return cls(
+            id=data.get("id"),
+            timestamp=data.get("timestamp"),
+            download_mbps=data.get("download_mbps"),
+            upload_mbps=data.get("upload_mbps"),
+            ping_latency_ms=data.get("ping_latency_ms"),
+            ping_jitter_ms=data.get("ping_jitter_ms"),
+            packet_loss_pct=data.get("packet_loss_pct"),
+            server_name=data.get("server_name"),
+            isp=data.get("isp"),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class Status:
+    """Backend status, scheduler state and outage detection."""
+
+    version: str | None = None
+    started_at: datetime | None = None
+    total_measurements: int | None = None
+    last_test_time: str | None = None
+    db_size_bytes: int | None = None
+    scheduler_running: bool = False
+    test_in_progress: bool = False
+    # None until a status was received, False without outage data
+    outage_active: bool | None = None
+    outage_consecutive_failures: int = 0
+    outage_started_at: str | None = None
+    outage_last_failure_message: str = ""
+    has_outage: bool = False
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Status:
+        """Build from the status section."""
+        scheduler = data.get("scheduler") or {}
+        outage = data.get("outage")
+        return cls(
+            version=data.get("version"),
+            started_at=(
+                dt_util.parse_datetime(started_at)
+                if (started_at := data.get("started_at"))
+                else None
+            ),
+            total_measurements=data.get("total_measurements"),
+            last_test_time=data.get("last_test_time"),
+            db_size_bytes=data.get("db_size_bytes"),
+            scheduler_running=bool(scheduler.get("running")),
+            test_in_progress=bool(scheduler.get("test_in_progress")),
+            outage_active=outage.get("outage_active", False) if outage else False,
+            outage_consecutive_failures=(
+                outage.get("consecutive_failures", 0) if outage else 0
+            ),
+            outage_started_at=outage.get("outage_started_at") if outage else None,
+            outage_last_failure_message=(
+                outage.get("last_failure_message", "") if outage else ""
+            ),
+            has_outage=outage is not None,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class IspScore:
+    """Composite ISP performance score and its breakdown."""
+
+    composite: float | None = None
+    grade: str | None = None
+    speed_score: float | None = None
+    reliability_score: float | None = None
+    latency_score: float | None = None
+    consistency_score: float | None = None
+    has_breakdown: bool = False
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> IspScore:
+        """Build from the ISP score section."""
+        breakdown = data.get("breakdown")
+        scores = breakdown or {}
+        return cls(
+            composite=data.get("composite"),
+            grade=data.get("grade"),
+            speed_score=scores.get("speed_score"),
+            reliability_score=scores.get("reliability_score"),
+            latency_score=scores.get("latency_score"),
+            consistency_score=scores.get("consistency_score"),
+            has_breakdown=breakdown is not None,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class SmartScheduler:
+    """Adaptive scheduler state, with percentages already computed."""
+
+    enabled: bool | None = None
+    phase: str | None = None
+    stability_pct: int | None = None
+    interval_minutes: int | None = None
+    data_used_pct: int | None = None
+    base_interval_minutes: int | None = None
+    last_decision_reason: str | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> SmartScheduler:
+        """Build from the smart scheduler section."""
+        stability = data.get("stability_score")
+        enabled = data.get("enabled")
+        return cls(
+            enabled=enabled,
+            phase=data.get("phase"),
+            stability_pct=round(stability * 100) if stability is not None else None,
+            interval_minutes=data.get("current_interval_minutes"),
+            data_used_pct=(
+                round(100 - (data.get("data_budget_remaining_pct") or 100))
+                if enabled
+                else None
+            ),
+            base_interval_minutes=data.get("base_interval_minutes"),
+            last_decision_reason=data.get("last_decision_reason"),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class RootCause:
+    """Root-cause analysis, with the primary issue already resolved."""
+
+    network_health_score: float | None = None
+    # Category of the primary cause, "none" without one
+    primary_issue: str = "none"
+    primary_severity: str | None = None
+    primary_confidence: float | None = None
+    primary_description: str | None = None
+    primary_occurrence_count: int | None = None
+    issues_count: int = 0
+    recommendations_count: int = 0
+    dns_score: float | None = None
+    local_network_score: float | None = None
+    isp_backbone_score: float | None = None
+    isp_lastmile_score: float | None = None
+    has_primary_cause: bool = False
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> RootCause:
+        """Build from the root cause section."""
+        primary = data.get("primary_cause")
+        cause = primary or {}
+        layers = data.get("layer_scores") or {}
+        return cls(
+            network_health_score=data.get("network_health_score"),
+            primary_issue=cause.get("category") if primary else "none",
+            primary_severity=cause.get("severity"),
+            primary_confidence=cause.get("confidence"),
+            primary_description=cause.get("description"),
+            primary_occurrence_count=cause.get("occurrence_count"),
+            issues_count=(
+                data.get("secondary_causes_count", 0) + (1 if primary else 0)
+            ),
+            recommendations_count=data.get("recommendations_count", 0),
+            dns_score=layers.get("dns_score"),
+            local_network_score=layers.get("local_network_score"),
+            isp_backbone_score=layers.get("isp_backbone_score"),
+            isp_lastmile_score=layers.get("isp_lastmile_score"),
+            has_primary_cause=bool(primary),
+        )
+
+
+SECTION_MODELS: dict[str, Any] = {
+    "measurement": Measurement,
+    "status": Status,
+    "isp_score": IspScore,
+    "smart_scheduler": SmartScheduler,
+    "root_cause": RootCause,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class GonzalesSnapshot:
+    """Immutable view of the coordinator data, rebuilt once per update.
+
+    Sections without data are empty models, so readers need no None
+    checks; ``present`` lists the sections that do have data.
+    """
+
+    measurement: Measurement = Measurement()
+    status: Status = Status()
+    isp_score: IspScore = IspScore()
+    smart_scheduler: SmartScheduler = SmartScheduler()
+    root_cause: RootCause = RootCause()
+    # Derived from the stream of measurements, replaced by the coordinator
+    rolling: RollingSummary = RollingSummary()
+    degradation: DegradationState = DegradationState()
+    present: frozenset[str] = frozenset()
+
+    def updated(
+        self, data: dict[str, Any], sections: frozenset[str] | set[str]
+    ) -> GonzalesSnapshot:
+        """Return a snapshot with the given sections rebuilt from data."""
+        present = set(self.present)
+        models: dict[str, Any] = {}
+        for key in sections:
+            value = data.get(key)
+            if value:
+                models[key] = SECTION_MODELS[key].from_dict(value)
+                present.add(key)
+            else:
+                models[key] = SECTION_MODELS[key]()
+                present.discard(key)
+        return replace(self, present=frozenset(present), **models)
@@ -0,0 +1,227 @@
+"""Hour-of-week profile of the speed test results."""
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 60
+
+# Monday 00:00 to Sunday 23:00, local time
+BUCKETS = 7 * 24
+
+# Measurement fields averaged per bucket, by metric name
+METRICS: dict[str, str] = {
+    "download": "download_mbps",
+    "upload": "upload_mbps",
+    "ping": "ping_latency_ms",
+}
+
+# Results per bucket after which older ones fade out: about three months
+# of hourly tests, so the profile follows a changed line or plan
+MEMORY = 12
+
+# Hours ahead searched for the best window
+WINDOW_HORIZON = 24
+
+
+@dataclass(frozen=True, slots=True)
+class HourProfile:
+    """Expected results in one hour of the week."""
+
+    weekday: int
+    hour: int
+    tests: int
+    download: float | None
+    upload: float | None
+    ping: float | None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the bucket for the service response."""
+        return {
+            "weekday": self.weekday,
+            "hour": self.hour,
+            "tests": self.tests,
+            "download_mbps": self.download,
+            "upload_mbps": self.upload,
+            "ping_ms": self.ping,
+        }
+
+
+def profile_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Return the store holding the hour-of-week profile of a config entry."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.profile")
+
+
+def bucket_of(moment: datetime) -> int:
+    """Return the hour-of-week bucket of a moment, in local time."""
+    local = dt_util.as_local(moment)
+    return local.weekday() * 24 + local.hour
+
+
+class HourOfWeekProfile:
+    """Per hour of the week, the test count and mean of each metric.
+
+    A result updates the means of its bucket in place, so adding and
+    looking up cost constant time and the state is a few fixed-size
+    arrays, saved as lists. Results are added oldest first: live results
+    wait until the history after the newest saved result is loaded.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize an empty profile."""
+        self._store = profile_store(hass, entry_id)
+        self._counts = array("I", bytes(4 * BUCKETS))
+        self._means = {metric: array("d", bytes(8 * BUCKETS)) for metric in METRICS}
+        # Per metric and bucket: results averaged, which can be fewer than
+        # the tests when a metric was missing
+        self._samples = {
+            metric: array("I", bytes(4 * BUCKETS)) for metric in METRICS
+        }
+        self.newest: float | None = None
+        # Live results wait until the history has been loaded once
+        self._loading = True
+        self._pending: list[tuple[dict[str, Any], datetime]] = []
+        self._save_pending = False
+
+    async def async_load(self) -> None:
+        """Restore the saved profile."""
+        if not (stored := await self._store.async_load()):
+            return
+        counts = stored.get("counts") or []
+        if len(counts) != BUCKETS:
+            return
+        self._counts = array("I", counts)
+        for metric in METRICS:
+            self._means[metric] = array("d", stored[metric])
+            self._samples[metric] = array("I", stored[f"{metric}_samples"])
+        self.newest = stored.get("newest")
+
+    def add(self, measurement: dict[str, Any], measured: datetime) -> bool:
+        """Add a live result. Return False if it is not newer than the last."""
+        if self._loading:
+            self._pending.append((measurement, measured))
+            return False
+        if not self._add(measurement, measured):
+            return False
+        self._schedule_save()
+        return True
+
+    def load(self, measurement: dict[str, Any], measured: datetime) -> None:
+        """Add a result from the history, newer than the newest held."""
+        self._add(measurement, measured)
+
+    def finish_loading(self) -> None:
+        """Add the live results that arrived meanwhile and save."""
+        self._loading = False
+        pending, self._pending = self._pending, []
+        for measurement, measured in pending:
+            self._add(measurement, measured)
+        self._schedule_save()
+
+    def _schedule_save(self) -> None:
+        """Save the profile once updates settle."""
+        self._save_pending = True
+        self._store.async_delay_save(self._data_to_store, SAVE_DELAY)
+
+    async def async_flush(self) -> None:
+        """Write a pending delayed save now."""
+        if self._save_pending:
+            await self._store.async_save(self._data_to_store())
+
+    def _add(self, measurement: dict[str, Any], measured: datetime) -> bool:
+        """Fold a result into the means of its bucket."""
+        timestamp = measured.timestamp()
+        if self.newest is not None and timestamp <= self.newest:
+            return False
+        self.newest = timestamp
+        bucket = bucket_of(measured)
+        self._counts[bucket] += 1
+        for metric, field in METRICS.items():
+            value = measurement.get(field)
+            if not isinstance(value, (int, float)):
+                continue
+            samples = self._samples[metric]
+            samples[bucket] = min(samples[bucket] + 1, MEMORY)
+            means = self._means[metric]
+            means[bucket] += (value - means[bucket]) / samples[bucket]
+        return True
+
+    def bucket(self, index: int) -> HourProfile:
+        """Return the expected results of a bucket."""
+        values = {}
+        for metric in METRICS:
+            values[metric] = (
+                round(self._means[metric][index], 2)
+                if self._samples[metric][index]
+                else None
+            )
+        return HourProfile(
+            weekday=index // 24,
+            hour=index % 24,
+            tests=self._counts[index],
+            **values,
+        )
+
+    def at(self, moment: datetime) -> HourProfile:
+        """Return the expected results in the hour of a moment."""
+        return self.bucket(bucket_of(moment))
+
+    def best_window(self, now: datetime) -> tuple[datetime, HourProfile] | None:
+        """Return the coming hour with the highest expected download.
+
+        The full hours starting within the next WINDOW_HORIZON hours are
+        compared; hours without results are skipped.
+        """
+        start = dt_util.as_utc(
+            dt_util.as_local(now).replace(minute=0, second=0, microsecond=0)
+        )
+        samples = self._samples["download"]
+        means = self._means["download"]
+        best: tuple[datetime, int] | None = None
+        for offset in range(1, WINDOW_HORIZON + 1):
+            # Step in UTC, so DST changes neither repeat nor skip an hour
+            moment = dt_util.as_local(start + timedelta(hours=offset))
+            index = bucket_of(moment)
+            if samples[index] and (best is None or means[index] > means[best[1]]):
+                best = (moment, index)
+        if best is None:
+            return None
+        return best[0], self.bucket(best[1])
+
+    def as_list(self) -> list[dict[str, Any]]:
+        """Return every bucket, Monday 00:00 first."""
+        return [self.bucket(index).as_dict() for index in range(BUCKETS)]
+
+    def _data_to_store(self) -> dict[str, Any]:
+        """Return the profile to save."""
+        self._save_pending = False
+        data: dict[str, Any] = {
+            "newest": self.newest,
+            "counts": self._counts.tolist(),
+        }
+        for metric in METRICS:
+            data[metric] = [round(mean, 3) for mean in self._means[metric]]
+            data[f"{metric}_samples"] = self._samples[metric].tolist()
+        return data
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Return the profile coverage for diagnostics."""
+        return {
+            "tests": sum(self._counts),
+            "buckets_filled": sum(1 for count in self._counts if count),
+            "newest": (
+                dt_util.utc_from_timestamp(self.newest).isoformat()
+                if self.newest is not None
+                else None
+            ),
+            "loading": self._loading,
+        }
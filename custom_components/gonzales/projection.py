@@ -0,0 +1,38 @@
+"""Reduce Gonzales API responses to the fields the integration reads."""
+from __future__ import annotations
+
+from typing import Any, Final, TypeAlias
+
+
+class _Count:
+    """Marker: keep only the length of a list, as ``<field>_count``."""
+
+    def __repr__(self) -> str:
+        return "COUNT"
+
+
+COUNT: Final = _Count()
+
+# Field name -> None (keep the value as is), a nested spec, or COUNT
+FieldSpec: TypeAlias = dict[str, "FieldSpec | _Count | None"]
+
+
+def project(value: Any, fields: FieldSpec | None) -> Any:
+    """Return value with only the fields of the spec.
+
+    Projection is idempotent, so already projected data (a restored
+    snapshot, for example) passes through unchanged.
+    """
+    if fields is None or not isinstance(value, dict):
+        return value
+    projected: dict[str, Any] = {}
+    for name, spec in fields.items():
+        if spec is COUNT:
+            count_key = f"{name}_count"
+            if name in value:
+                projected[count_key] = len(value[name] or ())
+            elif count_key in value:
+                projected[count_key] = value[count_key]
+        elif name in value:
+            projected[name] = project(value[name], spec)
+    return projected
@@ -0,0 +1,137 @@
+"""Server-Sent Events push transport for Gonzales."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import logging
+import random
+from typing import Any
+
+import aiohttp
+from aiohttp import hdrs
+
+from homeassistant.util.json import json_loads
+
+_LOGGER = logging.getLogger(__name__)
+
+# Reconnect backoff (seconds)
+BACKOFF_MIN = 1
+BACKOFF_MAX = 300
+
+# The backend sends a comment line as heartbeat; a silent stream is dead
+READ_TIMEOUT = 90
+
+# Status codes meaning the backend does not offer the event stream
+UNSUPPORTED_STATUS = (404, 405, 501)
+
+
+class GonzalesEventStream:
+    """Subscribe to the Gonzales event stream and dispatch its events.
+
+    Reconnects with exponential backoff and jitter. Stops for good when
+    the backend answers that the stream does not exist, leaving the
+    coordinator on its polling path.
+    """
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        headers: dict[str, str],
+        on_event: Callable[[str, Any], None],
+        on_connection_change: Callable[[bool], None],
+    ) -> None:
+        """Initialize the event stream."""
+        self._session = session
+        self._url = url
+        self._headers = {**headers, hdrs.ACCEPT: "text/event-stream"}
+        self._on_event = on_event
+        self._on_connection_change = on_connection_change
+        self.connected = False
+        self.supported: bool | None = None
+        self.reconnects = 0
+        self.events_received = 0
+        self.last_error: str | None = None
+        self._established = False
+
+    async def async_run(self) -> None:
+        """Run the stream until cancelled or unsupported."""
+        backoff = BACKOFF_MIN
+        while True:
+            self._established = False
+            try:
+                await self._async_listen()
+            except (aiohttp.ClientError, TimeoutError, ValueError) as err:
+                # ValueError: a line longer than the stream reader allows
+                self.last_error = str(err) or type(err).__name__
+                _LOGGER.debug("Gonzales event stream interrupted: %s", err)
+            finally:
+                # Also when cancelled or failing unexpectedly: the coordinator
+                # must not stay on the push cadence without a stream
+                self._set_connected(False)
+            if self.supported is False:
+                return
+            if self._established:
+                # Events came through: reconnect quickly. A stream that ends
+                # before its first event keeps backing off.
+                backoff = BACKOFF_MIN
+            await asyncio.sleep(backoff * random.uniform(0.5, 1.5))
+            backoff = min(backoff * 2, BACKOFF_MAX)
+            self.reconnects += 1
+
+    async def _async_listen(self) -> None:
+        """Connect once and dispatch events until the stream ends."""
+        async with self._session.get(
+            self._url,
+            headers=self._headers,
+            timeout=aiohttp.ClientTimeout(
+                total=None, sock_connect=10, sock_read=READ_TIMEOUT
+            ),
+        ) as resp:
+            if resp.status in UNSUPPORTED_STATUS:
+                _LOGGER.debug(
+                    "Gonzales backend has no event stream (HTTP %s), polling only",
+                    resp.status,
+                )
+                self.supported = False
+                return
+            if resp.status != 200:
+                self.last_error = f"HTTP {resp.status}"
+                return
+            self.supported = True
+            self._set_connected(True)
+
+            event = "message"
+            data: list[str] = []
+            async for raw in resp.content:
+                line = raw.decode("utf-8", errors="replace").rstrip("\r\n")
+                if not line:
+                    if data:
+                        self._dispatch(event, "\n".join(data))
+                    event, data = "message", []
+                elif line.startswith(":"):
+                    continue  # heartbeat / comment
+                else:
+                    field, _, value = line.partition(":")
+                    value = value.removeprefix(" ")
+                    if field == "event":
+                        event = value
+                    elif field == "data":
+                        data.append(value)
+
+    def _dispatch(self, event: str, raw: str) -> None:
+        """Decode and forward a single event."""
+        try:
+            payload = json_loads(raw)
+        except ValueError:
+            _LOGGER.debug("Ignoring malformed Gonzales event %s: %s", event, raw)
+            return
+        self.events_received += 1
+        self._established = True
+        self._on_event(event, payload)
+
+    def _set_connected(self, connected: bool) -> None:
+        """Track and report connection changes."""
+        if connected != self.connected:
+            self.connected = connected
+            self._on_connection_change(connected)
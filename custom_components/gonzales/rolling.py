@@ -0,0 +1,325 @@
+"""Rolling-window statistics over the recent speed test results."""
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import date, datetime
+import math
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+# Measurement fields tracked, by metric name
+METRICS: dict[str, str] = {
+    "download": "download_mbps",
+    "upload": "upload_mbps",
+    "ping": "ping_latency_ms",
+    "jitter": "ping_jitter_ms",
+}
+
+# Window name -> length (seconds)
+WINDOWS: dict[str, int] = {"24h": 86400, "7d": 7 * 86400}
+
+# Results kept: a week of tests at one every 2.5 minutes. With more
+# frequent tests the 7 day window covers the most recent CAPACITY only.
+CAPACITY = 4096
+
+# Percentiles come from log-spaced histogram bins; adjacent bins differ by
+# 2 %, which bounds the error of a reported percentile to about 1 %
+HISTOGRAM_MIN = 0.01
+HISTOGRAM_GROWTH = 1.02
+HISTOGRAM_BINS = 1000
+_LOG_GROWTH = math.log(HISTOGRAM_GROWTH)
+
+# Weight of the newest result in the moving average
+EWMA_ALPHA = 0.2
+
+
+def _bin(value: float) -> int:
+    """Return the histogram bin of a value."""
+    if value <= HISTOGRAM_MIN:
+        return 0
+    return min(
+        int(math.log(value / HISTOGRAM_MIN) / _LOG_GROWTH), HISTOGRAM_BINS - 1
+    )
+
+
+def _bin_value(index: int) -> float:
+    """Return the representative (geometric middle) value of a bin."""
+    return HISTOGRAM_MIN * HISTOGRAM_GROWTH ** (index + 0.5)
+
+
+@dataclass(frozen=True, slots=True)
+class MetricSummary:
+    """Rolling statistics of one metric."""
+
+    p5_24h: float | None = None
+    p50_24h: float | None = None
+    p95_24h: float | None = None
+    p50_7d: float | None = None
+    ewma: float | None = None
+    today_min: float | None = None
+    today_avg: float | None = None
+    today_max: float | None = None
+    today_count: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class RollingSummary:
+    """Rolling statistics of all metrics, as of the newest result."""
+
+    download: MetricSummary = MetricSummary()
+    upload: MetricSummary = MetricSummary()
+    ping: MetricSummary = MetricSummary()
+    jitter: MetricSummary = MetricSummary()
+
+
+class _WindowHistogram:
+    """Histogram of the values of one metric inside one window."""
+
+    __slots__ = ("counts", "count")
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        self.counts = array("I", bytes(4 * HISTOGRAM_BINS))
+        self.count = 0
+
+    def add(self, value: float) -> None:
+        """Count a value."""
+        self.counts[_bin(value)] += 1
+        self.count += 1
+
+    def remove(self, value: float) -> None:
+        """Forget a value counted before."""
+        self.counts[_bin(value)] -= 1
+        self.count -= 1
+
+    def percentiles(self, *ranks: int) -> list[float | None]:
+        """Return the nearest-rank percentiles, in one pass over the bins."""
+        if not self.count:
+            return [None] * len(ranks)
+        targets = [max(1, math.ceil(rank / 100 * self.count)) for rank in ranks]
+        results: list[float | None] = [None] * len(ranks)
+        seen = 0
+        pending = 0
+        for index, count in enumerate(self.counts):
+            if not count:
+                continue
+            seen += count
+            while pending < len(targets) and seen >= targets[pending]:
+                results[pending] = round(_bin_value(index), 2)
+                pending += 1
+            if pending == len(targets):
+                break
+        return results
+
+
+class RollingStats:
+    """Ring buffer of recent results with incrementally kept statistics.
+
+    Timestamps and one value per metric are stored in fixed-size arrays.
+    Each window keeps the sequence number of its oldest result and a
+    histogram per metric; adding a result counts it in and evicts what
+    fell out of the window, so the work per result is constant amortized
+    and memory is bounded by CAPACITY. Results must arrive oldest first.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty statistics."""
+        self._times = array("d", bytes(8 * CAPACITY))
+        self._values = {
+            metric: array("d", bytes(8 * CAPACITY)) for metric in METRICS
+        }
+        # Sequence number of the next result; slot = sequence % CAPACITY
+        self._head = 0
+        self._tails = dict.fromkeys(WINDOWS, 0)
+        self._histograms = {
+            window: {metric: _WindowHistogram() for metric in METRICS}
+            for window in WINDOWS
+        }
+        self._ewma: dict[str, float | None] = dict.fromkeys(METRICS)
+        self._day: date | None = None
+        self._daily: dict[str, list[float]] = {}
+        self._summary: RollingSummary | None = RollingSummary()
+
+    @property
+    def summary(self) -> RollingSummary:
+        """Return the statistics as of the newest result or expiry.
+
+        Percentiles scan the histogram bins, so they are computed on first
+        read after a change rather than for every result added.
+        """
+        if self._summary is None:
+            self._summary = self._summarize()
+        return self._summary
+
+    @property
+    def size(self) -> int:
+        """Return the number of results held."""
+        return min(self._head, CAPACITY)
+
+    @property
+    def newest(self) -> float | None:
+        """Return the timestamp of the newest result."""
+        if not self._head:
+            return None
+        return self._times[(self._head - 1) % CAPACITY]
+
+    def add(self, measurement: dict[str, Any] | None, measured: datetime) -> bool:
+        """Add a result. Return False if it is not newer than the last one."""
+        if not measurement:
+            return False
+        values = {}
+        for metric, field in METRICS.items():
+            value = measurement.get(field)
+            values[metric] = (
+                float(value) if isinstance(value, (int, float)) else math.nan
+            )
+        return self._add(measured.timestamp(), values)
+
+    def expire(self, now: datetime) -> bool:
+        """Drop what fell out of the windows by now; start a new day at midnight.
+
+        Between results the windows and today's aggregates would otherwise
+        keep showing results that are too old. Returns True if the
+        statistics changed.
+        """
+        tails = dict(self._tails)
+        timestamp = now.timestamp()
+        for window, length in WINDOWS.items():
+            self._expire(window, timestamp - length)
+        changed = self._tails != tails
+        day = dt_util.as_local(now).date()
+        if self._day is not None and day > self._day:
+            self._day = day
+            self._daily = {}
+            changed = True
+        if changed:
+            self._summary = None
+        return changed
+
+    def records(self) -> Iterator[tuple[float, dict[str, float]]]:
+        """Yield the held results, oldest first."""
+        for sequence in range(self._head - self.size, self._head):
+            slot = sequence % CAPACITY
+            yield self._times[slot], {
+                metric: values[slot] for metric, values in self._values.items()
+            }
+
+    def merge(self, other: RollingStats) -> None:
+        """Add the results of other that are newer than the newest here."""
+        for timestamp, values in other.records():
+            self._add(timestamp, values)
+
+    def _add(self, timestamp: float, values: dict[str, float]) -> bool:
+        """Add a result and update every statistic."""
+        if (newest := self.newest) is not None and timestamp <= newest:
+            return False
+        if self._head >= CAPACITY:
+            # The slot is reused: the oldest result leaves every window
+            self._evict(self._head - CAPACITY + 1)
+        slot = self._head % CAPACITY
+        self._times[slot] = timestamp
+        for metric, value in values.items():
+            self._values[metric][slot] = value
+            if math.isnan(value):
+                continue
+            for histograms in self._histograms.values():
+                histograms[metric].add(value)
+            ewma = self._ewma[metric]
+            self._ewma[metric] = (
+                value if ewma is None else ewma + EWMA_ALPHA * (value - ewma)
+            )
+        self._head += 1
+        for window, length in WINDOWS.items():
+            self._expire(window, timestamp - length)
+        self._add_daily(timestamp, values)
+        self._summary = None
+        return True
+
+    def _evict(self, before: int) -> None:
+        """Drop results with a sequence number below before from all windows."""
+        for window in WINDOWS:
+            self._drop(window, before)
+
+    def _expire(self, window: str, cutoff: float) -> None:
+        """Drop results older than cutoff from a window."""
+        tail = self._tails[window]
+        while tail < self._head and self._times[tail % CAPACITY] < cutoff:
+            tail += 1
+        self._drop(window, tail)
+
+    def _drop(self, window: str, until: int) -> None:
+        """Advance the oldest result of a window to sequence number until."""
+        histograms = self._histograms[window]
+        for sequence in range(self._tails[window], until):
+            slot = sequence % CAPACITY
+            for metric, values in self._values.items():
+                if not math.isnan(value := values[slot]):
+                    histograms[metric].remove(value)
+        self._tails[window] = max(self._tails[window], until)
+
+    def _add_daily(self, timestamp: float, values: dict[str, float]) -> None:
+        """Fold a result into the aggregates of its local day."""
+        day = dt_util.as_local(dt_util.utc_from_timestamp(timestamp)).date()
+        if self._day is not None and day < self._day:
+            # Measured before midnight, reported after: today has begun
+            return
+        if day != self._day:
+            self._day = day
+            self._daily = {}
+        for metric, value in values.items():
+            if math.isnan(value):
+                continue
+            if (daily := self._daily.get(metric)) is None:
+                self._daily[metric] = [value, value, value, 1]
+            else:
+                daily[0] = min(daily[0], value)
+                daily[1] += value
+                daily[2] = max(daily[2], value)
+                daily[3] += 1
+
+    def _summarize(self) -> RollingSummary:
+        """Compute the statistics from the histograms and aggregates."""
+        summaries = {}
+        for metric in METRICS:
+            p5, p50, p95 = self._histograms["24h"][metric].percentiles(5, 50, 95)
+            (week50,) = self._histograms["7d"][metric].percentiles(50)
+            ewma = self._ewma[metric]
+            daily = self._daily.get(metric)
+            summaries[metric] = MetricSummary(
+                p5_24h=p5,
+                p50_24h=p50,
+                p95_24h=p95,
+                p50_7d=week50,
+                ewma=round(ewma, 2) if ewma is not None else None,
+                today_min=round(daily[0], 2) if daily else None,
+                today_avg=round(daily[1] / daily[3], 2) if daily else None,
+                today_max=round(daily[2], 2) if daily else None,
+                today_count=int(daily[3]) if daily else 0,
+            )
+        return RollingSummary(**summaries)
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Return the buffer state for diagnostics."""
+        oldest = (
+            self._times[(self._head - self.size) % CAPACITY] if self._head else None
+        )
+        return {
+            "results": self.size,
+            "capacity": CAPACITY,
+            "oldest": (
+                dt_util.utc_from_timestamp(oldest).isoformat()
+                if oldest is not None
+                else None
+            ),
+            "newest": (
+                dt_util.utc_from_timestamp(self.newest).isoformat()
+                if self.newest is not None
+                else None
+            ),
+            "window_results": {
+                window: self._head - tail for window, tail in self._tails.items()
+            },
+        }
@@ -3,6 +3,9 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from dataclasses import dataclass
+from datetime import datetime
+from operator import attrgetter
+import time
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -14,190 +17,229 @@ from homeassistant.components.sensor import (
 from homeassistant.const import (
     EntityCategory,
     PERCENTAGE,
+    Platform,
     UnitOfDataRate,
     UnitOfInformation,
     UnitOfTime,
 )
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.helpers.event import async_track_time_change
+from homeassistant.util import dt as dt_util
 
+from .breaker import STATE_CLOSED, STATE_HALF_OPEN, STATE_OPEN
 from .const import DOMAIN
-from .coordinator import GonzalesConfigEntry, GonzalesCoordinator
+from .coordinator import (
+    PROFILE_SECTION,
+    ROLLING_SECTION,
+    GonzalesConfigEntry,
+    GonzalesCoordinator,
+)
+from .entity import GonzalesEntity
+from .model import GonzalesSnapshot
+from .profile import HourOfWeekProfile
+
+
+# Seconds after which a value within the deadband is published anyway
+DEADBAND_MAX_SILENCE = 21600
 
 
 @dataclass(frozen=True, kw_only=True)
 class GonzalesSensorEntityDescription(SensorEntityDescription):
     """Describe a Gonzales sensor."""
 
-    value_fn: Callable[[dict[str, Any]], float | int | str | None]
-
-
-def _measurement(data: dict[str, Any], key: str) -> float | None:
-    """Extract a value from the measurement data."""
-    m = data.get("measurement")
-    if m is None:
+    value_fn: Callable[[GonzalesSnapshot], datetime | float | int | str | None]
+    attributes_fn: Callable[[GonzalesSnapshot], dict[str, Any] | None] | None = None
+    # Coordinator section the value and attributes are read from
+    section: str
+    # Changed-section flag that writes the value, if not the section itself
+    changed_section: str | None = None
+    # Changes smaller than this, absolute or in percent of the published
+    # value, are held back until max_silence seconds have passed
+    deadband: float | None = None
+    deadband_pct: float | None = None
+    max_silence: int = DEADBAND_MAX_SILENCE
+
+
+def _download_attributes(s: GonzalesSnapshot) -> dict[str, Any] | None:
+    """Return the server and ISP of the latest measurement."""
+    if "measurement" not in s.present:
         return None
-    return m.get(key)
+    return {
+        "server": s.measurement.server_name,
+        "isp": s.measurement.isp,
+    }
 
 
-def _status(data: dict[str, Any], key: str) -> Any:
-    """Extract a value from the status data."""
-    s = data.get("status")
-    if s is None:
+def _isp_score_attributes(s: GonzalesSnapshot) -> dict[str, Any] | None:
+    """Return the grade and score breakdown."""
+    if not s.isp_score.has_breakdown:
         return None
-    return s.get(key)
-
-
-def _scheduler(data: dict[str, Any], key: str) -> Any:
-    """Extract a value from the scheduler data."""
-    s = data.get("status")
-    if s is None:
+    return {
+        "grade": s.isp_score.grade,
+        "speed_score": s.isp_score.speed_score,
+        "reliability_score": s.isp_score.reliability_score,
+        "latency_score": s.isp_score.latency_score,
+        "consistency_score": s.isp_score.consistency_score,
+    }
+
+
+def _smart_scheduler_attributes(s: GonzalesSnapshot) -> dict[str, Any] | None:
+    """Return the smart scheduler configuration and last decision."""
+    if "smart_scheduler" not in s.present:
         return None
-    sched = s.get("scheduler")
-    if sched is None:
-        return None
-    return sched.get(key)
+    return {
+        "enabled": s.smart_scheduler.enabled,
+        "base_interval_minutes": s.smart_scheduler.base_interval_minutes,
+        "last_decision_reason": s.smart_scheduler.last_decision_reason,
+    }
 
 
-def _smart_scheduler(data: dict[str, Any], key: str) -> Any:
-    """Extract a value from the smart scheduler data."""
-    ss = data.get("smart_scheduler")
-    if ss is None:
+def _network_health_attributes(s: GonzalesSnapshot) -> dict[str, Any] | None:
+    """Return a summary of the root-cause analysis."""
+    if "root_cause" not in s.present:
         return None
-    return ss.get(key)
-
-
-def _root_cause(data: dict[str, Any], key: str) -> Any:
-    """Extract a value from the root cause analysis data."""
-    rc = data.get("root_cause")
-    if rc is None:
+    rc = s.root_cause
+    return {
+        "primary_issue_category": rc.primary_issue if rc.has_primary_cause else None,
+        "primary_issue_severity": rc.primary_severity,
+        "primary_issue_confidence": rc.primary_confidence,
+        "issues_count": rc.issues_count,
+        "recommendations_count": rc.recommendations_count,
+    }
+
+
+def _primary_issue_attributes(s: GonzalesSnapshot) -> dict[str, Any] | None:
+    """Return the details of the primary cause."""
+    if not s.root_cause.has_primary_cause:
         return None
-    return rc.get(key)
-
-
-def _layer_score(data: dict[str, Any], layer: str) -> float | None:
-    """Extract a layer score from root cause analysis."""
-    rc = data.get("root_cause")
-    if rc is None:
-        return None
-    scores = rc.get("layer_scores")
-    if scores is None:
-        return None
-    return scores.get(layer)
+    return {
+        "severity": s.root_cause.primary_severity,
+        "confidence": s.root_cause.primary_confidence,
+        "description": s.root_cause.primary_description,
+        "occurrence_count": s.root_cause.primary_occurrence_count,
+    }
 
 
 MAIN_SENSORS: tuple[GonzalesSensorEntityDescription, ...] = (
     GonzalesSensorEntityDescription(
         key="download_speed",
+        section="measurement",
         translation_key="download_speed",
         device_class=SensorDeviceClass.DATA_RATE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfDataRate.MEGABITS_PER_SECOND,
         suggested_display_precision=1,
-        value_fn=lambda data: _measurement(data, "download_mbps"),
+        deadband_pct=1,
+        value_fn=lambda s: s.measurement.download_mbps,
+        attributes_fn=_download_attributes,
     ),
     GonzalesSensorEntityDescription(
         key="upload_speed",
+        section="measurement",
         translation_key="upload_speed",
         device_class=SensorDeviceClass.DATA_RATE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfDataRate.MEGABITS_PER_SECOND,
         suggested_display_precision=1,
-        value_fn=lambda data: _measurement(data, "upload_mbps"),
+        deadband_pct=1,
+        value_fn=lambda s: s.measurement.upload_mbps,
     ),
     GonzalesSensorEntityDescription(
         key="ping_latency",
+        section="measurement",
         translation_key="ping_latency",
         device_class=SensorDeviceClass.DURATION,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTime.MILLISECONDS,
         suggested_display_precision=1,
-        value_fn=lambda data: _measurement(data, "ping_latency_ms"),
+        value_fn=lambda s: s.measurement.ping_latency_ms,
     ),
     GonzalesSensorEntityDescription(
         key="ping_jitter",
+        section="measurement",
         translation_key="ping_jitter",
         device_class=SensorDeviceClass.DURATION,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTime.MILLISECONDS,
         suggested_display_precision=1,
-        value_fn=lambda data: _measurement(data, "ping_jitter_ms"),
+        value_fn=lambda s: s.measurement.ping_jitter_ms,
     ),
     GonzalesSensorEntityDescription(
         key="packet_loss",
+        section="measurement",
         translation_key="packet_loss",
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=PERCENTAGE,
         suggested_display_precision=1,
-        value_fn=lambda data: _measurement(data, "packet_loss_pct"),
+        value_fn=lambda s: s.measurement.packet_loss_pct,
     ),
     GonzalesSensorEntityDescription(
         key="last_test_time",
+        section="status",
         translation_key="last_test_time",
         device_class=SensorDeviceClass.TIMESTAMP,
-        value_fn=lambda data: _status(data, "last_test_time"),
+        value_fn=lambda s: s.status.last_test_time,
     ),
     GonzalesSensorEntityDescription(
         key="isp_score",
+        section="isp_score",
         translation_key="isp_score",
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement="points",
         suggested_display_precision=0,
         icon="mdi:speedometer",
-        value_fn=lambda data: (
-            data["isp_score"]["composite"]
-            if data.get("isp_score")
-            else None
-        ),
+        deadband=1,
+        value_fn=lambda s: s.isp_score.composite,
+        attributes_fn=_isp_score_attributes,
     ),
 )
 
 DIAGNOSTIC_SENSORS: tuple[GonzalesSensorEntityDescription, ...] = (
     GonzalesSensorEntityDescription(
         key="scheduler_running",
+        section="status",
         translation_key="scheduler_running",
         entity_category=EntityCategory.DIAGNOSTIC,
         icon="mdi:clock-check-outline",
-        value_fn=lambda data: (
-            "running" if _scheduler(data, "running") else "stopped"
-        ),
+        value_fn=lambda s: "running" if s.status.scheduler_running else "stopped",
     ),
     GonzalesSensorEntityDescription(
         key="test_in_progress",
+        section="status",
         translation_key="test_in_progress",
         entity_category=EntityCategory.DIAGNOSTIC,
         icon="mdi:progress-clock",
-        value_fn=lambda data: (
-            "yes" if _scheduler(data, "test_in_progress") else "no"
-        ),
+        value_fn=lambda s: "yes" if s.status.test_in_progress else "no",
     ),
     GonzalesSensorEntityDescription(
-        key="uptime",
-        translation_key="uptime",
-        device_class=SensorDeviceClass.DURATION,
+        key="started_at",
+        section="status",
+        translation_key="started_at",
+        device_class=SensorDeviceClass.TIMESTAMP,
         entity_category=EntityCategory.DIAGNOSTIC,
-        native_unit_of_measurement=UnitOfTime.SECONDS,
-        suggested_display_precision=0,
-        value_fn=lambda data: _status(data, "uptime_seconds"),
+        icon="mdi:restart",
+        value_fn=lambda s: s.status.started_at,
     ),
     GonzalesSensorEntityDescription(
         key="total_measurements",
+        section="status",
         translation_key="total_measurements",
         entity_category=EntityCategory.DIAGNOSTIC,
         state_class=SensorStateClass.TOTAL_INCREASING,
         icon="mdi:counter",
-        value_fn=lambda data: _status(data, "total_measurements"),
+        value_fn=lambda s: s.status.total_measurements,
     ),
     GonzalesSensorEntityDescription(
         key="db_size",
+        section="status",
         translation_key="db_size",
         device_class=SensorDeviceClass.DATA_SIZE,
         entity_category=EntityCategory.DIAGNOSTIC,
         native_unit_of_measurement=UnitOfInformation.BYTES,
         suggested_display_precision=0,
-        value_fn=lambda data: _status(data, "db_size_bytes"),
+        value_fn=lambda s: s.status.db_size_bytes,
     ),
 )
 
@@ -205,44 +247,42 @@ DIAGNOSTIC_SENSORS: tuple[GonzalesSensorEntityDescription, ...] = (
 SMART_SCHEDULER_SENSORS: tuple[GonzalesSensorEntityDescription, ...] = (
     GonzalesSensorEntityDescription(
         key="smart_scheduler_phase",
+        section="smart_scheduler",
         translation_key="smart_scheduler_phase",
         icon="mdi:auto-fix",
-        value_fn=lambda data: _smart_scheduler(data, "phase"),
+        value_fn=lambda s: s.smart_scheduler.phase,
+        attributes_fn=_smart_scheduler_attributes,
     ),
     GonzalesSensorEntityDescription(
         key="smart_scheduler_stability",
+        section="smart_scheduler",
         translation_key="smart_scheduler_stability",
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=PERCENTAGE,
         suggested_display_precision=0,
         icon="mdi:signal-cellular-3",
-        value_fn=lambda data: (
-            round(_smart_scheduler(data, "stability_score") * 100)
-            if _smart_scheduler(data, "stability_score") is not None
-            else None
-        ),
+        deadband=2,
+        value_fn=lambda s: s.smart_scheduler.stability_pct,
     ),
     GonzalesSensorEntityDescription(
         key="smart_scheduler_interval",
+        section="smart_scheduler",
         translation_key="smart_scheduler_interval",
         device_class=SensorDeviceClass.DURATION,
         native_unit_of_measurement=UnitOfTime.MINUTES,
         suggested_display_precision=0,
         icon="mdi:timer-outline",
-        value_fn=lambda data: _smart_scheduler(data, "current_interval_minutes"),
+        value_fn=lambda s: s.smart_scheduler.interval_minutes,
     ),
     GonzalesSensorEntityDescription(
         key="smart_scheduler_data_used",
+        section="smart_scheduler",
         translation_key="smart_scheduler_data_used",
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=PERCENTAGE,
         suggested_display_precision=0,
         icon="mdi:database",
-        value_fn=lambda data: (
-            round(100 - (_smart_scheduler(data, "data_budget_remaining_pct") or 100))
-            if _smart_scheduler(data, "enabled")
-            else None
-        ),
+        value_fn=lambda s: s.smart_scheduler.data_used_pct,
     ),
 )
 
@@ -250,66 +290,195 @@ SMART_SCHEDULER_SENSORS: tuple[GonzalesSensorEntityDescription, ...] = (
 ROOT_CAUSE_SENSORS: tuple[GonzalesSensorEntityDescription, ...] = (
     GonzalesSensorEntityDescription(
         key="network_health_score",
+        section="root_cause",
         translation_key="network_health_score",
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement="points",
         suggested_display_precision=0,
         icon="mdi:heart-pulse",
-        value_fn=lambda data: _root_cause(data, "network_health_score"),
+        deadband=2,
+        value_fn=lambda s: s.root_cause.network_health_score,
+        attributes_fn=_network_health_attributes,
     ),
     GonzalesSensorEntityDescription(
         key="primary_issue",
+        section="root_cause",
         translation_key="primary_issue",
         icon="mdi:alert-circle-outline",
-        value_fn=lambda data: (
-            _root_cause(data, "primary_cause").get("category")
-            if _root_cause(data, "primary_cause")
-            else "none"
-        ),
+        value_fn=lambda s: s.root_cause.primary_issue,
+        attributes_fn=_primary_issue_attributes,
     ),
     GonzalesSensorEntityDescription(
         key="dns_health",
+        section="root_cause",
         translation_key="dns_health",
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement="points",
         suggested_display_precision=0,
         icon="mdi:dns",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda data: _layer_score(data, "dns_score"),
+        deadband=2,
+        value_fn=lambda s: s.root_cause.dns_score,
     ),
     GonzalesSensorEntityDescription(
         key="local_network_health",
+        section="root_cause",
         translation_key="local_network_health",
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement="points",
         suggested_display_precision=0,
         icon="mdi:lan",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda data: _layer_score(data, "local_network_score"),
+        deadband=2,
+        value_fn=lambda s: s.root_cause.local_network_score,
     ),
     GonzalesSensorEntityDescription(
         key="isp_backbone_health",
+        section="root_cause",
         translation_key="isp_backbone_health",
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement="points",
         suggested_display_precision=0,
         icon="mdi:server-network",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda data: _layer_score(data, "isp_backbone_score"),
+        deadband=2,
+        value_fn=lambda s: s.root_cause.isp_backbone_score,
     ),
     GonzalesSensorEntityDescription(
         key="isp_lastmile_health",
+        section="root_cause",
         translation_key="isp_lastmile_health",
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement="points",
         suggested_display_precision=0,
         icon="mdi:home-city-outline",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda data: _layer_score(data, "isp_lastmile_score"),
+        deadband=2,
+        value_fn=lambda s: s.root_cause.isp_lastmile_score,
     ),
 )
 
-ALL_SENSORS = MAIN_SENSORS + DIAGNOSTIC_SENSORS + SMART_SCHEDULER_SENSORS + ROOT_CAUSE_SENSORS
+
+def _today_attributes(
+    metric: str,
+) -> Callable[[GonzalesSnapshot], dict[str, Any] | None]:
+    """Return a builder of today's minimum, maximum and test count."""
+
+    def _attributes(s: GonzalesSnapshot) -> dict[str, Any] | None:
+        summary = getattr(s.rolling, metric)
+        if not summary.today_count:
+            return None
+        return {
+            "min": summary.today_min,
+            "max": summary.today_max,
+            "tests": summary.today_count,
+        }
+
+    return _attributes
+
+
+# Metric -> device class and unit of its rolling statistics
+ROLLING_METRICS: dict[str, tuple[SensorDeviceClass, str]] = {
+    "download": (SensorDeviceClass.DATA_RATE, UnitOfDataRate.MEGABITS_PER_SECOND),
+    "upload": (SensorDeviceClass.DATA_RATE, UnitOfDataRate.MEGABITS_PER_SECOND),
+    "ping": (SensorDeviceClass.DURATION, UnitOfTime.MILLISECONDS),
+    "jitter": (SensorDeviceClass.DURATION, UnitOfTime.MILLISECONDS),
+}
+ROLLING_STATISTICS = ("p5_24h", "p50_24h", "p95_24h", "p50_7d", "ewma", "today_avg")
+
+# Percentiles, trend and daily average kept from the measurement stream;
+# jitter statistics are disabled by default
+ROLLING_SENSORS: tuple[GonzalesSensorEntityDescription, ...] = tuple(
+    GonzalesSensorEntityDescription(
+        key=f"{metric}_{statistic}",
+        section="measurement",
+        changed_section=ROLLING_SECTION,
+        translation_key=f"{metric}_{statistic}",
+        device_class=device_class,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=unit,
+        suggested_display_precision=1,
+        entity_registry_enabled_default=metric != "jitter",
+        value_fn=attrgetter(f"rolling.{metric}.{statistic}"),
+        attributes_fn=(
+            _today_attributes(metric) if statistic == "today_avg" else None
+        ),
+    )
+    for metric, (device_class, unit) in ROLLING_METRICS.items()
+    for statistic in ROLLING_STATISTICS
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class GonzalesProfileSensorEntityDescription(SensorEntityDescription):
+    """Describes a sensor read from the hour-of-week profile."""
+
+    value_fn: Callable[[HourOfWeekProfile, datetime], datetime | float | None]
+    attributes_fn: Callable[[HourOfWeekProfile, datetime], dict[str, Any] | None]
+
+
+def _expected_now_attributes(
+    profile: HourOfWeekProfile, now: datetime
+) -> dict[str, Any] | None:
+    """Return the expected upload and ping of the current hour."""
+    hour = profile.at(now)
+    if not hour.tests:
+        return None
+    return {
+        "expected_upload_mbps": hour.upload,
+        "expected_ping_ms": hour.ping,
+        "tests": hour.tests,
+    }
+
+
+def _best_window_start(profile: HourOfWeekProfile, now: datetime) -> datetime | None:
+    """Return the start of the coming hour with the best download."""
+    best = profile.best_window(now)
+    return best[0] if best else None
+
+
+def _best_window_attributes(
+    profile: HourOfWeekProfile, now: datetime
+) -> dict[str, Any] | None:
+    """Return the expected download and ping of the best hour."""
+    if (best := profile.best_window(now)) is None:
+        return None
+    return {
+        "expected_download_mbps": best[1].download,
+        "expected_ping_ms": best[1].ping,
+    }
+
+
+# Expectations for the current and coming hours, from the hour-of-week
+# profile of all tests
+PROFILE_SENSORS: tuple[GonzalesProfileSensorEntityDescription, ...] = (
+    GonzalesProfileSensorEntityDescription(
+        key="expected_download_now",
+        translation_key="expected_download_now",
+        device_class=SensorDeviceClass.DATA_RATE,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfDataRate.MEGABITS_PER_SECOND,
+        suggested_display_precision=1,
+        value_fn=lambda profile, now: profile.at(now).download,
+        attributes_fn=_expected_now_attributes,
+    ),
+    GonzalesProfileSensorEntityDescription(
+        key="best_download_window",
+        translation_key="best_download_window",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        icon="mdi:calendar-clock",
+        value_fn=_best_window_start,
+        attributes_fn=_best_window_attributes,
+    ),
+)
+
+ALL_SENSORS = (
+    MAIN_SENSORS
+    + DIAGNOSTIC_SENSORS
+    + SMART_SCHEDULER_SENSORS
+    + ROOT_CAUSE_SENSORS
+    + ROLLING_SENSORS
+)
 
 
 async def async_setup_entry(
@@ -319,17 +488,45 @@ async def async_setup_entry(
 ) -> None:
     """Set up Gonzales sensors from a config entry."""
     coordinator = entry.runtime_data
-    async_add_entities(
+    # The uptime counter was replaced by the started_at timestamp
+    registry = er.async_get(hass)
+    if entity_id := registry.async_get_entity_id(
+        Platform.SENSOR, DOMAIN, f"{entry.entry_id}_uptime"
+    ):
+        registry.async_remove(entity_id)
+    entities: list[SensorEntity] = [
         GonzalesSensor(coordinator, description)
         for description in ALL_SENSORS
+        if coordinator.supports(description.section)
+    ]
+    entities.extend(
+        GonzalesProfileSensor(coordinator, description)
+        for description in PROFILE_SENSORS
     )
+    entities.append(GonzalesConnectionSensor(coordinator))
+    async_add_entities(entities)
 
 
-class GonzalesSensor(CoordinatorEntity[GonzalesCoordinator], SensorEntity):
+class GonzalesSensor(GonzalesEntity, SensorEntity):
     """Representation of a Gonzales sensor."""
 
     entity_description: GonzalesSensorEntityDescription
-    _attr_has_entity_name = True
+    # Free text and root-cause details change with every analysis; keep
+    # them in the state, but out of the recorder database
+    _unrecorded_attributes = GonzalesEntity._unrecorded_attributes | frozenset(
+        {
+            "last_decision_reason",
+            "primary_issue_category",
+            "primary_issue_severity",
+            "primary_issue_confidence",
+            "issues_count",
+            "recommendations_count",
+            "severity",
+            "confidence",
+            "description",
+            "occurrence_count",
+        }
+    )
 
     def __init__(
         self,
@@ -337,79 +534,172 @@ class GonzalesSensor(CoordinatorEntity[GonzalesCoordinator], SensorEntity):
         entity_description: GonzalesSensorEntityDescription,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, (entity_description.section,))
         self.entity_description = entity_description
         self._attr_unique_id = (
             f"{coordinator.config_entry.entry_id}_{entity_description.key}"
         )
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, coordinator.config_entry.entry_id)},
-            name="Gonzales",
-            manufacturer="Gonzales",
-            model="Internet Speed Monitor",
-            entry_type=DeviceEntryType.SERVICE,
+        self._published: datetime | float | int | str | None = None
+        self._published_at: float | None = None
+
+    @property
+    def native_value(self) -> datetime | float | int | str | None:
+        """Return the sensor value, held while it moves within the deadband."""
+        if self._published_at is not None:
+            return self._published
+        return self.entity_description.value_fn(self.coordinator.snapshot)
+
+    def _sections_changed(self) -> bool:
+        """Return True if the value moved beyond the deadband.
+
+        A held value is published once max_silence has passed. Attributes
+        are written together with the value.
+        """
+        description = self.entity_description
+        if description.changed_section is not None:
+            if description.changed_section not in self.coordinator.changed_sections:
+                return False
+        elif not super()._sections_changed():
+            return False
+        if description.deadband is None and description.deadband_pct is None:
+            return True
+        value = description.value_fn(self.coordinator.snapshot)
+        now = time.monotonic()
+        if (
+            self._published_at is not None
+            and now - self._published_at < description.max_silence
+            and self._within_deadband(value)
+        ):
+            return False
+        self._published = value
+        self._published_at = now
+        return True
+
+    def _within_deadband(self, value: Any) -> bool:
+        """Return True if value differs negligibly from the published one."""
+        published = self._published
+        if not isinstance(value, (int, float)) or not isinstance(
+            published, (int, float)
+        ):
+            return value == published
+        delta = abs(value - published)
+        description = self.entity_description
+        if description.deadband is not None and delta < description.deadband:
+            return True
+        return (
+            description.deadband_pct is not None
+            and delta < abs(published) * description.deadband_pct / 100
         )
 
     @property
-    def native_value(self) -> float | int | str | None:
-        """Return the sensor value."""
-        if self.coordinator.data is None:
+    def _section_attributes(self) -> dict[str, Any] | None:
+        """Return the attributes declared by the description."""
+        if self.entity_description.attributes_fn is None:
             return None
-        return self.entity_description.value_fn(self.coordinator.data)
+        return self.entity_description.attributes_fn(self.coordinator.snapshot)
+
+
+class GonzalesProfileSensor(GonzalesEntity, SensorEntity):
+    """Sensor read from the hour-of-week profile.
+
+    Written when new tests or the history update the profile and at
+    every full hour, when the current hour moves on to the next bucket.
+    """
+
+    entity_description: GonzalesProfileSensorEntityDescription
+    _sections = ("measurement",)
+
+    def __init__(
+        self,
+        coordinator: GonzalesCoordinator,
+        entity_description: GonzalesProfileSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self.entity_description = entity_description
+        self._attr_unique_id = (
+            f"{coordinator.config_entry.entry_id}_{entity_description.key}"
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Start the hourly update."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_track_time_change(
+                self.hass, self._async_hour_started, minute=0, second=0
+            )
+        )
+
+    def _sections_changed(self) -> bool:
+        """Return True if the last update changed the profile."""
+        return PROFILE_SECTION in self.coordinator.changed_sections
+
+    @callback
+    def _async_hour_started(self, now: datetime) -> None:
+        """Write the values for the new hour."""
+        self.async_write_ha_state()
+
+    @property
+    def available(self) -> bool:
+        """Stay available while the backend is not; the profile is local."""
+        return True
+
+    @property
+    def native_value(self) -> datetime | float | None:
+        """Return the value for the current hour."""
+        return self.entity_description.value_fn(
+            self.coordinator.profile, dt_util.now()
+        )
 
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return additional state attributes for measurement sensors."""
-        if self.coordinator.data is None:
-            return None
-        if self.entity_description.key == "isp_score":
-            isp = self.coordinator.data.get("isp_score")
-            if isp and "breakdown" in isp:
-                return {
-                    "grade": isp.get("grade"),
-                    "speed_score": isp["breakdown"].get("speed_score"),
-                    "reliability_score": isp["breakdown"].get(
-                        "reliability_score"
-                    ),
-                    "latency_score": isp["breakdown"].get("latency_score"),
-                    "consistency_score": isp["breakdown"].get(
-                        "consistency_score"
-                    ),
-                }
-        if self.entity_description.key == "download_speed":
-            m = self.coordinator.data.get("measurement")
-            if m:
-                return {
-                    "server": m.get("server_name"),
-                    "isp": m.get("isp"),
-                }
-        if self.entity_description.key == "smart_scheduler_phase":
-            ss = self.coordinator.data.get("smart_scheduler")
-            if ss:
-                return {
-                    "enabled": ss.get("enabled"),
-                    "base_interval_minutes": ss.get("base_interval_minutes"),
-                    "last_decision_reason": ss.get("last_decision_reason"),
-                }
-        if self.entity_description.key == "network_health_score":
-            rc = self.coordinator.data.get("root_cause")
-            if rc:
-                primary = rc.get("primary_cause")
-                return {
-                    "primary_issue_category": primary.get("category") if primary else None,
-                    "primary_issue_severity": primary.get("severity") if primary else None,
-                    "primary_issue_confidence": primary.get("confidence") if primary else None,
-                    "issues_count": len(rc.get("secondary_causes", [])) + (1 if primary else 0),
-                    "recommendations_count": len(rc.get("recommendations", [])),
-                }
-        if self.entity_description.key == "primary_issue":
-            rc = self.coordinator.data.get("root_cause")
-            if rc and rc.get("primary_cause"):
-                cause = rc["primary_cause"]
-                return {
-                    "severity": cause.get("severity"),
-                    "confidence": cause.get("confidence"),
-                    "description": cause.get("description"),
-                    "occurrence_count": cause.get("occurrence_count"),
-                }
-        return None
+        """Return the details of the current or best hour."""
+        return self.entity_description.attributes_fn(
+            self.coordinator.profile, dt_util.now()
+        )
+
+
+class GonzalesConnectionSensor(GonzalesEntity, SensorEntity):
+    """State of the circuit breaker guarding the backend connection."""
+
+    _attr_translation_key = "connection_state"
+    _attr_device_class = SensorDeviceClass.ENUM
+    _attr_options = [STATE_CLOSED, STATE_HALF_OPEN, STATE_OPEN]
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_icon = "mdi:lan-connect"
+
+    def __init__(self, coordinator: GonzalesCoordinator) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._attr_unique_id = (
+            f"{coordinator.config_entry.entry_id}_connection_state"
+        )
+        self._written_breaker: tuple[str, int] | None = None
+
+    @property
+    def available(self) -> bool:
+        """Stay available while the backend is not."""
+        return True
+
+    @property
+    def native_value(self) -> str:
+        """Return the breaker state."""
+        return self.coordinator.breaker.state
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the failure count and current backoff."""
+        breaker = self.coordinator.breaker
+        return {
+            "consecutive_failures": breaker.failures,
+            "backoff_seconds": round(breaker.backoff),
+        }
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only if the breaker changed."""
+        breaker = self.coordinator.breaker
+        state = (breaker.state, breaker.failures)
+        if state != self._written_breaker:
+            self._written_breaker = state
+            self.async_write_ha_state()
@@ -0,0 +1,183 @@
+"""HTTP session with its own connection pool for a Gonzales backend."""
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+import logging
+import socket
+from types import SimpleNamespace
+from typing import Any
+
+import aiohttp
+from aiohttp import hdrs
+from aiohttp.abc import AbstractResolver
+from aiohttp.resolver import DefaultResolver
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import SERVER_SOFTWARE
+from homeassistant.helpers.hassio import is_hassio
+from homeassistant.helpers.json import json_dumps
+
+_LOGGER = logging.getLogger(__name__)
+
+# One cycle requests every endpoint at once, next to the event stream
+CONNECTION_LIMIT = 6
+
+# Idle connections outlive the status interval and are reused next cycle
+KEEPALIVE_TIMEOUT = 60
+
+# Seconds a resolved address of the backend host is reused
+DNS_CACHE_TTL = 300
+
+
+@dataclass(slots=True)
+class ConnectionStats:
+    """Connection pool counters of a backend session."""
+
+    requests: int = 0
+    connections_created: int = 0
+    connections_reused: int = 0
+    dns_cache_hits: int = 0
+    dns_cache_misses: int = 0
+    dns_fallbacks: int = 0
+
+
+class GonzalesResolver(AbstractResolver):
+    """Resolve the backend host, falling back when name resolution fails.
+
+    Add-on hostnames such as ``local-gonzales`` are answered by the
+    Supervisor's DNS, which is briefly unavailable while it restarts. The
+    last good answer is reused then, or else the add-on's IP address as
+    reported by the Supervisor.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, host: str, stats: ConnectionStats
+    ) -> None:
+        """Initialize the resolver."""
+        self._hass = hass
+        self._host = host
+        self._stats = stats
+        self._resolver = DefaultResolver()
+        self._last: list[dict[str, Any]] | None = None
+
+    async def resolve(
+        self, host: str, port: int = 0, family: int = socket.AF_INET
+    ) -> list[dict[str, Any]]:
+        """Resolve a host name."""
+        try:
+            result = await self._resolver.resolve(host, port, family)
+        except OSError as err:
+            if host != self._host:
+                raise
+            fallback = self._last or await self._async_supervisor_address(port)
+            if not fallback:
+                raise
+            _LOGGER.debug(
+                "Resolving %s failed (%s), using %s",
+                host,
+                err,
+                [address["host"] for address in fallback],
+            )
+            self._stats.dns_fallbacks += 1
+            return fallback
+        if host == self._host:
+            self._last = result
+        return result
+
+    async def _async_supervisor_address(self, port: int) -> list[dict[str, Any]]:
+        """Return the add-on's IP address as known to the Supervisor.
+
+        The Supervisor client is imported here: it only exists on Supervisor
+        installations, and its API moves between Home Assistant releases.
+        Without it, resolution stays plain DNS.
+        """
+        if not is_hassio(self._hass):
+            return []
+        try:
+            from aiohasupervisor import SupervisorError
+
+            from homeassistant.components.hassio import get_supervisor_client
+        except ImportError:
+            return []
+        try:
+            info = await get_supervisor_client(self._hass).addons.addon_info(
+                self._host.replace("-", "_")
+            )
+        except SupervisorError:
+            return []
+        if not (address := getattr(info, "ip_address", None)):
+            return []
+        return [
+            {
+                "hostname": self._host,
+                "host": str(address),
+                "port": port,
+                "family": socket.AF_INET,
+                "proto": 0,
+                "flags": socket.AI_NUMERICHOST,
+            }
+        ]
+
+    async def close(self) -> None:
+        """Release the wrapped resolver."""
+        await self._resolver.close()
+
+
+class GonzalesSession:
+    """Client session owned by one config entry.
+
+    Keeps connections to the single backend host alive between cycles,
+    bounded so a slow backend cannot take more, and caches its address.
+    Connection reuse is counted for diagnostics.
+    """
+
+    def __init__(self, hass: HomeAssistant, host: str) -> None:
+        """Create the session; must run in the event loop."""
+        self.stats = ConnectionStats()
+        self._resolver = GonzalesResolver(hass, host, self.stats)
+        trace = aiohttp.TraceConfig()
+        trace.on_request_start.append(self._counter("requests"))
+        trace.on_connection_create_end.append(self._counter("connections_created"))
+        trace.on_connection_reuseconn.append(self._counter("connections_reused"))
+        trace.on_dns_cache_hit.append(self._counter("dns_cache_hits"))
+        trace.on_dns_cache_miss.append(self._counter("dns_cache_misses"))
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=CONNECTION_LIMIT,
+                limit_per_host=CONNECTION_LIMIT,
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
+                use_dns_cache=True,
+                ttl_dns_cache=DNS_CACHE_TTL,
+                resolver=self._resolver,
+            ),
+            headers={hdrs.USER_AGENT: SERVER_SOFTWARE},
+            json_serialize=json_dumps,
+            trace_configs=[trace],
+        )
+
+    async def async_close(self) -> None:
+        """Close the session and its connections."""
+        await self.session.close()
+        await self._resolver.close()
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Return connection reuse counters for diagnostics."""
+        stats = asdict(self.stats)
+        connections = self.stats.connections_created + self.stats.connections_reused
+        stats["reuse_ratio"] = (
+            round(self.stats.connections_reused / connections, 3)
+            if connections
+            else None
+        )
+        return stats
+
+    def _counter(self, field: str) -> Callable[..., Awaitable[None]]:
+        """Return a trace callback incrementing a stats field."""
+
+        async def _count(
+            session: aiohttp.ClientSession, context: SimpleNamespace, params: Any
+        ) -> None:
+            setattr(self.stats, field, getattr(self.stats, field) + 1)
+
+        return _count
@@ -0,0 +1,184 @@
+"""Fixtures for the Gonzales tests."""
+from __future__ import annotations
+
+from collections.abc import AsyncGenerator, Awaitable, Callable, Generator
+from datetime import datetime, timedelta
+from typing import Any
+from unittest.mock import patch
+
+from aiohttp import ThreadedResolver, web
+from aiohttp.test_utils import TestServer
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.const import CONF_HOST, CONF_PORT
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.gonzales.const import CONF_PUSH_UPDATES, DOMAIN
+from custom_components.gonzales.coordinator import (
+    ENDPOINTS_BY_KEY,
+    GonzalesCoordinator,
+)
+
+API = "/api/v1"
+
+STATUS = {
+    "version": "3.9.0",
+    "features": [],
+    "uptime_seconds": 3600,
+    "total_measurements": 42,
+    "scheduler": {"running": True, "test_in_progress": False},
+}
+MEASUREMENT = {
+    "id": 42,
+    "timestamp": "2024-12-02T10:00:00+00:00",
+    "download_mbps": 250.5,
+    "upload_mbps": 40.2,
+    "ping_latency_ms": 12.3,
+    "ping_jitter_ms": 1.1,
+    "packet_loss_pct": 0.0,
+    "server_name": "Frankfurt",
+    "isp": "Example ISP",
+}
+ISP_SCORE = {"isp_score": {"composite": 87.5, "grade": "B+"}}
+SMART_SCHEDULER = {"enabled": True, "phase": "stable", "stability_score": 91.0}
+ROOT_CAUSE = {"network_health_score": 93.0, "recommendations": []}
+
+Handler = Callable[[web.Request], Awaitable[web.StreamResponse] | Any]
+
+
+class Backend:
+    """Stand-in Gonzales backend recording the requests it answers.
+
+    Routes answer from ``handlers``, keyed by method and path below
+    /api/v1: a callable gets the request, an int is answered as that
+    status, anything else as JSON.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the default answers."""
+        self.status = dict(STATUS)
+        self.handlers: dict[tuple[str, str], Any] = {
+            ("GET", "/status"): lambda request: self.status,
+            ("GET", "/measurements/latest"): MEASUREMENT,
+            ("GET", "/statistics/enhanced"): ISP_SCORE,
+            ("GET", "/smart-scheduler/status"): SMART_SCHEDULER,
+            ("GET", "/root-cause/analysis"): ROOT_CAUSE,
+            ("GET", "/measurements"): self._history_page,
+        }
+        # Measurement history, oldest first
+        self.history: list[dict[str, Any]] = []
+        self.requests: list[str] = []
+        self.server: TestServer | None = None
+
+    @property
+    def port(self) -> int:
+        """Return the port the server listens on."""
+        assert self.server is not None
+        return self.server.port
+
+    def paths(self) -> list[str]:
+        """Return the requested paths with query, without the API prefix."""
+        return [path.removeprefix(API) for path in self.requests]
+
+    def _history_page(self, request: web.Request) -> dict[str, Any]:
+        """Answer a page of the measurement history."""
+        items = self.history
+        if since := request.query.get("start_date"):
+            start = dt_util.parse_datetime(since)
+            items = [
+                item
+                for item in items
+                if dt_util.parse_datetime(item["timestamp"]) >= start
+            ]
+        size = int(request.query["page_size"])
+        page = int(request.query["page"])
+        return {
+            "items": items[(page - 1) * size : page * size],
+            "pages": max(1, -(-len(items) // size)),
+        }
+
+    async def handle(self, request: web.Request) -> web.StreamResponse:
+        """Answer a request from the handlers."""
+        self.requests.append(request.path_qs)
+        path = request.path.removeprefix(API)
+        answer = self.handlers.get((request.method, path))
+        if answer is None:
+            return web.Response(status=404)
+        if callable(answer):
+            answer = answer(request)
+            if isinstance(answer, Awaitable):
+                answer = await answer
+        if isinstance(answer, web.StreamResponse):
+            return answer
+        if isinstance(answer, int):
+            return web.Response(status=answer)
+        return web.json_response(answer)
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations: None) -> None:
+    """Load the integration from custom_components."""
+
+
+@pytest.fixture(autouse=True)
+def threaded_resolver() -> Generator[None]:
+    """Resolve without aiodns, whose shutdown thread outlives the test."""
+    with patch("custom_components.gonzales.session.DefaultResolver", ThreadedResolver):
+        yield
+
+
+@pytest.fixture
+async def backend(aiohttp_server: Any, socket_enabled: None) -> Backend:
+    """Return a running stand-in backend."""
+    backend = Backend()
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", backend.handle)
+    backend.server = await aiohttp_server(app)
+    return backend
+
+
+@pytest.fixture
+def config_entry(hass: HomeAssistant, backend: Backend) -> MockConfigEntry:
+    """Return a config entry pointing at the stand-in backend."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_HOST: "127.0.0.1", CONF_PORT: backend.port},
+        options={CONF_PUSH_UPDATES: False},
+    )
+    entry.add_to_hass(hass)
+    return entry
+
+
+@pytest.fixture
+async def coordinator(
+    hass: HomeAssistant, config_entry: MockConfigEntry
+) -> AsyncGenerator[GonzalesCoordinator]:
+    """Return a coordinator of the config entry, closed after the test."""
+    coordinator = GonzalesCoordinator(hass, config_entry)
+    yield coordinator
+    await coordinator.async_shutdown()
+    await coordinator.async_close()
+
+
+def subscribe(coordinator: GonzalesCoordinator, *sections: str) -> None:
+    """Register sections the way entities do, then let every section load.
+
+    Without sections, every section is registered.
+    """
+    coordinator.async_add_listener(lambda: None, sections or tuple(ENDPOINTS_BY_KEY))
+    coordinator._platforms_ready = True
+
+
+def history(end: datetime, hours: int) -> list[dict[str, Any]]:
+    """Return hourly measurements up to end, oldest first."""
+    return [
+        {
+            **MEASUREMENT,
+            "id": index,
+            "timestamp": (end - timedelta(hours=hours - index)).isoformat(),
+            "download_mbps": 100.0 + index % 24,
+        }
+        for index in range(1, hours + 1)
+    ]
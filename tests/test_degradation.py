@@ -0,0 +1,178 @@
+"""Replay tests for the Gonzales degradation detector."""
+from __future__ import annotations
+
+import csv
+from datetime import datetime, timedelta
+from pathlib import Path
+import statistics
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.gonzales.degradation import (
+    METRICS,
+    RELEARN_AFTER,
+    DegradationDetector,
+    DegradationState,
+)
+
+# Six weeks of hourly results per line type: a steady fibre line, a DSL
+# line with evening congestion and a noisy, lossy LTE link
+TRACES = ("fibre", "dsl", "lte")
+FIXTURES = Path(__file__).parent / "fixtures" / "degradation"
+START = datetime(2024, 10, 7, tzinfo=dt_util.UTC)
+
+# Result at which a shift is injected, after four weeks of baseline
+SHIFT_AT = 700
+# Results after the shift by which the alarm must be raised
+MAX_DELAY = 6
+# How far before the shift the reported onset may lie: noise can start
+# the excursion a few results early
+MAX_EARLY_ONSET = timedelta(hours=12)
+# Alarms allowed on a trace without a shift
+MAX_FALSE_ALARM_RATE = 1 / 400
+
+
+class FakeStore:
+    """In-memory stand-in for the Home Assistant store."""
+
+    def __init__(self) -> None:
+        """Initialize an empty store."""
+        self.data: dict[str, Any] | None = None
+
+    async def async_load(self) -> dict[str, Any] | None:
+        """Return the saved data."""
+        return self.data
+
+    async def async_save(self, data: dict[str, Any]) -> None:
+        """Save data."""
+        self.data = data
+
+    def async_delay_save(self, data_func: Any, delay: float) -> None:
+        """Save at once; the delay does not matter here."""
+        self.data = data_func()
+
+
+def _load(name: str) -> list[dict[str, float]]:
+    """Return the results of a recorded trace."""
+    with (FIXTURES / f"{name}.csv").open(newline="") as file:
+        return [
+            {key: float(value) for key, value in row.items()}
+            for row in csv.DictReader(file)
+        ]
+
+
+def _detector(store: FakeStore) -> DegradationDetector:
+    """Return a detector saving to store."""
+    with patch(
+        "custom_components.gonzales.degradation.degradation_store",
+        return_value=store,
+    ):
+        return DegradationDetector(None, "entry")
+
+
+def _replay(
+    detector: DegradationDetector, rows: list[dict[str, float]]
+) -> list[tuple[int, DegradationState]]:
+    """Feed results to the detector; return the hour and state of each alarm."""
+    alarms: list[tuple[int, DegradationState]] = []
+    for row in rows:
+        measurement = dict(row)
+        hour = int(measurement.pop("hour"))
+        raised = not detector.state.detected
+        detector.update(measurement, START + timedelta(hours=hour))
+        if raised and detector.state.detected:
+            alarms.append((hour, detector.state))
+    return alarms
+
+
+def _shifted(
+    rows: list[dict[str, float]],
+    field: str,
+    size: float,
+    until: float = float("inf"),
+) -> list[dict[str, float]]:
+    """Return the trace with size added to a field from SHIFT_AT to until."""
+    return [
+        {**row, field: row[field] + size}
+        if SHIFT_AT <= row["hour"] < until
+        else row
+        for row in rows
+    ]
+
+
+@pytest.mark.parametrize("trace", TRACES)
+def test_stationary_trace_false_alarms(trace: str) -> None:
+    """A line without a shift raises at most a rare alarm."""
+    rows = _load(trace)
+    alarms = _replay(_detector(FakeStore()), rows)
+
+    assert len(alarms) <= len(rows) * MAX_FALSE_ALARM_RATE
+
+
+@pytest.mark.parametrize("metric", list(METRICS))
+@pytest.mark.parametrize("trace", TRACES)
+def test_injected_shift_is_detected(trace: str, metric: str) -> None:
+    """A sustained shift raises an alarm for its metric within a few results."""
+    rows = _load(trace)
+    field = METRICS[metric][0]
+    # Three standard deviations of the recorded baseline; two percentage
+    # points for packet loss, which is mostly zero
+    size = (
+        2.0
+        if metric == "packet_loss"
+        else 3 * statistics.pstdev(row[field] for row in rows[:SHIFT_AT])
+    )
+    detector = _detector(FakeStore())
+    alarms = _replay(detector, _shifted(rows, field, size))
+    raised = [(hour, state) for hour, state in alarms if hour >= SHIFT_AT]
+
+    assert raised
+    hour, state = raised[0]
+    assert state.metric == metric
+    assert hour - SHIFT_AT < MAX_DELAY
+    shift_start = START + timedelta(hours=SHIFT_AT)
+    assert state.onset is not None
+    assert shift_start - MAX_EARLY_ONSET <= state.onset <= shift_start
+    assert state.shift is not None and state.shift > 0
+    # The persisting shift became the new baseline
+    assert len(rows) - hour > RELEARN_AFTER
+    assert detector.state.detected is False
+
+
+@pytest.mark.parametrize("trace", TRACES)
+def test_ended_shift_clears(trace: str) -> None:
+    """An alarm clears soon after the line returns to its baseline."""
+    rows = _load(trace)
+    ended = SHIFT_AT + 24
+    size = 3 * statistics.pstdev(row["ping_latency_ms"] for row in rows[:SHIFT_AT])
+    detector = _detector(FakeStore())
+    _replay(detector, _shifted(rows, "ping_latency_ms", size, ended)[:ended])
+    assert detector.state.detected
+
+    _replay(detector, rows[ended : ended + 12])
+    assert not detector.state.detected
+
+
+@pytest.mark.parametrize("split", [300, SHIFT_AT + 2])
+async def test_state_survives_restore(split: int) -> None:
+    """A restart, also in the middle of an excursion, changes nothing."""
+    rows = _shifted(_load("dsl"), "ping_latency_ms", 15.0)
+    expected = _replay(_detector(FakeStore()), rows)
+
+    store = FakeStore()
+    first = _detector(store)
+    alarms = _replay(first, rows[:split])
+    await first.async_flush()
+    restored = _detector(store)
+    await restored.async_load()
+
+    assert restored.state == first.state
+    assert restored.diagnostics() == first.diagnostics()
+    # Results up to the restart are not counted twice
+    assert not restored.update(rows[split - 1], START)
+    alarms += _replay(restored, rows[split:])
+    assert alarms == expected
@@ -0,0 +1,187 @@
+"""Tests for the Gonzales history import."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from pytest_homeassistant_custom_component.components.recorder.common import (
+    async_wait_recording_done,
+)
+from yarl import URL
+
+from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import (
+    async_import_statistics,
+    statistics_during_period,
+)
+from homeassistant.const import Platform, UnitOfDataRate
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
+
+from custom_components.gonzales.const import DOMAIN
+from custom_components.gonzales.coordinator import GonzalesCoordinator
+from custom_components.gonzales.history import IMPORT_CHUNK_HOURS, history_store
+
+from .conftest import Backend, history
+
+PAGE_SIZE = 50
+HOUR = timedelta(hours=1)
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(
+    recorder_mock: Recorder, enable_custom_integrations: None
+) -> None:
+    """Start the recorder before Home Assistant, then load the integration."""
+
+
+def _pages(backend: Backend) -> list[str]:
+    """Return the history pages requested."""
+    return [path for path in backend.paths() if path.startswith("/measurements?")]
+
+
+async def test_one_pass_seeds_profile_and_rolling(
+    coordinator: GonzalesCoordinator, backend: Backend
+) -> None:
+    """The first run reads the whole history once for every consumer."""
+    now = dt_util.utcnow()
+    backend.history = history(now - timedelta(minutes=30), 10 * 24)
+
+    with patch("custom_components.gonzales.history.HISTORY_PAGE_SIZE", PAGE_SIZE):
+        await coordinator.async_load_history()
+
+    pages = _pages(backend)
+    assert len(pages) == 5
+    assert all("start_date" not in page for page in pages)
+    numbers = sorted(page.rpartition("page=")[2].partition("&")[0] for page in pages)
+    assert numbers == ["1", "2", "3", "4", "5"]
+    assert coordinator.profile.diagnostics()["tests"] == 10 * 24
+    assert not coordinator.profile.diagnostics()["loading"]
+    # The day reaches back to the result a full day before the newest
+    assert coordinator.rolling.diagnostics()["window_results"] == {
+        "24h": 25,
+        "7d": 7 * 24,
+    }
+    assert coordinator.snapshot.rolling.download.p50_7d is not None
+
+
+async def test_restart_reads_from_the_oldest_need(
+    coordinator: GonzalesCoordinator, backend: Backend
+) -> None:
+    """After a restart the pass starts where the rolling window does."""
+    now = dt_util.utcnow()
+    backend.history = history(now - timedelta(minutes=30), 10 * 24)
+    for item in backend.history[: 8 * 24]:
+        coordinator.profile.load(item, dt_util.parse_datetime(item["timestamp"]))
+
+    with patch("custom_components.gonzales.history.HISTORY_PAGE_SIZE", PAGE_SIZE):
+        await coordinator.async_load_history()
+
+    pages = _pages(backend)
+    assert all("start_date=" in page for page in pages)
+    assert len(pages) == 4
+    assert coordinator.profile.diagnostics()["tests"] == 10 * 24
+    assert coordinator.rolling.diagnostics()["window_results"]["7d"] == 7 * 24
+
+
+async def test_live_results_wait_for_the_pass(
+    coordinator: GonzalesCoordinator, backend: Backend
+) -> None:
+    """A live result arriving first is added after the history."""
+    now = dt_util.utcnow()
+    backend.history = history(now - timedelta(hours=1), 48)
+    live = {**backend.history[-1], "id": 1000, "timestamp": now.isoformat()}
+    coordinator.profile.add(live, now)
+
+    await coordinator.async_load_history()
+
+    assert coordinator.profile.diagnostics()["tests"] == 49
+    assert coordinator.profile.newest == now.timestamp()
+
+
+async def _recorded_means(
+    hass: HomeAssistant, statistic_id: str, start: datetime
+) -> dict[datetime, float]:
+    """Return the hourly means the recorder holds from start on."""
+    rows = await hass.async_add_executor_job(
+        statistics_during_period,
+        hass,
+        start,
+        None,
+        {statistic_id},
+        "hour",
+        None,
+        {"mean"},
+    )
+    return {
+        dt_util.utc_from_timestamp(row["start"]): row["mean"]
+        for row in rows.get(statistic_id, [])
+    }
+
+
+async def test_import_keeps_recorded_hours_and_resumes(
+    hass: HomeAssistant,
+    coordinator: GonzalesCoordinator,
+    backend: Backend,
+) -> None:
+    """Chunks are checkpointed, recorded hours kept, failures resumed."""
+    entity_id = er.async_get(hass).async_get_or_create(
+        Platform.SENSOR,
+        DOMAIN,
+        f"{coordinator.config_entry.entry_id}_download_speed",
+    ).entity_id
+    current_hour = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+    hours = 2 * IMPORT_CHUNK_HOURS + 50
+    first = current_hour - hours * HOUR
+    backend.history = history(current_hour - HOUR / 2, hours)
+    # The sensor has been recording for the last day already
+    recorded = [first + (hours - offset) * HOUR for offset in range(24, 0, -1)]
+    async_import_statistics(
+        hass,
+        StatisticMetaData(
+            has_mean=True,
+            has_sum=False,
+            name=None,
+            source="recorder",
+            statistic_id=entity_id,
+            unit_of_measurement=UnitOfDataRate.MEGABITS_PER_SECOND,
+        ),
+        [StatisticData(start=start, mean=999.0) for start in recorded],
+    )
+    await async_wait_recording_done(hass)
+
+    # The backend fails after the first chunk was read
+    page = backend.handlers[("GET", "/measurements")]
+    fail_from = (IMPORT_CHUNK_HOURS + PAGE_SIZE) // PAGE_SIZE + 1
+    resume = first + IMPORT_CHUNK_HOURS * HOUR
+
+    def failing(request: Any) -> Any:
+        if int(request.query["page"]) >= fail_from:
+            return 500
+        return page(request)
+
+    backend.handlers[("GET", "/measurements")] = failing
+    with patch("custom_components.gonzales.history.HISTORY_PAGE_SIZE", PAGE_SIZE):
+        assert await coordinator.history.async_run() == 0
+        await async_wait_recording_done(hass)
+        assert coordinator.history.imported_hours == IMPORT_CHUNK_HOURS
+        store = history_store(hass, coordinator.config_entry.entry_id)
+        assert await store.async_load() == {"cursor": resume.isoformat()}
+
+        backend.handlers[("GET", "/measurements")] = page
+        backend.requests.clear()
+        assert await coordinator.history.async_run() == hours - IMPORT_CHUNK_HOURS - 24
+        await async_wait_recording_done(hass)
+
+    assert {URL(path).query["start_date"] for path in _pages(backend)} == {
+        resume.isoformat()
+    }
+    means = await _recorded_means(hass, entity_id, first)
+    assert sorted(means) == [first + offset * HOUR for offset in range(hours)]
+    assert all(means[start] == 999.0 for start in recorded)
+    for index, item in enumerate(backend.history[: hours - 24]):
+        assert means[first + index * HOUR] == item["download_mbps"]
@@ -0,0 +1,138 @@
+"""Tests for the Gonzales event stream."""
+from __future__ import annotations
+
+import asyncio
+import json
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import patch
+
+from aiohttp import web
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.gonzales import push
+from custom_components.gonzales.coordinator import GonzalesCoordinator
+from custom_components.gonzales.push import GonzalesEventStream
+
+from .conftest import API, MEASUREMENT, Backend, subscribe
+
+NEW_MEASUREMENT = {**MEASUREMENT, "id": 43, "timestamp": "2024-12-02T11:00:00+00:00"}
+
+
+def _events(
+    backend: Backend,
+    *events: tuple[str, Any],
+    hold: asyncio.Event | None = None,
+) -> None:
+    """Serve an event stream sending events, then held open or closed."""
+
+    async def handle(request: web.Request) -> web.StreamResponse:
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+        await response.write(b": heartbeat\n\n")
+        for event, payload in events:
+            await response.write(
+                f"event: {event}\ndata: {json.dumps(payload)}\n\n".encode()
+            )
+        if hold is not None:
+            await hold.wait()
+        return response
+
+    backend.handlers[("GET", "/events")] = handle
+
+
+async def _reconnect_delays(
+    coordinator: GonzalesCoordinator, backend: Backend, reconnects: int
+) -> tuple[GonzalesEventStream, list[float]]:
+    """Run a stream until it has waited to reconnect a number of times."""
+    delays: list[float] = []
+
+    async def sleep(delay: float) -> None:
+        delays.append(delay)
+        if len(delays) == reconnects:
+            raise asyncio.CancelledError
+
+    stream = GonzalesEventStream(
+        coordinator.client.session,
+        f"http://127.0.0.1:{backend.port}{API}/events",
+        {},
+        lambda event, payload: None,
+        lambda connected: None,
+    )
+    with (
+        patch.object(push, "asyncio", SimpleNamespace(sleep=sleep)),
+        patch.object(push.random, "uniform", return_value=1.0),
+    ):
+        try:
+            await stream.async_run()
+        except asyncio.CancelledError:
+            pass
+    return stream, delays
+
+
+async def test_pushed_measurement_is_published(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    coordinator: GonzalesCoordinator,
+    backend: Backend,
+) -> None:
+    """A measurement event updates the snapshot without a poll."""
+    subscribe(coordinator)
+    await coordinator.async_refresh()
+    published = asyncio.Event()
+    coordinator.async_add_listener(published.set, ("measurement",))
+    hold = asyncio.Event()
+    _events(backend, ("measurement", NEW_MEASUREMENT), hold=hold)
+    backend.handlers[("GET", "/measurements/latest")] = NEW_MEASUREMENT
+
+    coordinator.async_start_push()
+    async with asyncio.timeout(5):
+        await published.wait()
+
+    assert coordinator.push_connected
+    assert coordinator.data["measurement"]["id"] == 43
+    assert coordinator.push_diagnostics()["events_received"] == 1
+
+    for task in config_entry._background_tasks:
+        task.cancel()
+    hold.set()
+    await hass.async_block_till_done()
+    assert not coordinator.push_connected
+
+
+async def test_empty_streams_keep_backing_off(
+    coordinator: GonzalesCoordinator, backend: Backend
+) -> None:
+    """A stream closing right after HTTP 200 does not reset the backoff."""
+    _events(backend)
+
+    stream, delays = await _reconnect_delays(coordinator, backend, 4)
+
+    assert delays == [1, 2, 4, 8]
+    assert stream.supported
+    assert not stream.connected
+
+
+async def test_events_reset_the_backoff(
+    coordinator: GonzalesCoordinator, backend: Backend
+) -> None:
+    """A stream that delivered events is reconnected quickly."""
+    _events(backend, ("status", {"version": "3.9.0"}))
+
+    stream, delays = await _reconnect_delays(coordinator, backend, 3)
+
+    assert delays == [1, 1, 1]
+    assert stream.events_received == 3
+
+
+async def test_missing_stream_stops_for_good(
+    coordinator: GonzalesCoordinator, backend: Backend
+) -> None:
+    """A backend without the event stream is left to polling."""
+    stream, delays = await _reconnect_delays(coordinator, backend, 1)
+
+    assert delays == []
+    assert stream.supported is False
+    assert backend.paths() == ["/events"]
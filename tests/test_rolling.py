@@ -0,0 +1,151 @@
+"""Tests for the Gonzales rolling statistics."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import math
+import random
+from unittest.mock import patch
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.gonzales.coordinator import GonzalesCoordinator
+from custom_components.gonzales.rolling import (
+    CAPACITY,
+    WINDOWS,
+    RollingStats,
+    _WindowHistogram,
+)
+from custom_components.gonzales.sensor import (
+    MAIN_SENSORS,
+    ROLLING_SENSORS,
+    GonzalesSensor,
+)
+
+from .conftest import MEASUREMENT, Backend
+
+
+def _start() -> datetime:
+    """Return 22:00 local time, two hours before midnight."""
+    return datetime(2024, 12, 2, 22, 0, tzinfo=dt_util.get_default_time_zone())
+
+
+def _stats(*offsets: timedelta) -> RollingStats:
+    """Return statistics holding one result at each offset from _start()."""
+    stats = RollingStats()
+    for offset in offsets:
+        stats.add({"download_mbps": 100.0}, _start() + offset)
+    return stats
+
+
+def test_expire_without_new_results() -> None:
+    """Results leave the 24 h window as time passes, not only on new ones."""
+    stats = _stats(timedelta(0), timedelta(hours=1))
+    assert stats.summary.download.p50_24h is not None
+
+    stats.expire(_start() + timedelta(hours=23))
+    assert stats.diagnostics()["window_results"]["24h"] == 2
+    assert stats.expire(_start() + timedelta(hours=24, minutes=30))
+    assert stats.diagnostics()["window_results"]["24h"] == 1
+    assert stats.expire(_start() + timedelta(hours=25, minutes=30))
+    assert stats.summary.download.p50_24h is None
+    assert stats.summary.download.p50_7d is not None
+
+
+def test_today_resets_at_midnight() -> None:
+    """Today's aggregates restart at local midnight."""
+    stats = _stats(timedelta(0))
+    assert stats.summary.download.today_count == 1
+
+    assert not stats.expire(_start() + timedelta(hours=1, minutes=59))
+    assert stats.expire(_start() + timedelta(hours=2))
+    assert stats.summary.download.today_count == 0
+    assert stats.summary.download.today_avg is None
+
+    # Measured before midnight but added after it: not part of today
+    stats.add({"download_mbps": 50.0}, _start() + timedelta(hours=1, minutes=30))
+    assert stats.summary.download.today_count == 0
+
+
+def _exact(values: list[float], rank: int) -> float:
+    """Return the nearest-rank percentile of values."""
+    ordered = sorted(values)
+    return ordered[max(1, math.ceil(rank / 100 * len(ordered))) - 1]
+
+
+def test_percentiles_over_a_wrapping_stream() -> None:
+    """Incremental percentiles match a recount after the buffer wraps.
+
+    A result a minute keeps 1440 results in the day, which expire by
+    time, and more than CAPACITY in the week, which is cut by the
+    buffer. Every result is counted in and out of a histogram at most
+    once per window, and percentiles are only computed when read.
+    """
+    rng = random.Random(23)
+    stats = RollingStats()
+    start = _start()
+    times: list[float] = []
+    values: list[float] = []
+    counted = {"add": 0, "remove": 0, "percentiles": 0}
+    add, remove, percentiles = (
+        _WindowHistogram.add,
+        _WindowHistogram.remove,
+        _WindowHistogram.percentiles,
+    )
+
+    def counting(name, method):
+        def wrapper(self, *args):
+            counted[name] += 1
+            return method(self, *args)
+
+        return wrapper
+
+    with (
+        patch.object(_WindowHistogram, "add", counting("add", add)),
+        patch.object(_WindowHistogram, "remove", counting("remove", remove)),
+        patch.object(
+            _WindowHistogram, "percentiles", counting("percentiles", percentiles)
+        ),
+    ):
+        for minute in range(3 * CAPACITY):
+            measured = start + timedelta(minutes=minute)
+            value = rng.lognormvariate(math.log(200), 0.3)
+            assert stats.add({"download_mbps": value}, measured)
+            times.append(measured.timestamp())
+            values.append(value)
+        assert counted["percentiles"] == 0
+        assert counted["add"] == 3 * CAPACITY * len(WINDOWS)
+        assert counted["remove"] <= counted["add"]
+
+    newest = times[-1]
+    day = [v for t, v in zip(times, values) if t >= newest - WINDOWS["24h"]]
+    week = values[-CAPACITY:]
+    assert stats.diagnostics()["window_results"] == {"24h": len(day), "7d": CAPACITY}
+    summary = stats.summary.download
+    for reported, expected in (
+        (summary.p5_24h, _exact(day, 5)),
+        (summary.p50_24h, _exact(day, 50)),
+        (summary.p95_24h, _exact(day, 95)),
+        (summary.p50_7d, _exact(week, 50)),
+    ):
+        # Within the histogram bin, rounded to two decimals
+        assert math.isclose(reported, expected, rel_tol=0.011, abs_tol=0.01)
+
+
+async def test_expiry_writes_only_rolling_sensors(
+    coordinator: GonzalesCoordinator, backend: Backend
+) -> None:
+    """Expired results update the rolling sensors, not the measurement."""
+    download = GonzalesSensor(coordinator, MAIN_SENSORS[0])
+    median = GonzalesSensor(coordinator, ROLLING_SENSORS[1])
+
+    await coordinator.async_refresh()
+    assert {"measurement", "rolling", "profile"} <= coordinator.changed_sections
+    assert download._sections_changed()
+    assert median._sections_changed()
+
+    measured = dt_util.parse_datetime(MEASUREMENT["timestamp"])
+    coordinator.async_expire_rolling(measured + timedelta(days=1, minutes=1))
+    assert coordinator.changed_sections == {"rolling"}
+    assert not download._sections_changed()
+    assert median._sections_changed()
+    assert coordinator.snapshot.rolling.download.p50_24h is None
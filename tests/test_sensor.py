@@ -0,0 +1,181 @@
+"""Tests for the Gonzales sensors."""
+from __future__ import annotations
+
+import random
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.gonzales.sensor import (
+    GonzalesSensor,
+    GonzalesSensorEntityDescription,
+)
+
+ABSOLUTE = GonzalesSensorEntityDescription(
+    key="absolute",
+    section="measurement",
+    deadband=2,
+    max_silence=600,
+    value_fn=lambda s: s.value,
+)
+NOISY = GonzalesSensorEntityDescription(
+    key="noisy",
+    section="measurement",
+    deadband=2,
+    max_silence=3600,
+    value_fn=lambda s: s.value,
+)
+PERCENT = GonzalesSensorEntityDescription(
+    key="percent",
+    section="measurement",
+    deadband_pct=1,
+    value_fn=lambda s: s.value,
+)
+
+
+class FakeCoordinator(SimpleNamespace):
+    """Coordinator publishing a single measurement value."""
+
+    def __init__(self, value: Any) -> None:
+        """Initialize with fresh data."""
+        super().__init__(
+            config_entry=SimpleNamespace(entry_id="entry"),
+            snapshot=SimpleNamespace(value=value),
+            changed_sections=frozenset(),
+            available=True,
+        )
+
+    def section_available(self, section: str) -> bool:
+        """Return the availability of every section."""
+        return self.available
+
+    def section_stale(self, section: str) -> bool:
+        """Return False: the data is never stale here."""
+        return False
+
+
+class Harness:
+    """Feed values to a sensor and record the states it writes."""
+
+    def __init__(self, description: GonzalesSensorEntityDescription) -> None:
+        """Set up the sensor and publish the first value."""
+        self.coordinator = FakeCoordinator(100.0)
+        self.sensor = GonzalesSensor(self.coordinator, description)
+        self.written: list[Any] = []
+        self.sensor.async_write_ha_state = MagicMock(
+            side_effect=lambda: self.written.append(
+                self.sensor.native_value if self.sensor.available else "unavailable"
+            )
+        )
+        self.update(100.0)
+
+    def update(self, value: Any) -> None:
+        """Publish a new measurement value."""
+        self.coordinator.snapshot = SimpleNamespace(value=value)
+        self.coordinator.changed_sections = frozenset({"measurement"})
+        self.sensor._handle_coordinator_update()
+
+
+def test_change_within_deadband_is_held() -> None:
+    """Small moves keep the published value and write nothing."""
+    harness = Harness(ABSOLUTE)
+    harness.update(101.0)
+    harness.update(98.5)
+
+    assert harness.written == [100.0]
+    assert harness.sensor.native_value == 100.0
+
+
+def test_change_across_deadband_is_published() -> None:
+    """A move of at least the deadband is written at once."""
+    harness = Harness(ABSOLUTE)
+    harness.update(101.0)
+    harness.update(102.0)
+    harness.update(103.5)
+
+    assert harness.written == [100.0, 102.0]
+    assert harness.sensor.native_value == 102.0
+
+
+def test_percent_deadband_follows_published_value() -> None:
+    """The relative band is measured from the published value."""
+    harness = Harness(PERCENT)
+    harness.update(100.9)
+    harness.update(101.0)
+    harness.update(101.5)
+
+    assert harness.written == [100.0, 101.0]
+
+
+def test_held_value_is_published_after_max_silence() -> None:
+    """A held value is written once max_silence has passed."""
+    with patch("custom_components.gonzales.sensor.time.monotonic") as monotonic:
+        monotonic.return_value = 1000.0
+        harness = Harness(ABSOLUTE)
+        monotonic.return_value = 1599.0
+        harness.update(101.0)
+        monotonic.return_value = 1600.0
+        harness.update(101.5)
+
+    assert harness.written == [100.0, 101.5]
+
+
+@pytest.mark.parametrize("missing", [None, "n/a"])
+def test_transition_to_and_from_missing_value_is_published(missing: Any) -> None:
+    """Values appearing or disappearing are always written."""
+    harness = Harness(ABSOLUTE)
+    harness.update(missing)
+    harness.update(100.0)
+
+    assert harness.written == [100.0, missing, 100.0]
+
+
+def test_unavailable_transitions_are_published() -> None:
+    """Losing and regaining the section is written regardless of the band."""
+    harness = Harness(ABSOLUTE)
+    harness.coordinator.available = False
+    harness.update(100.5)
+    harness.coordinator.available = True
+    harness.update(101.0)
+
+    assert harness.written == [100.0, "unavailable", 100.0]
+
+
+def test_noisy_series_writes_less_and_keeps_steps() -> None:
+    """Noise is held back, while every real step is published in time.
+
+    One value a minute for two weeks: Gaussian noise well inside the
+    deadband around a level that steps by more than it every few hours.
+    """
+    rng = random.Random(21)
+    samples = 14 * 24 * 60
+    level = 100.0
+    steps: list[tuple[int, float]] = []
+    writes: list[tuple[int, Any]] = []
+    with patch("custom_components.gonzales.sensor.time.monotonic") as monotonic:
+        monotonic.return_value = 0.0
+        harness = Harness(NOISY)
+        for minute in range(1, samples):
+            if rng.random() < 1 / 240:
+                level += rng.choice((-1, 1)) * rng.uniform(3, 20)
+                steps.append((minute, level))
+            monotonic.return_value = minute * 60.0
+            written = len(harness.written)
+            harness.update(level + rng.gauss(0, 0.4))
+            if len(harness.written) > written:
+                writes.append((minute, harness.written[-1]))
+
+    assert len(steps) > 50
+    # Writes follow the steps and the max_silence heartbeat, not the noise
+    assert len(writes) < samples / 20
+    silence = NOISY.max_silence // 60
+    for (minute, stepped), following in zip(steps, steps[1:] + [(samples, None)]):
+        # Published at once, and within max_silence at the latest
+        first = next(
+            (at for at, value in writes if at >= minute and abs(value - stepped) < 2),
+            None,
+        )
+        assert first is not None
+        assert first - minute <= min(silence, following[0] - minute)
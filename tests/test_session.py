@@ -0,0 +1,84 @@
+"""Tests for the Gonzales backend session."""
+from __future__ import annotations
+
+import importlib
+from ipaddress import IPv4Address
+import socket
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from aiohasupervisor import SupervisorError
+import pytest
+
+from custom_components.gonzales.session import ConnectionStats, GonzalesResolver
+
+HOST = "local-gonzales"
+
+
+def _resolver(*components: str) -> GonzalesResolver:
+    """Return a resolver whose DNS lookups fail."""
+    hass = SimpleNamespace(config=SimpleNamespace(components=set(components)))
+    with patch(
+        "custom_components.gonzales.session.DefaultResolver",
+        return_value=MagicMock(
+            resolve=AsyncMock(side_effect=OSError("DNS unavailable"))
+        ),
+    ):
+        return GonzalesResolver(hass, HOST, ConnectionStats())
+
+
+def _supervisor(addon_info: AsyncMock) -> MagicMock:
+    """Return a Supervisor client answering add-on info requests."""
+    return MagicMock(addons=MagicMock(addon_info=addon_info))
+
+
+@pytest.mark.parametrize(
+    "module",
+    ["", ".binary_sensor", ".button", ".config_flow", ".diagnostics", ".sensor"],
+)
+def test_integration_imports(module: str) -> None:
+    """The integration loads on the minimum supported Home Assistant."""
+    importlib.import_module(f"custom_components.gonzales{module}")
+
+
+async def test_dns_failure_without_supervisor() -> None:
+    """Without a Supervisor the DNS error is raised."""
+    with pytest.raises(OSError):
+        await _resolver().resolve(HOST, 8470)
+
+
+async def test_dns_failure_uses_addon_address() -> None:
+    """The Supervisor's add-on address stands in for failed DNS."""
+    addon_info = AsyncMock(
+        return_value=SimpleNamespace(ip_address=IPv4Address("172.30.33.5"))
+    )
+    resolver = _resolver("hassio")
+    with patch(
+        "homeassistant.components.hassio.get_supervisor_client",
+        return_value=_supervisor(addon_info),
+    ):
+        result = await resolver.resolve(HOST, 8470)
+    addon_info.assert_awaited_once_with("local_gonzales")
+    assert result == [
+        {
+            "hostname": HOST,
+            "host": "172.30.33.5",
+            "port": 8470,
+            "family": socket.AF_INET,
+            "proto": 0,
+            "flags": socket.AI_NUMERICHOST,
+        }
+    ]
+
+
+async def test_supervisor_error_keeps_dns_error() -> None:
+    """A failing Supervisor lookup leaves the DNS error in place."""
+    addon_info = AsyncMock(side_effect=SupervisorError("not found"))
+    with (
+        patch(
+            "homeassistant.components.hassio.get_supervisor_client",
+            return_value=_supervisor(addon_info),
+        ),
+        pytest.raises(OSError),
+    ):
+        await _resolver("hassio").resolve(HOST, 8470)
@@ -0,0 +1,141 @@
+"""Tests for the aggregated snapshot endpoint."""
+from __future__ import annotations
+
+from typing import Any
+
+from aiohttp import web
+
+from custom_components.gonzales.coordinator import GonzalesCoordinator
+
+from .conftest import (
+    ISP_SCORE,
+    MEASUREMENT,
+    ROOT_CAUSE,
+    SMART_SCHEDULER,
+    Backend,
+    subscribe,
+)
+
+DERIVED = "isp_score,smart_scheduler,root_cause"
+SECTIONS = {
+    "measurement": MEASUREMENT,
+    "isp_score": ISP_SCORE,
+    "smart_scheduler": SMART_SCHEDULER,
+    "root_cause": ROOT_CAUSE,
+}
+
+
+def _snapshot(backend: Backend, *left_out: str) -> None:
+    """Advertise the snapshot endpoint, leaving some sections out."""
+    backend.status["features"] = ["snapshot"]
+
+    def handle(request: web.Request) -> dict[str, Any]:
+        return {
+            key: backend.status if key == "status" else SECTIONS[key]
+            for key in request.query["sections"].split(",")
+            if key not in left_out
+        }
+
+    backend.handlers[("GET", "/snapshot")] = handle
+
+
+async def _refresh(coordinator: GonzalesCoordinator, backend: Backend) -> list[str]:
+    """Run a cycle with every section due; return the paths requested."""
+    backend.requests.clear()
+    coordinator._next_due.clear()
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success
+    return backend.paths()
+
+
+def _assert_sections(coordinator: GonzalesCoordinator) -> None:
+    """Assert every section holds the backend's payload."""
+    data = coordinator.data
+    assert data["measurement"]["download_mbps"] == MEASUREMENT["download_mbps"]
+    assert data["status"]["version"] == "3.9.0"
+    assert data["isp_score"]["grade"] == "B+"
+    assert data["smart_scheduler"]["stability_score"] == 91.0
+    assert data["root_cause"]["network_health_score"] == 93.0
+    assert not any(coordinator.endpoint_errors.values())
+
+
+async def test_snapshot_replaces_section_requests(
+    coordinator: GonzalesCoordinator, backend: Backend
+) -> None:
+    """A backend advertising the snapshot gets one request per round."""
+    _snapshot(backend)
+    subscribe(coordinator)
+
+    # The status that advertises the snapshot is only known after round one
+    paths = await _refresh(coordinator, backend)
+    assert sorted(paths[:2]) == ["/measurements/latest", "/status"]
+    assert paths[2:] == [f"/snapshot?sections={DERIVED}"]
+    _assert_sections(coordinator)
+
+    paths = await _refresh(coordinator, backend)
+    assert paths == [
+        "/snapshot?sections=measurement,status",
+        f"/snapshot?sections={DERIVED}",
+    ]
+    _assert_sections(coordinator)
+    assert coordinator.snapshot_diagnostics()["requests"] == 3
+
+
+async def test_snapshot_missing_sections_are_fetched(
+    coordinator: GonzalesCoordinator, backend: Backend
+) -> None:
+    """Sections the snapshot leaves out come from their own endpoints."""
+    _snapshot(backend, "smart_scheduler", "root_cause")
+    subscribe(coordinator)
+
+    paths = await _refresh(coordinator, backend)
+    assert paths[2] == f"/snapshot?sections={DERIVED}"
+    assert sorted(paths[3:]) == [
+        "/root-cause/analysis?days=7",
+        "/smart-scheduler/status",
+    ]
+    _assert_sections(coordinator)
+    assert coordinator.snapshot_diagnostics()["sections_missing"] == 2
+
+
+async def test_snapshot_not_found_falls_back_for_good(
+    coordinator: GonzalesCoordinator, backend: Backend
+) -> None:
+    """A 404 switches to per-endpoint requests until the version changes."""
+    _snapshot(backend)
+    backend.handlers[("GET", "/snapshot")] = 404
+    subscribe(coordinator)
+
+    paths = await _refresh(coordinator, backend)
+    assert paths[2] == f"/snapshot?sections={DERIVED}"
+    assert sorted(paths[3:]) == [
+        "/root-cause/analysis?days=7",
+        "/smart-scheduler/status",
+        "/statistics/enhanced",
+    ]
+    _assert_sections(coordinator)
+
+    paths = await _refresh(coordinator, backend)
+    assert "/snapshot" not in {path.partition("?")[0] for path in paths}
+    assert len(paths) == 5
+    _assert_sections(coordinator)
+    assert not coordinator.snapshot_diagnostics()["supported"]
+
+
+async def test_without_snapshot_feature(
+    coordinator: GonzalesCoordinator, backend: Backend
+) -> None:
+    """Without the feature every section is requested on its own."""
+    subscribe(coordinator)
+
+    for _ in range(2):
+        paths = await _refresh(coordinator, backend)
+        assert sorted(paths) == [
+            "/measurements/latest",
+            "/root-cause/analysis?days=7",
+            "/smart-scheduler/status",
+            "/statistics/enhanced",
+            "/status",
+        ]
+        _assert_sections(coordinator)
+    assert coordinator.snapshot_diagnostics()["requests"] == 0
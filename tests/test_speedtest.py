@@ -0,0 +1,75 @@
+"""Tests for following a triggered speed test."""
+from __future__ import annotations
+
+from datetime import timedelta
+
+from aiohttp import web
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.gonzales.coordinator import (
+    FAST_POLL_INTERVAL,
+    GonzalesCoordinator,
+)
+
+from .conftest import MEASUREMENT, STATUS, Backend, subscribe
+
+FAST = timedelta(seconds=FAST_POLL_INTERVAL)
+NEW_MEASUREMENT = {**MEASUREMENT, "id": 43, "timestamp": "2024-12-02T11:00:00+00:00"}
+
+
+async def _trigger(
+    hass: HomeAssistant, coordinator: GonzalesCoordinator, backend: Backend
+) -> None:
+    """Trigger a test the backend reports running; fast polling starts."""
+    subscribe(coordinator)
+    await coordinator.async_refresh()
+    backend.handlers[("POST", "/speedtest/trigger")] = lambda request: (
+        web.json_response({"status": "started"}, status=202)
+    )
+    backend.status["scheduler"] = {"running": True, "test_in_progress": True}
+    backend.requests.clear()
+
+    assert await coordinator.async_trigger_speedtest() == {"status": "started"}
+    await hass.async_block_till_done()
+
+    assert backend.paths() == ["/speedtest/trigger", "/status"]
+    assert coordinator.update_interval == FAST
+
+
+async def test_triggered_test_is_followed(
+    hass: HomeAssistant, coordinator: GonzalesCoordinator, backend: Backend
+) -> None:
+    """Only /status is polled while the test runs, then the result is fetched."""
+    await _trigger(hass, coordinator, backend)
+
+    backend.requests.clear()
+    await coordinator.async_refresh()
+    assert backend.paths() == ["/status"]
+    assert coordinator.update_interval == FAST
+
+    backend.status = dict(STATUS)
+    backend.handlers[("GET", "/measurements/latest")] = NEW_MEASUREMENT
+    backend.requests.clear()
+    await coordinator.async_refresh()
+
+    assert backend.paths()[:2] == ["/status", "/measurements/latest"]
+    assert coordinator.data["measurement"]["id"] == 43
+    assert coordinator.last_update_success
+    assert coordinator.update_interval != FAST
+
+
+async def test_status_failure_ends_fast_poll(
+    hass: HomeAssistant, coordinator: GonzalesCoordinator, backend: Backend
+) -> None:
+    """A failed /status poll does not keep the last 'running' status polling."""
+    await _trigger(hass, coordinator, backend)
+
+    backend.handlers[("GET", "/status")] = 500
+    backend.handlers[("GET", "/measurements/latest")] = 500
+    backend.requests.clear()
+    await coordinator.async_refresh()
+
+    assert "/measurements/latest" in backend.paths()
+    assert not coordinator.last_update_success
+    assert coordinator.update_interval != FAST